@@ -1,8 +1,12 @@
 from .coevo_state import CoEvoState
 from .coevo_interface import CoEvoInterface
 from .coevo_method import CoEvoMethod
+from .embedding_cache import EmbeddingCache
 from .eoh_interface import CoEvoEoHInterface
+from .eval_cache import EvaluationCache
+from .eval_store import SQLiteEvaluationStore
 from .nds import nds_select
+from .process_evaluator import ProcessPoolEvaluator
 from .summarizer import CoEvoSummarizer
 
 __all__ = [
@@ -10,6 +14,10 @@ __all__ = [
     "CoEvoInterface",
     "CoEvoMethod",
     "CoEvoEoHInterface",
+    "EmbeddingCache",
+    "EvaluationCache",
+    "SQLiteEvaluationStore",
     "nds_select",
+    "ProcessPoolEvaluator",
     "CoEvoSummarizer",
 ]
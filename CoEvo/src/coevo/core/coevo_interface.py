@@ -144,7 +144,7 @@ class CoEvoInterface(MethodInterface):
                 else:
                     inspiration_pattern = re.compile(
                         r"(?:quote|Quote|QUOTE)[sS]?\s*:?\s*(.*?)\s*\n.*?"
-                        r"(?:implication|Implication|IMPLICATION)\s*:?\s*(.*?)\s*\n.*?"
+                        r"(?:implication|Implication|IMPLICATION)[sS]?\s*:?\s*(.*?)\s*\n.*?"
                         r"(?:name|Name|NAME)\s*:?\s*(.*?)\s*\n.*?"
                         r"(?:reasoning|Reasoning|REASONING|reason|Reason|REASON)[sS]?\s*:?\s*(.*?)\s*\n.*?"
                         r"(?:definition|Definition|DEFINITION)[sS]?\s*:?\s*(.*?)(?=\n|$)",
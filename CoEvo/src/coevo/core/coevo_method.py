@@ -6,16 +6,23 @@ PopulationMethod lifecycle.
 
 from __future__ import annotations
 
+import concurrent.futures
+import math
+import threading
 import time
 from typing import TYPE_CHECKING
 
-from evotoolkit.core import PopulationMethod, Solution
+from evotoolkit.core import EvaluationResult, PopulationMethod, Solution
 
+from ..utils.retry import FORMAT, PERMANENT, RetryPolicy, classify_failure
 from .coevo_interface import CoEvoInterface
 from .coevo_state import CoEvoState
+from .eval_cache import copy_evaluation_result, is_transient, normalized_code_hash
 from .nds import nds_select
 
 if TYPE_CHECKING:
+    from .eval_cache import EvaluationCache
+    from .eval_store import SQLiteEvaluationStore
     from .summarizer import CoEvoSummarizer
 
 
@@ -27,7 +34,7 @@ class CoEvoMethod(PopulationMethod):
     interface:
         CoEvoInterface connecting the task and this method.
     running_llm:
-        evotoolkit HttpsApi instance.
+        evotoolkit HttpsApi or ``coevo.utils.llm_pool.PooledLLM`` instance.
     output_path:
         Directory for checkpoints and history.
     verbose:
@@ -48,6 +55,51 @@ class CoEvoMethod(PopulationMethod):
         Enable the summarization mechanism.
     summarizer:
         A CoEvoSummarizer instance (required when use_summarizer=True).
+    num_workers:
+        Number of chains generated concurrently within a generation.  Parent
+        chains are selected up front from a snapshot of the population and
+        finished chains are registered in submission order, so the result is
+        independent of completion order.  Default 1 runs chains sequentially.
+    steady_state:
+        Replace the generation barrier with a steady-state scheduler that
+        keeps ``num_workers`` chains in flight.  Each new chain draws parents
+        from the live population and every finished chain is inserted into the
+        population immediately.  ``generation`` then only counts checkpoints
+        (one per ``num_workers`` finished chains).
+    max_chains:
+        Steady-state stop criterion: total number of chains, including the
+        initial population.
+    max_samples:
+        Steady-state stop criterion: total ``sample_count``.  At least one of
+        ``max_chains`` / ``max_samples`` is required when ``steady_state`` is
+        set; ``max_generations`` is ignored in that mode.
+    speculative_continue:
+        Issue all continue-reasoning layers of a chain in parallel and replay
+        the early-stop rules afterwards.  Trades extra LLM calls (layers past
+        an early stop are discarded) for one round-trip per chain.
+    retry_policy:
+        Retry budget and backoff for LLM calls in ``_prompt_parse_evaluate``.
+        Defaults to ``RetryPolicy()`` (3 retries, jittered exponential backoff
+        for transport and throttling failures, honouring ``Retry-After``).
+    eval_cache:
+        Optional EvaluationCache consulted before ``task.evaluate``, keyed on
+        the AST-normalised hash of ``sol_string``.
+    eval_store:
+        Optional SQLiteEvaluationStore behind ``eval_cache`` that persists
+        results across runs on the same task and dataset file.
+    evaluator:
+        Optional object with an ``evaluate(solution)`` method used instead of
+        ``task.evaluate``, e.g. a ProcessPoolEvaluator for sandboxed,
+        time- and memory-limited evaluation.
+    fingerprint_cache:
+        Optional EvaluationCache keyed on ``task.fingerprint`` (FittingTask).
+        A candidate that behaves like an earlier one on the fingerprint probe
+        reuses that candidate's result if its fitted params give the
+        candidate the same MSE on the full dataset; otherwise it is fitted,
+        starting from those params (the ``fingerprint_start`` hint).
+        Fingerprinting runs the candidate in this process, so it is skipped
+        when an ``evaluator`` sandboxes evaluation, and for code the
+        pre-screen flags as non-vectorised.
     """
 
     algorithm_name = "coevo"
@@ -68,7 +120,20 @@ class CoEvoMethod(PopulationMethod):
         use_nds: bool = True,
         use_summarizer: bool = False,
         summarizer: CoEvoSummarizer | None = None,
+        num_workers: int = 1,
+        steady_state: bool = False,
+        max_chains: int | None = None,
+        max_samples: int | None = None,
+        speculative_continue: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        eval_cache: EvaluationCache | None = None,
+        eval_store: SQLiteEvaluationStore | None = None,
+        evaluator=None,
+        fingerprint_cache: EvaluationCache | None = None,
     ) -> None:
+        if steady_state and max_chains is None and max_samples is None:
+            raise ValueError("steady_state requires max_chains or max_samples")
+
         super().__init__(
             interface=interface,
             output_path=output_path,
@@ -82,6 +147,18 @@ class CoEvoMethod(PopulationMethod):
         self.use_nds = use_nds
         self.use_summarizer = use_summarizer
         self.summarizer: CoEvoSummarizer | None = summarizer
+        self.num_workers = max(1, num_workers)
+        self.steady_state = steady_state
+        self.max_chains = max_chains
+        self.max_samples = max_samples
+        self.speculative_continue = speculative_continue
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.eval_cache = eval_cache
+        self.eval_store = eval_store
+        self.evaluator = evaluator if evaluator is not None else self.task
+        self.fingerprint_cache = fingerprint_cache
+        self.fingerprint_reuses = 0
+        self.prescreen_rejections = 0
 
         self._generate_sol_modes = [
             "crossover_positive",
@@ -90,6 +167,12 @@ class CoEvoMethod(PopulationMethod):
             "mutation_negative",
         ]
 
+        # Steady-state scheduler: in-flight chains outlive a single step_iteration
+        self._state_lock = threading.RLock()
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._in_flight: list[concurrent.futures.Future] = []
+        self._steady_job_index = 0
+
     # ------------------------------------------------------------------
     # evotoolkit lifecycle
     # ------------------------------------------------------------------
@@ -98,10 +181,9 @@ class CoEvoMethod(PopulationMethod):
         """Generate the initial population (generation 0)."""
         self.verbose_gen(f" Gen 0 ")
         # Create 2 * pop_size chains then trim — same as original _init_population
-        for _ in range(2):
-            for _ in range(self.pop_size):
-                chain = self._init_a_sol()
-                self._register_chain(chain)
+        jobs = [("init", None)] * (2 * self.pop_size)
+        for chain in self._run_chain_jobs(jobs):
+            self._register_chain(chain)
 
         # Pad if we somehow have fewer than pop_size valid chains
         while len(self.state.population) < self.pop_size:
@@ -116,17 +198,19 @@ class CoEvoMethod(PopulationMethod):
         gen = self.state.generation
         self.verbose_gen(f" Gen {gen} ")
 
-        new_chains: list[list[Solution]] = []
-
-        # New initializations
-        for _ in range(self.num_init_per_gen):
-            new_chains.append(self._init_a_sol())
+        if self.steady_state:
+            self._steady_state_step()
+            self._print_population()
+            self.state.generation += 1
+            return
 
-        # 4 offspring modes
+        # New initializations, then the 4 offspring modes.  Parents are chosen
+        # here so every job sees the same population snapshot.
+        jobs: list[tuple[str, list[list[Solution]] | None]] = [("init", None)] * self.num_init_per_gen
         for mode in self._generate_sol_modes:
-            new_chains.append(self._generate_offspring(mode))
+            jobs.append((mode, self._select_parent_chains(self._num_parents(mode))))
 
-        for chain in new_chains:
+        for chain in self._run_chain_jobs(jobs):
             self._register_chain(chain)
 
         self._manage_population()
@@ -134,12 +218,112 @@ class CoEvoMethod(PopulationMethod):
         self.state.generation += 1
 
     def should_stop_iteration(self) -> bool:
+        if self.steady_state:
+            if self.max_chains is not None and self.state.next_chain_id >= self.max_chains:
+                return True
+            return self.max_samples is not None and self.state.sample_count >= self.max_samples
         return self.state.generation >= self.max_generations
 
+    def _persist_runtime(self) -> None:
+        # Steady-state workers keep running (and recording usage) across checkpoints
+        with self._state_lock:
+            super()._persist_runtime()
+
+    def _record_generation_usage(self, usage: dict) -> None:
+        with self._state_lock:
+            super()._record_generation_usage(usage)
+
+    # ------------------------------------------------------------------
+    # Steady-state scheduling
+    # ------------------------------------------------------------------
+
+    def _steady_state_step(self) -> None:
+        """Insert ``num_workers`` finished chains, keeping all workers busy."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.num_workers)
+
+        n_done = 0
+        try:
+            while n_done < self.num_workers and not self.should_stop_iteration():
+                self._fill_workers()
+                if not self._in_flight:
+                    break
+                done, _ = concurrent.futures.wait(self._in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in [f for f in self._in_flight if f in done]:
+                    self._in_flight.remove(future)
+                    self._insert_chain(future.result())
+                    n_done += 1
+
+            if self.should_stop_iteration():
+                self._drain_workers()
+        except BaseException:
+            self._abort_workers()
+            raise
+
+    def _fill_workers(self) -> None:
+        """Submit new chains until ``num_workers`` are in flight or the budget is spent."""
+        job_modes = ["init"] * self.num_init_per_gen + self._generate_sol_modes
+        while len(self._in_flight) < self.num_workers:
+            if self.max_chains is not None and self.state.next_chain_id + len(self._in_flight) >= self.max_chains:
+                return
+            if self.max_samples is not None and self.state.sample_count >= self.max_samples:
+                return
+
+            mode = job_modes[self._steady_job_index % len(job_modes)]
+            self._steady_job_index += 1
+            parent_chains = None if mode == "init" else self._select_parent_chains(self._num_parents(mode))
+            self._in_flight.append(self._executor.submit(self._run_chain_job, mode, parent_chains))
+
+    def _drain_workers(self) -> None:
+        """Wait for the remaining in-flight chains and shut the pool down."""
+        for future in self._in_flight:
+            self._insert_chain(future.result())
+        self._in_flight = []
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _abort_workers(self) -> None:
+        """Cancel the chains not yet started and shut the pool down after a failed job."""
+        for future in self._in_flight:
+            future.cancel()
+        self._in_flight = []
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def _insert_chain(self, chain: list[Solution]) -> None:
+        with self._state_lock:
+            self._register_chain(chain)
+            self._manage_population()
+
     # ------------------------------------------------------------------
     # Chain management
     # ------------------------------------------------------------------
 
+    def _run_chain_jobs(
+        self,
+        jobs: list[tuple[str, list[list[Solution]] | None]],
+    ) -> list[list[Solution]]:
+        """Build one chain per ``(mode, parent_chains)`` job.
+
+        Chains are returned in job order regardless of ``num_workers``.
+        """
+        if self.num_workers <= 1 or len(jobs) <= 1:
+            return [self._run_chain_job(mode, parent_chains) for mode, parent_chains in jobs]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            futures = [
+                executor.submit(self._run_chain_job, mode, parent_chains)
+                for mode, parent_chains in jobs
+            ]
+            return [future.result() for future in futures]
+
+    def _run_chain_job(self, mode: str, parent_chains: list[list[Solution]] | None) -> list[Solution]:
+        if mode == "init":
+            return self._init_a_sol()
+        return self._generate_offspring(mode, parent_chains)
+
     def _register_chain(self, chain: list[Solution]) -> None:
         """Register a chain: only the last solution enters population."""
         chain_id = self.state.next_chain_id
@@ -187,6 +371,9 @@ class CoEvoMethod(PopulationMethod):
 
     def _continue_reason(self, one_solution: Solution) -> list[Solution]:
         """Multi-layer reasoning: derive improved solutions from one_solution."""
+        if self.speculative_continue:
+            return self._continue_reason_speculative(one_solution)
+
         history_list = [one_solution]
         new_gen_list: list[Solution] = []
 
@@ -194,49 +381,102 @@ class CoEvoMethod(PopulationMethod):
             if idea_layer_i == 0:
                 continue
 
-            start = time.time()
-            self.verbose_info("\tCONTINUE: ")
+            finalized_sol = self._continue_layer(idea_layer_i, history_list)
+            if not self._accept_continue(history_list[-1], finalized_sol):
+                return new_gen_list
 
-            idea_pool = self._get_idea_pool_for_layer(history_list)
-            prompt = self.interface.get_continue_prompt(idea_layer_i, history_list, idea_pool)
-            finalized_sol = self._prompt_parse_evaluate(prompt, layer=idea_layer_i)
+            new_gen_list.append(finalized_sol)
+            history_list.append(one_solution)  # intentional: always cite original solution
 
-            elapsed = time.time() - start
-            self.verbose_info(f"Done:{elapsed:.1f}s\n")
+        return new_gen_list
 
-            # Early stop: invalid solution
-            if finalized_sol.evaluation_res is None or not finalized_sol.evaluation_res.valid:
-                return new_gen_list
+    def _continue_reason_speculative(self, one_solution: Solution) -> list[Solution]:
+        """Issue every continue layer at once, then replay the early-stop rules.
 
-            # Early stop: no improvement
-            prev = history_list[-1]
-            if prev.evaluation_res is not None and prev.evaluation_res.valid:
-                prev_fitness = prev.evaluation_res.additional_info.get("fitness_list", [float("inf")])[0]
-                curr_fitness = finalized_sol.evaluation_res.additional_info.get("fitness_list", [float("inf")])[0]
-                if prev_fitness - curr_fitness < 1e-8:
-                    return new_gen_list
+        Since the history always cites the original solution, layer ``k`` sees
+        ``[one_solution] * k`` and does not depend on earlier layers.  Layers
+        past an early stop are still paid for but discarded.
+        """
+        layers = list(range(1, len(self.interface.num_idea)))
+        if not layers:
+            return []
 
-            new_gen_list.append(finalized_sol)
-            history_list.append(one_solution)  # intentional: always cite original solution
+        histories = [[one_solution] * idea_layer_i for idea_layer_i in layers]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(layers)) as executor:
+            layer_sols = list(executor.map(self._continue_layer, layers, histories))
 
+        new_gen_list: list[Solution] = []
+        for finalized_sol in layer_sols:
+            if not self._accept_continue(one_solution, finalized_sol):
+                break
+            new_gen_list.append(finalized_sol)
         return new_gen_list
 
-    def _generate_offspring(self, mode: str) -> list[Solution]:
-        """Generate one offspring chain via crossover or mutation."""
+    def _continue_layer(self, idea_layer_i: int, history_list: list[Solution]) -> Solution:
+        start = time.time()
+        self.verbose_info("\tCONTINUE: ")
+
+        idea_pool = self._get_idea_pool_for_layer(history_list)
+        prompt = self.interface.get_continue_prompt(idea_layer_i, history_list, idea_pool)
+        finalized_sol = self._prompt_parse_evaluate(prompt, layer=idea_layer_i, parents=history_list[-1:])
+
+        elapsed = time.time() - start
+        self.verbose_info(f"Done:{elapsed:.1f}s\n")
+        return finalized_sol
+
+    @staticmethod
+    def _full_fitness(sol: Solution) -> float | None:
+        """``fitness_list[0]`` of a valid, fully fitted ``sol``, else ``None``.
+
+        Raced or cut-off results (``"truncated"``/``"dominated"`` in their
+        info) carry a subsample or early-stopped MSE that is not comparable
+        with full fits, so they count as non-improving.
+        """
+        res = sol.evaluation_res
+        if res is None or not res.valid:
+            return None
+        info = res.additional_info or {}
+        if info.get("truncated") or info.get("dominated"):
+            return None
+        return info.get("fitness_list", [float("inf")])[0]
+
+    @classmethod
+    def _accept_continue(cls, prev: Solution, finalized_sol: Solution) -> bool:
+        """Early-stop rules for a continue layer."""
+        # Early stop: invalid or truncated solution
+        curr_fitness = cls._full_fitness(finalized_sol)
+        if curr_fitness is None:
+            return False
+
+        # Early stop: no improvement
+        prev_fitness = cls._full_fitness(prev)
+        if prev_fitness is not None and prev_fitness - curr_fitness < 1e-8:
+            return False
+        return True
+
+    def _num_parents(self, mode: str) -> int:
         op_mode = mode.split("_")[0]
         if op_mode == "crossover":
-            parent_chains = self._select_parent_chains(self.num_crossover)
-        elif op_mode == "mutation":
-            parent_chains = self._select_parent_chains(1)
-        else:
-            raise ValueError(f"Unknown operation mode: {op_mode}")
+            return self.num_crossover
+        if op_mode == "mutation":
+            return 1
+        raise ValueError(f"Unknown operation mode: {op_mode}")
+
+    def _generate_offspring(
+        self,
+        mode: str,
+        parent_chains: list[list[Solution]] | None = None,
+    ) -> list[Solution]:
+        """Generate one offspring chain via crossover or mutation."""
+        if parent_chains is None:
+            parent_chains = self._select_parent_chains(self._num_parents(mode))
 
         start = time.time()
         self.verbose_info(f"{mode.upper()} ")
 
         idea_pool = self._get_idea_pool()
         prompt = self.interface.get_offspring_prompt(parent_chains, mode, idea_pool)
-        offspring_sol = self._prompt_parse_evaluate(prompt, layer=0)
+        offspring_sol = self._prompt_parse_evaluate(prompt, layer=0, parents=[chain[-1] for chain in parent_chains])
 
         elapsed = time.time() - start
         self.verbose_info(f"Done:{elapsed:.1f}s\n")
@@ -253,43 +493,196 @@ class CoEvoMethod(PopulationMethod):
     # LLM prompt→parse→evaluate pipeline
     # ------------------------------------------------------------------
 
-    def _prompt_parse_evaluate(self, prompt: str, *, layer: int = 0) -> Solution:
-        """Call LLM with retry, parse response, and evaluate."""
+    def _prompt_parse_evaluate(
+        self,
+        prompt: str,
+        *,
+        layer: int = 0,
+        parents: list[Solution] | None = None,
+    ) -> Solution:
+        """Call LLM with retry, parse response, and evaluate.
+
+        Failed attempts are classified (transport / throttling / format /
+        permanent) and backed off according to ``retry_policy``, except that
+        a permanent failure is not retried; the classes are recorded in
+        ``metadata.extras["retry_failures"]``.  ``parents`` are the solutions
+        the prompt derives from; their fitted params are passed on as warm
+        starts.
+        """
+        policy = self.retry_policy
         n_retry = 0
         sol: Solution | None = None
         usage: dict = {}
+        failures: list[str] = []
 
-        while n_retry <= 3:
+        while n_retry <= policy.max_retry:
+            retry_after = None
             try:
                 response_str, usage = self.running_llm.get_response(prompt)
+            except Exception as e:
+                failure = classify_failure(e)
+                retry_after = getattr(e, "retry_after", None)
+            else:
                 sol = self.interface.parse_response(response_str, layer=layer)
-
                 # If parse succeeded (non-empty sol_string), exit retry loop
                 if sol.sol_string:
                     break
-            except Exception:
-                pass
+                failure = FORMAT
+
+            failures.append(failure)
+            if failure == PERMANENT:
+                break
             n_retry += 1
+            if n_retry <= policy.max_retry:
+                time.sleep(policy.delay(failure, n_retry - 1, retry_after))
 
         if sol is None or not sol.sol_string:
             # Return an invalid solution
-            from evotoolkit.core import EvaluationResult, SolutionMetadata
+            from evotoolkit.core import SolutionMetadata
             sol = Solution(
                 sol_string="",
-                metadata=SolutionMetadata(extras={"parse_error": "Failed after retries"}),
+                metadata=SolutionMetadata(extras={
+                    "parse_error": "Failed after retries",
+                    "failure_class": failures[-1],
+                    "retry_failures": failures,
+                }),
                 evaluation_res=EvaluationResult(
                     valid=False,
                     score=float("-inf"),
-                    additional_info={"error": "Failed to get valid response after retries"},
+                    additional_info={"error": f"Failed to get valid response after retries ({failures[-1]})"},
                 ),
             )
         else:
-            eval_res = self.task.evaluate(sol)
+            if failures:
+                sol.metadata.extras["retry_failures"] = failures
+            hints = self._eval_hints(parents or [])
+            if hints:
+                sol.metadata.extras["eval_hints"] = hints
+            eval_res = self._evaluate(sol)
             sol.evaluation_res = eval_res
 
         self._record_generation_usage(usage)
         return sol
 
+    def _eval_hints(self, parents: list[Solution]) -> dict:
+        """Hints for the evaluator: the survival bar and the parents' fitted params."""
+        hints: dict = {}
+        survival_bar = self._survival_bar()
+        if survival_bar is not None:
+            hints["survival_bar"] = survival_bar
+        warm_starts = [
+            parent.evaluation_res.additional_info["params"]
+            for parent in parents
+            if parent.evaluation_res
+            and parent.evaluation_res.valid
+            and "params" in (parent.evaluation_res.additional_info or {})
+        ]
+        if warm_starts:
+            hints["warm_starts"] = warm_starts
+        return hints
+
+    def _survival_bar(self) -> float | None:
+        """Worst ``fitness_list[0]`` retained by a full population, else ``None``.
+
+        A candidate scoring worse than this cannot survive selection.  Passed
+        to the evaluator as a hint; it only tightens during a run.
+        """
+        with self._state_lock:
+            fitness = [
+                sol.evaluation_res.additional_info.get("fitness_list", [float("inf")])[0]
+                for sol in self.state.population
+                if sol.evaluation_res and sol.evaluation_res.valid
+            ]
+        if len(fitness) < self.pop_size:
+            return None
+        return max(fitness)
+
+    def _evaluate(self, sol: Solution):
+        """Evaluate ``sol`` through the evaluation cache and store, if any.
+
+        Results cut short against the survival bar (``"truncated"`` in their
+        info) are cached for this run but not persisted, since other runs
+        have other bars; so are results reused from or fits started at a
+        fingerprint match, since other runs have other matches, and timeouts
+        (see ``is_persistable``).  Results of dead workers (``is_transient``)
+        are neither cached nor persisted.
+
+        Tasks with a ``screen`` method (FittingTask) pre-screen the code
+        first: rejected candidates never reach the evaluator, and the others
+        carry the outcome as a ``screen`` hint so the evaluator does not
+        screen them again.  Non-vectorised ones also get the tighter limit as
+        a ``time_limit`` hint.
+        """
+        vectorised = True
+        screen = getattr(self.task, "screen", None)
+        if screen is not None:
+            result = screen(sol.sol_string)
+            if result.error is not None:
+                with self._state_lock:
+                    self.prescreen_rejections += 1
+                return EvaluationResult(valid=False, score=float("-inf"), additional_info={"error": result.error})
+            hints = sol.metadata.extras.setdefault("eval_hints", {})
+            hints["screen"] = {"vectorised": result.vectorised, "reasons": result.reasons}
+            if not result.vectorised:
+                vectorised = False
+                hints["time_limit"] = self.task.time_limit(result)
+
+        if self.eval_cache is None and self.eval_store is None and self.fingerprint_cache is None:
+            return self.evaluator.evaluate(sol)
+
+        key = normalized_code_hash(sol.sol_string)
+        if self.eval_cache is not None:
+            eval_res = self.eval_cache.get(key)
+            if eval_res is not None:
+                return eval_res
+
+        eval_res = self.eval_store.get(self.task, key) if self.eval_store is not None else None
+        if eval_res is None:
+            fingerprint = self._fingerprint(sol) if vectorised else None
+            hinted = False
+            if fingerprint is not None:
+                match = self.fingerprint_cache.get(fingerprint)
+                params = (match.additional_info or {}).get("params") if match is not None else None
+                if params is not None:
+                    sol.metadata.extras.setdefault("eval_hints", {})["fingerprint_start"] = params
+                    hinted = True
+                    eval_res = self._reuse_fingerprint_match(sol, match)
+            if eval_res is None:
+                eval_res = self.evaluator.evaluate(sol)
+            info = eval_res.additional_info or {}
+            if is_transient(eval_res):
+                return eval_res
+            if self.eval_store is not None and not info.get("truncated") and not hinted:
+                self.eval_store.put(self.task, key, eval_res)
+            if fingerprint is not None and eval_res.valid and not info.get("truncated") and "params" in info:
+                self.fingerprint_cache.put(fingerprint, eval_res)
+        if self.eval_cache is not None:
+            self.eval_cache.put(key, eval_res)
+        return eval_res
+
+    def _reuse_fingerprint_match(self, sol: Solution, match: EvaluationResult) -> EvaluationResult | None:
+        """A copy of ``match`` for ``sol`` if its params give ``sol`` the same MSE, else ``None``.
+
+        The fingerprint probe covers a few rows and param vectors only, so the
+        stored params are scored on ``sol`` over the full dataset first.
+        """
+        info = match.additional_info
+        check = self.task.evaluate_with_params(sol.sol_string, info["params"])
+        if not check.valid or not math.isclose(check.additional_info["mse"], info["mse"], rel_tol=1e-9):
+            return None
+        with self._state_lock:
+            self.fingerprint_reuses += 1
+        res = copy_evaluation_result(match)
+        res.additional_info["fingerprint_match"] = True
+        return res
+
+    def _fingerprint(self, sol: Solution) -> str | None:
+        """``task.fingerprint`` of ``sol``, or ``None`` if fingerprinting is off or unsafe here."""
+        if self.fingerprint_cache is None or self.evaluator is not self.task:
+            return None
+        fingerprint = getattr(self.task, "fingerprint", None)
+        return fingerprint(sol.sol_string) if fingerprint is not None else None
+
     # ------------------------------------------------------------------
     # Parent selection
     # ------------------------------------------------------------------
@@ -355,17 +748,15 @@ class CoEvoMethod(PopulationMethod):
             return
         if not (self.use_summarizer and self.summarizer):
             return
-        last = chain[-1]
-        if last.evaluation_res is None or not last.evaluation_res.valid:
+        last_fitness = self._full_fitness(chain[-1])
+        if last_fitness is None:
             return
 
         # Only summarize if the last solution is strictly better than all predecessors
-        last_fitness = last.evaluation_res.additional_info.get("fitness_list", [float("inf")])[0]
         for sol in chain[:-1]:
-            if sol.evaluation_res and sol.evaluation_res.valid:
-                fit = sol.evaluation_res.additional_info.get("fitness_list", [float("inf")])[0]
-                if fit - last_fitness < 1e-8:
-                    return
+            fit = self._full_fitness(sol)
+            if fit is not None and fit - last_fitness < 1e-8:
+                return
 
         start = time.time()
         self.verbose_info("\tSUMMARIZE: ")
@@ -379,16 +770,14 @@ class CoEvoMethod(PopulationMethod):
     ) -> None:
         if not (self.use_summarizer and self.summarizer):
             return
-        if offspring_sol.evaluation_res is None or not offspring_sol.evaluation_res.valid:
+        offspring_fitness = self._full_fitness(offspring_sol)
+        if offspring_fitness is None:
             return
 
-        offspring_fitness = offspring_sol.evaluation_res.additional_info.get("fitness_list", [float("inf")])[0]
         for chain in parent_chains:
-            best_parent = chain[-1]
-            if best_parent.evaluation_res and best_parent.evaluation_res.valid:
-                p_fit = best_parent.evaluation_res.additional_info.get("fitness_list", [float("inf")])[0]
-                if p_fit - offspring_fitness < 1e-8:
-                    return
+            p_fit = self._full_fitness(chain[-1])
+            if p_fit is not None and p_fit - offspring_fitness < 1e-8:
+                return
 
         start = time.time()
         self.verbose_info("\tSUMMARIZE: ")
@@ -423,3 +812,17 @@ class CoEvoMethod(PopulationMethod):
         for i, fs in enumerate(fitness_strings):
             print(f"{i:<10d}{fs}")
         print(f"{'':=<{total_len}}")
+        if self.eval_cache is not None:
+            print(f"Eval cache: {self.eval_cache.hits} hits, {self.eval_cache.misses} misses")
+        if self.eval_store is not None:
+            print(f"Eval store: {self.eval_store.hits} hits, {self.eval_store.misses} misses")
+        if self.fingerprint_cache is not None:
+            lookups = self.fingerprint_cache.hits + self.fingerprint_cache.misses
+            hit_rate = self.fingerprint_cache.hits / lookups if lookups else 0.0
+            print(
+                f"Fingerprint cache: {self.fingerprint_reuses} fits skipped, "
+                f"{self.fingerprint_cache.hits - self.fingerprint_reuses} warm-started, "
+                f"{self.fingerprint_cache.misses} misses ({hit_rate:.1%} hit rate)"
+            )
+        if self.prescreen_rejections:
+            print(f"Pre-screen: {self.prescreen_rejections} candidates rejected")
@@ -0,0 +1,249 @@
+"""Text embedding backends for CoEvoSummarizer.
+
+A backend turns a batch of texts into a ``(n, dim)`` float32 array and
+names itself with a ``model_id`` (the EmbeddingCache key).  Three are
+provided:
+
+- ``HFEmbeddingBackend``: mean-pooled last hidden layer of a HuggingFace
+  base model (needs ``torch`` and ``transformers``).
+- ``ONNXEmbeddingBackend``: the same pooling on an exported ONNX model,
+  optionally int8-quantised, on CPU (needs ``onnxruntime`` and
+  ``transformers`` for the tokenizer, no ``torch``).
+- ``HashedNgramBackend``: hashed word and character n-grams, no model and
+  no dependencies beyond NumPy.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+import threading
+import zlib
+
+import numpy as np
+
+
+class EmbeddingBackend:
+    """Base class: ``embed`` a list of texts into float32 rows.
+
+    Subclasses implement ``_embed``.  ``embed`` serialises calls with a
+    per-backend lock, since the summarizer calls it from every chain thread
+    and neither HF fast tokenizers (``RuntimeError: Already borrowed`` on
+    concurrent padded calls) nor the models are re-entrant.
+    """
+
+    model_id: str = ""
+
+    def __init__(self) -> None:
+        self._embed_lock = threading.Lock()
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        with self._embed_lock:
+            return self._embed(texts)
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        raise NotImplementedError
+
+
+def _load_tokenizer(model_path: str):
+    from transformers import AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    # Batches are right-padded (GPT-2 has no pad token); a causal model never
+    # attends to the padding, and pooling masks it out.
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    tokenizer.padding_side = "right"
+    return tokenizer
+
+
+def _mean_pool(hidden: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    mask = attention_mask[..., None].astype(hidden.dtype)
+    return ((hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1)).astype(np.float32, copy=False)
+
+
+class HFEmbeddingBackend(EmbeddingBackend):
+    """Last-layer hidden states of a HuggingFace model, mean-pooled per text.
+
+    Loads the base model only (``AutoModel``), without the LM head; its last
+    hidden state is the one the LM head would have read.
+
+    Parameters
+    ----------
+    model_path:
+        HuggingFace model name or directory.
+    device:
+        Torch device (default: ``cuda`` if available, else ``cpu``).
+    """
+
+    def __init__(self, model_path: str, device: str | None = None) -> None:
+        import torch
+        from transformers import AutoModel
+
+        super().__init__()
+        self.model_id = model_path
+        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self.tokenizer = _load_tokenizer(model_path)
+        self.model = AutoModel.from_pretrained(model_path).to(self.device).eval()
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        import torch
+
+        with torch.no_grad():
+            t_input = self.tokenizer(texts, return_tensors="pt", padding=True)
+            t_input_dict = {k: v.to(self.device) for k, v in t_input.items()}
+            hidden = self.model(**t_input_dict).last_hidden_state
+            mask = t_input_dict["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+            embeddings = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+        return embeddings.cpu().numpy().astype(np.float32, copy=False)
+
+
+class ONNXEmbeddingBackend(EmbeddingBackend):
+    """Mean-pooled last hidden state from an ONNX export, run with onnxruntime on CPU.
+
+    ``model_path`` is a directory holding ``model.onnx`` (the base model,
+    e.g. from ``optimum-cli export onnx --model openai-community/gpt2
+    --task feature-extraction <dir>``) and its tokenizer files.  With
+    ``quantize``, the weights are dynamically quantised to int8 once and
+    kept next to it as ``model_int8.onnx``.
+
+    Parameters
+    ----------
+    model_path:
+        Export directory.
+    quantize:
+        Run the int8-quantised model.
+    num_threads:
+        onnxruntime intra-op threads (default: onnxruntime's choice).
+    """
+
+    def __init__(self, model_path: str, quantize: bool = True, num_threads: int | None = None) -> None:
+        import onnxruntime
+
+        super().__init__()
+        onnx_path = os.path.join(model_path, "model.onnx")
+        if not os.path.exists(onnx_path):
+            raise ValueError(
+                f"{onnx_path} not found; export the model first, e.g. "
+                f"optimum-cli export onnx --model <model> --task feature-extraction {model_path}"
+            )
+        if quantize:
+            onnx_path = self._quantized(onnx_path)
+
+        options = onnxruntime.SessionOptions()
+        if num_threads is not None:
+            options.intra_op_num_threads = num_threads
+        self.session = onnxruntime.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.tokenizer = _load_tokenizer(model_path)
+        self.model_id = f"{os.path.abspath(model_path)}#onnx{'-int8' if quantize else ''}"
+
+    @staticmethod
+    def _quantized(onnx_path: str) -> str:
+        quantized_path = os.path.join(os.path.dirname(onnx_path), "model_int8.onnx")
+        if not os.path.exists(quantized_path):
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(onnx_path), suffix=".onnx")
+            os.close(fd)
+            try:
+                quantize_dynamic(onnx_path, tmp_path, weight_type=QuantType.QInt8)
+                os.replace(tmp_path, quantized_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        return quantized_path
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        encoded = self.tokenizer(texts, return_tensors="np", padding=True)
+        attention_mask = encoded["attention_mask"].astype(np.int64)
+        feed = {name: np.asarray(value, dtype=np.int64) for name, value in encoded.items() if name in self.input_names}
+        if "position_ids" in self.input_names:
+            feed["position_ids"] = np.maximum(np.cumsum(attention_mask, axis=1) - 1, 0)
+        hidden = self.session.run(None, feed)[0]
+        return _mean_pool(hidden, attention_mask)
+
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class HashedNgramBackend(EmbeddingBackend):
+    """Signed feature hashing of word 1-2-grams and character n-grams.
+
+    Each text becomes a ``dim``-vector of sublinear term frequencies
+    (``1 + log(tf)``), L2-normalised.  There is no IDF weighting: the
+    summarizer already standardises every dimension over the pool
+    (StandardScaler) before clustering and search, and without a corpus
+    statistic an embedding depends on its text alone, so it can be cached.
+    Hashing uses CRC32, so embeddings are the same in every process.
+
+    Parameters
+    ----------
+    dim:
+        Number of hashed features.
+    char_ngrams:
+        Inclusive range of character n-gram lengths, taken within words.
+    """
+
+    def __init__(self, dim: int = 2048, char_ngrams: tuple[int, int] = (3, 5)) -> None:
+        super().__init__()
+        self.dim = dim
+        self.char_ngrams = char_ngrams
+        self.model_id = f"hashed-ngram-{dim}-{char_ngrams[0]}-{char_ngrams[1]}"
+
+    def _features(self, text: str) -> list[str]:
+        words = _TOKEN_PATTERN.findall(text.lower())
+        features = [f"w:{w}" for w in words]
+        features += [f"b:{a} {b}" for a, b in zip(words, words[1:])]
+        low, high = self.char_ngrams
+        for word in words:
+            padded = f"<{word}>"
+            for n in range(low, high + 1):
+                features += [f"c:{padded[i : i + n]}" for i in range(len(padded) - n + 1)]
+        return features
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        embeddings = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            counts: dict[int, float] = {}
+            for feature in self._features(text):
+                h = zlib.crc32(feature.encode("utf-8"))
+                index = h % self.dim
+                counts[index] = counts.get(index, 0.0) + (1.0 if h & 0x80000000 else -1.0)
+            for index, count in counts.items():
+                if count:
+                    embeddings[row, index] = np.sign(count) * (1.0 + np.log(abs(count)))
+            norm = np.linalg.norm(embeddings[row])
+            if norm > 0:
+                embeddings[row] /= norm
+        return embeddings
+
+
+EMBEDDING_BACKENDS = ("hf", "onnx", "hashed")
+
+# Optional dependencies of the model backends, and how to install them
+_BACKEND_REQUIREMENTS = {
+    "hf": ("torch and transformers", "uv sync --extra summarizer"),
+    "onnx": ("onnxruntime and transformers", "uv pip install onnxruntime transformers"),
+}
+
+
+def make_embedding_backend(name: str, model_path: str | None = None) -> EmbeddingBackend:
+    """Backend ``name`` from ``EMBEDDING_BACKENDS``; ``model_path`` is used by ``hf`` and ``onnx``.
+
+    Raises ImportError with install instructions if a model backend's
+    dependencies are missing.
+    """
+    if name == "hashed":
+        return HashedNgramBackend()
+    if name not in _BACKEND_REQUIREMENTS:
+        raise ValueError(f"unknown embedding backend {name!r}; expected one of {EMBEDDING_BACKENDS}")
+    try:
+        return HFEmbeddingBackend(model_path) if name == "hf" else ONNXEmbeddingBackend(model_path)
+    except ImportError as e:
+        packages, install = _BACKEND_REQUIREMENTS[name]
+        raise ImportError(
+            f"The {name!r} embedding backend needs {packages} ({e.name} is missing); "
+            f"install them with `{install}`, or use the 'hashed' backend."
+        ) from e
@@ -0,0 +1,72 @@
+"""Fixed-size FIFO ring buffer of embeddings for the summarizer's idea pool."""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class EmbeddingRingBuffer:
+    """Preallocated ``(capacity, dim)`` float32 embeddings with aligned items.
+
+    Rows are stored in slots; appending to a full buffer overwrites the
+    oldest slot, so eviction is O(1) and memory stays fixed.  ``view``
+    returns the filled rows in slot order without copying; slot order is
+    the insertion order rotated by ``head``, which permutation-invariant
+    consumers (StandardScaler, DBSCAN, cdist) do not care about.  Use
+    ``slot_order`` to walk the slots in insertion order (as ``items`` does).
+
+    Parameters
+    ----------
+    capacity:
+        Maximum number of rows.
+    dim:
+        Embedding size.  If ``None``, taken from the first appended row.
+    """
+
+    def __init__(self, capacity: int, dim: int | None = None) -> None:
+        self.capacity = capacity
+        self.head = 0
+        self._size = 0
+        self._data: np.ndarray | None = None
+        self._items: list = [None] * capacity
+        if dim is not None:
+            self._data = np.empty((capacity, dim), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, embedding, item) -> None:
+        """Add ``embedding`` with its ``item``, evicting the oldest row when full."""
+        embedding = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if self._data is None:
+            self._data = np.empty((self.capacity, embedding.shape[0]), dtype=np.float32)
+        if self._size < self.capacity:
+            slot = (self.head + self._size) % self.capacity
+            self._size += 1
+        else:
+            slot = self.head
+            self.head = (self.head + 1) % self.capacity
+        self._data[slot] = embedding
+        self._items[slot] = item
+
+    def clear(self) -> None:
+        self.head = 0
+        self._size = 0
+        self._items = [None] * self.capacity
+
+    def view(self) -> np.ndarray:
+        """Filled rows in slot order (a view, not a copy)."""
+        if self._data is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._data[: self._size]
+
+    def slot_order(self) -> np.ndarray:
+        """Slots from oldest to newest."""
+        return (self.head + np.arange(self._size)) % max(self.capacity, 1)
+
+    def item(self, slot: int):
+        return self._items[slot]
+
+    def items(self) -> list:
+        """Items from oldest to newest."""
+        return [self._items[slot] for slot in self.slot_order()]
@@ -0,0 +1,124 @@
+"""Content-addressed cache of summarizer text embeddings."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+
+def embedding_key(model_id: str, text: str) -> str:
+    """SHA-256 of the model id and the embedded text."""
+    digest = hashlib.sha256(model_id.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class EmbeddingCache:
+    """Float32 embeddings keyed on ``embedding_key(model_id, text)``.
+
+    An in-memory LRU tier sits in front of an optional SQLite file, so
+    resumed runs and concurrent runs embedding with the same model share
+    every text embedded before.  Thread-safe; the file is shared like
+    SQLiteEvaluationStore's (WAL journal, one connection per thread).
+    Returned arrays are read-only.
+
+    Parameters
+    ----------
+    path:
+        SQLite database file; created if missing.  ``None`` keeps the cache
+        in memory only.
+    max_size:
+        Maximum number of embeddings held in memory; the least recently
+        used is evicted first.
+    timeout:
+        Seconds to wait on a locked database before giving up.
+    """
+
+    def __init__(self, path: str | None = None, max_size: int = 4096, timeout: float = 30.0) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.timeout = timeout
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        if path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            conn = self._conn()
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+
+    def get(self, model_id: str, text: str) -> np.ndarray | None:
+        key = embedding_key(model_id, text)
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return embedding
+
+        if self.path is not None:
+            row = self._conn().execute("SELECT vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                embedding = self._remember(key, np.frombuffer(row[0], dtype=np.float32))
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                return embedding
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, model_id: str, text: str, embedding) -> np.ndarray:
+        """Cache ``embedding`` and return the cached, read-only float32 copy."""
+        key = embedding_key(model_id, text)
+        embedding = self._remember(key, np.array(embedding, dtype=np.float32).reshape(-1))
+        if self.path is not None:
+            conn = self._conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?)",
+                (key, model_id, embedding.shape[0], embedding.tobytes(), time.time()),
+            )
+            conn.commit()
+        return embedding
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, embedding: np.ndarray) -> np.ndarray:
+        embedding.setflags(write=False)
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return embedding
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
@@ -0,0 +1,98 @@
+"""In-memory evaluation cache keyed on normalised candidate code."""
+
+from __future__ import annotations
+
+import ast
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
+from evotoolkit.core import EvaluationResult
+
+
+def normalized_code_hash(code: str) -> str:
+    """SHA-256 of the code's AST with docstrings removed.
+
+    Whitespace, comments and docstrings do not change the hash.  Code that
+    does not parse is hashed on its stripped source instead.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return hashlib.sha256(code.strip().encode("utf-8")).hexdigest()
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            body = node.body
+            if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant) \
+                    and isinstance(body[0].value.value, str):
+                node.body = body[1:] or [ast.Pass()]
+    return hashlib.sha256(ast.dump(tree).encode("utf-8")).hexdigest()
+
+
+def copy_evaluation_result(res: EvaluationResult) -> EvaluationResult:
+    return EvaluationResult(
+        valid=res.valid,
+        score=res.score,
+        additional_info=copy.deepcopy(res.additional_info),
+    )
+
+
+def is_transient(res: EvaluationResult) -> bool:
+    """Whether ``res`` reflects the environment rather than the code.
+
+    Evaluators mark dead workers with ``"transient"`` in the info; such
+    results must not be cached or persisted.
+    """
+    return bool((res.additional_info or {}).get("transient"))
+
+
+def is_persistable(res: EvaluationResult) -> bool:
+    """Whether ``res`` may be stored for other runs.
+
+    Besides transient results, timeouts (``"timed_out"`` in the info) are
+    kept out: they depend on the machine and its load, so they are cached
+    for the current run only.
+    """
+    info = res.additional_info or {}
+    return not info.get("transient") and not info.get("timed_out")
+
+
+class EvaluationCache:
+    """Thread-safe LRU cache of ``EvaluationResult`` by normalised code hash.
+
+    Parameters
+    ----------
+    max_size:
+        Maximum number of cached results; the least recently used entry is
+        evicted first.
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, EvaluationResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> EvaluationResult | None:
+        """Return a copy of the cached result, or None on a miss."""
+        with self._lock:
+            res = self._entries.get(key)
+            if res is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy_evaluation_result(res)
+
+    def put(self, key: str, res: EvaluationResult) -> None:
+        with self._lock:
+            self._entries[key] = copy_evaluation_result(res)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,136 @@
+"""Persistent, cross-run evaluation store backed by SQLite."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from evotoolkit.core import EvaluationResult
+from evotoolkit.task.python_task import PythonTask
+
+from .eval_cache import is_persistable
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    task TEXT NOT NULL,
+    dataset_hash TEXT NOT NULL,
+    code_hash TEXT NOT NULL,
+    valid INTEGER NOT NULL,
+    score REAL,
+    fitness_list TEXT,
+    params TEXT,
+    error TEXT,
+    additional_info TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (task, dataset_hash, code_hash)
+)
+"""
+
+_dataset_hashes: dict[str, str] = {}
+_dataset_hashes_lock = threading.Lock()
+
+
+def dataset_hash(path: str) -> str:
+    """SHA-256 of a dataset file, memoised per absolute path."""
+    path = os.path.abspath(path)
+    with _dataset_hashes_lock:
+        if path not in _dataset_hashes:
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            _dataset_hashes[path] = digest.hexdigest()
+        return _dataset_hashes[path]
+
+
+class SQLiteEvaluationStore:
+    """Evaluation results keyed on (task name, dataset file hash, code hash).
+
+    Tasks fitted with another setup than plain BFGS (``task.fit_key``: backend,
+    gradient, starts) are stored under ``"<name>[<fit_key>]"`` so setups never
+    share results.
+
+    Safe to share between threads and between concurrent runs pointing at the
+    same file (WAL journal, one connection per thread).  Timeouts and
+    results of dead workers (see ``is_persistable``) are never stored.
+
+    Parameters
+    ----------
+    path:
+        SQLite database file; created if missing.
+    timeout:
+        Seconds to wait on a locked database before giving up.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        self.path = path
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        dirname = os.path.dirname(os.path.abspath(path))
+        os.makedirs(dirname, exist_ok=True)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(_SCHEMA)
+        conn.commit()
+
+    def get(self, task: PythonTask, code_hash: str) -> EvaluationResult | None:
+        row = self._conn().execute(
+            "SELECT valid, score, additional_info FROM evaluations "
+            "WHERE task = ? AND dataset_hash = ? AND code_hash = ?",
+            (*self._task_key(task), code_hash),
+        ).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        valid, score, additional_info = row
+        return EvaluationResult(
+            valid=bool(valid),
+            score=float("-inf") if score is None else score,
+            additional_info=json.loads(additional_info),
+        )
+
+    def put(self, task: PythonTask, code_hash: str, res: EvaluationResult) -> None:
+        if not is_persistable(res):
+            return
+        info = res.additional_info or {}
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                *self._task_key(task),
+                code_hash,
+                int(bool(res.valid)),
+                res.score,
+                json.dumps(info.get("fitness_list")),
+                json.dumps(info.get("params")),
+                info.get("error"),
+                json.dumps(info, default=str),
+                time.time(),
+            ),
+        )
+        conn.commit()
+
+    @staticmethod
+    def _task_key(task: PythonTask) -> tuple[str, str]:
+        name = task.spec.name
+        fit_key = getattr(task, "fit_key", "")
+        if fit_key:
+            name = f"{name}[{fit_key}]"
+        return name, dataset_hash(task.dataset_dir)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
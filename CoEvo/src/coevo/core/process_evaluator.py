@@ -0,0 +1,192 @@
+"""Sandboxed evaluation of PythonTask candidates in a warm process pool."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+
+from evotoolkit.core import EvaluationResult, Solution
+from evotoolkit.task.python_task import PythonTask
+
+
+def _worker_main(task: PythonTask, conn, memory_limit_mb: int | None) -> None:
+    # Ctrl-C is handled by the parent, which tears the pool down.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if memory_limit_mb:
+        try:
+            import resource
+
+            limit = memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError):
+            pass
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+        code, hints = message
+        conn.send(task.evaluate(Solution(code, metadata={"eval_hints": hints} if hints else None)))
+
+
+class _Worker:
+    def __init__(self, process, conn) -> None:
+        self.process = process
+        self.conn = conn
+        self.n_tasks = 0
+
+
+def _invalid(error: str, flag: str) -> EvaluationResult:
+    # Timeouts ("timed_out") are cached for the run only; crashed workers
+    # ("transient") say nothing definite about the code and are never cached.
+    return EvaluationResult(valid=False, score=float("-inf"), additional_info={"error": error, flag: True})
+
+
+class ProcessPoolEvaluator:
+    """Evaluate candidates in pre-started worker processes with hard limits.
+
+    Each worker holds its own copy of ``task`` (dataset loaded once) and runs
+    ``task.evaluate``.  A candidate that exceeds ``timeout_seconds`` (or the
+    smaller ``time_limit`` of its ``eval_hints``) has its worker killed and
+    replaced; a worker that dies (e.g. the memory limit was hit outside
+    Python's allocator) is replaced as well.  ``evaluate`` is
+    thread-safe and blocks until a worker is free, so concurrent callers are
+    spread across cores.
+
+    Parameters
+    ----------
+    task:
+        The PythonTask to evaluate against.  Sent to each worker once.
+    num_workers:
+        Number of worker processes (default: CPU count).
+    timeout_seconds:
+        Hard wall-clock limit per candidate (default: ``task.timeout_seconds``).
+    memory_limit_mb:
+        Address-space limit per worker (``RLIMIT_AS``, POSIX only).  ``None``
+        disables the limit.
+    max_tasks_per_worker:
+        Recycle a worker after this many evaluations (``None`` = never).
+    start_method:
+        multiprocessing start method.  Defaults to ``forkserver`` where
+        available so replacement workers are never forked from a
+        multi-threaded parent.
+    """
+
+    def __init__(
+        self,
+        task: PythonTask,
+        num_workers: int | None = None,
+        *,
+        timeout_seconds: float | None = None,
+        memory_limit_mb: int | None = None,
+        max_tasks_per_worker: int | None = None,
+        start_method: str | None = None,
+    ) -> None:
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self.task = task
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.timeout_seconds = timeout_seconds if timeout_seconds is not None else task.timeout_seconds
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.timeouts = 0
+        self.crashes = 0
+
+        self._ctx = multiprocessing.get_context(start_method)
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._workers: set[_Worker] = set()
+        self._lock = threading.Lock()
+        for _ in range(self.num_workers):
+            self._idle.put(self._spawn())
+
+    def evaluate(self, solution: Solution) -> EvaluationResult:
+        worker = self._acquire()
+        try:
+            start = time.time()
+            hints = solution.metadata.extras.get("eval_hints")
+            timeout = min(self.timeout_seconds, (hints or {}).get("time_limit", float("inf")))
+            try:
+                worker.conn.send((solution.sol_string, hints))
+                if not worker.conn.poll(timeout):
+                    self.timeouts += 1
+                    elapsed = time.time() - start
+                    worker = self._replace(worker)
+                    return _invalid(f"Evaluation timed out after {elapsed:.1f}s. Invalid solution.", "timed_out")
+                res = worker.conn.recv()
+            except (EOFError, OSError):
+                self.crashes += 1
+                worker.process.join(timeout=1.0)
+                exitcode = worker.process.exitcode
+                worker = self._replace(worker)
+                return _invalid(f"Evaluation worker died (exit code {exitcode}), possibly out of memory.", "transient")
+
+            worker.n_tasks += 1
+            if self.max_tasks_per_worker is not None and worker.n_tasks >= self.max_tasks_per_worker:
+                worker = self._replace(worker)
+            return res
+        finally:
+            # A worker whose replacement failed to spawn was retired; drop it
+            with self._lock:
+                retired = worker not in self._workers
+            if not retired:
+                self._idle.put(worker)
+
+    def close(self) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, set()
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+            worker.process.join(timeout=1.0)
+            if worker.process.is_alive():
+                worker.process.kill()
+            worker.conn.close()
+
+    def __enter__(self) -> ProcessPoolEvaluator:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _acquire(self) -> _Worker:
+        """Wait for an idle worker; fail instead if replacements left none."""
+        while True:
+            with self._lock:
+                if not self._workers:
+                    raise RuntimeError("ProcessPoolEvaluator has no workers (closed, or replacements failed to start)")
+            try:
+                return self._idle.get(timeout=1.0)
+            except queue.Empty:
+                pass
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(self.task, child_conn, self.memory_limit_mb),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        with self._lock:
+            self._workers.add(worker)
+        return worker
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        with self._lock:
+            self._workers.discard(worker)
+        if worker.process.is_alive():
+            worker.process.kill()
+        worker.process.join()
+        worker.conn.close()
+        return self._spawn()
@@ -8,14 +8,21 @@ from __future__ import annotations
 
 import json
 import re
+import threading
+import time
 from typing import TYPE_CHECKING
 
 import numpy as np
 
+from ..utils.retry import FORMAT, PERMANENT, RetryPolicy, classify_failure
+from .embedding_buffer import EmbeddingRingBuffer
+
 if TYPE_CHECKING:
     from evotoolkit.tools import HttpsApi
     from evotoolkit.core import Solution
 
+    from .embedding_backends import EmbeddingBackend
+    from .embedding_cache import EmbeddingCache
     from .prompts.coevo_prompts import CoEvoPromptBuilder
 
 
@@ -27,7 +34,8 @@ class CoEvoSummarizer:
     prompt_builder:
         CoEvoPromptBuilder used to build summarizer prompts.
     llm:
-        evotoolkit HttpsApi instance (returns ``(response_str, usage)``).
+        evotoolkit HttpsApi or ``coevo.utils.llm_pool.PooledLLM`` instance
+        (returns ``(response_str, usage)``).
     pool_size:
         Maximum number of ideas to keep in the pool.
     num_idea_to_return:
@@ -35,7 +43,19 @@ class CoEvoSummarizer:
     cluster_summary:
         Whether to use DBSCAN clustering for diversity.
     tokenizer_path:
-        Path to a HuggingFace tokenizer/model for sentence embeddings.
+        Path to a HuggingFace tokenizer/model for sentence embeddings, used
+        when no ``embedding_backend`` is given.
+    retry_policy:
+        Retry budget and backoff for summarizer LLM calls.  A summary whose
+        retries are exhausted is skipped.
+    embedding_cache:
+        Optional EmbeddingCache consulted before every forward pass, keyed on
+        the backend's ``model_id`` and the embedded text.
+    embedding_batch_size:
+        Maximum number of texts per padded forward pass.
+    embedding_backend:
+        EmbeddingBackend turning texts into vectors (default:
+        ``HFEmbeddingBackend(tokenizer_path)``).
     """
 
     def __init__(
@@ -47,56 +67,87 @@ class CoEvoSummarizer:
         num_idea_to_return: int = 5,
         cluster_summary: bool = True,
         tokenizer_path: str | None = None,
+        retry_policy: RetryPolicy | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+        embedding_batch_size: int = 32,
+        embedding_backend: EmbeddingBackend | None = None,
     ) -> None:
-        import torch
-        from transformers import AutoModelForCausalLM, AutoTokenizer
-
         self.prompt_builder = prompt_builder
         self.llm = llm
         self.pool_size = pool_size
         self.num_idea_to_return = num_idea_to_return
         self.cluster_summary = cluster_summary
-
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.tokenizer_inst = AutoTokenizer.from_pretrained(tokenizer_path)
-        self.embedding_inst = AutoModelForCausalLM.from_pretrained(tokenizer_path).to(self.device)
-
-        self.idea_pool: list[dict] = []
-        self.embedding_list: list = []
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.embedding_cache = embedding_cache
+        self.embedding_batch_size = embedding_batch_size
+        if embedding_backend is None:
+            from .embedding_backends import HFEmbeddingBackend
+
+            embedding_backend = HFEmbeddingBackend(tokenizer_path)
+        self.embedding_backend = embedding_backend
+        self.model_id = embedding_backend.model_id
+
+        # Idea dicts are stored as the items of their embedding rows.
+        self.embeddings = EmbeddingRingBuffer(pool_size)
+        # Guards the pool when CoEvoMethod runs chains concurrently
+        self._lock = threading.RLock()
+        # Bumped on every insertion/eviction; _analyze_cluster reuses its
+        # result until the pool changes.
+        self._pool_version = 0
+        self._cluster_cache: tuple[int, tuple] | None = None
 
     # ------------------------------------------------------------------
     # Load / save
     # ------------------------------------------------------------------
 
+    @property
+    def idea_pool(self) -> list[dict]:
+        """Ideas in the pool, oldest first."""
+        with self._lock:
+            return self.embeddings.items()
+
     def load_summary(self, summary_content: list[dict]) -> None:
-        self.idea_pool = summary_content
-        if self.idea_pool:
-            self.embedding_list = [
-                self._get_sentence_embedding(json.dumps(s)) for s in summary_content
-            ]
+        kept = summary_content[-self.pool_size :]
+        embeddings = self._get_sentence_embeddings([json.dumps(s) for s in kept])
+        with self._lock:
+            self.embeddings.clear()
+            for s, embedding in zip(kept, embeddings):
+                self.embeddings.append(embedding, s)
+            self._pool_version += 1
 
     # ------------------------------------------------------------------
     # Inspiration selection
     # ------------------------------------------------------------------
 
     def select_inspirations(self, current_inspiration_list: list[dict] | None = None) -> list[dict]:
-        if not self.embedding_list:
+        # Embed the queries before taking the pool lock, so chains do not
+        # queue behind each other's inference.
+        query_embeddings = None
+        if current_inspiration_list is not None:
+            queries = [
+                json.dumps({"Name": idea["Name"], "Definition": idea["Definition"]})
+                for idea in current_inspiration_list
+            ]
+            query_embeddings = self._get_sentence_embeddings(queries)
+        with self._lock:
+            return self._select_inspirations(query_embeddings)
+
+    def _select_inspirations(self, query_embeddings: list[np.ndarray] | None) -> list[dict]:
+        if not len(self.embeddings):
             return []
 
         embeddings_array, cluster_col, scaler = self._analyze_cluster()
 
-        if current_inspiration_list is not None:
+        if query_embeddings is not None:
             total_indices: list[int] = []
-            for idea in current_inspiration_list:
-                simplified = {"Name": idea["Name"], "Definition": idea["Definition"]}
-                emb = self._get_sentence_embedding(json.dumps(simplified))
+            for emb in query_embeddings:
                 indices = self._find_top_similar(embeddings_array, cluster_col, scaler, emb)
                 total_indices.extend(indices)
             total_indices = list(set(total_indices))
         else:
             total_indices = self._find_top_similar(embeddings_array, cluster_col, scaler)
 
-        pool_subset = [self.idea_pool[i] for i in total_indices]
+        pool_subset = [self.embeddings.item(slot) for slot in total_indices]
         rand_idx = np.random.permutation(len(pool_subset))
         rand_idx = rand_idx[: self.num_idea_to_return]
         return [pool_subset[i] for i in rand_idx]
@@ -125,29 +176,36 @@ class CoEvoSummarizer:
         parsed, response = self._prompt_till_valid(prompt_content)
         if parsed is None:
             return
-        for new_idea in parsed:
-            entry = {
-                "Name": new_idea["Name"],
-                "Definition": new_idea["Definition"],
-                "Example": new_idea["Example"],
-            }
-            self.embedding_list.append(self._get_sentence_embedding(json.dumps(entry)))
-            self.idea_pool.append(entry)
-
-        if len(self.embedding_list) > self.pool_size:
-            self.embedding_list = self.embedding_list[-self.pool_size :]
-            self.idea_pool = self.idea_pool[-self.pool_size :]
+        entries = [
+            {"Name": new_idea["Name"], "Definition": new_idea["Definition"], "Example": new_idea["Example"]}
+            for new_idea in parsed
+        ]
+        new_embeddings = self._get_sentence_embeddings([json.dumps(entry) for entry in entries])
+        with self._lock:
+            for entry, embedding in zip(entries, new_embeddings):
+                self.embeddings.append(embedding, entry)
+            if parsed:
+                self._pool_version += 1
 
     def _prompt_till_valid(self, prompt_content: str) -> tuple[list | None, str]:
         n_retry = 0
+        response_str = ""
         while True:
-            response_str, _usage = self.llm.get_response(prompt_content)
-            parsed, success = self._parse_response(response_str)
-            if success:
-                return parsed, response_str
+            retry_after = None
+            try:
+                response_str, _usage = self.llm.get_response(prompt_content)
+            except Exception as e:
+                failure = classify_failure(e)
+                retry_after = getattr(e, "retry_after", None)
+            else:
+                parsed, success = self._parse_response(response_str)
+                if success:
+                    return parsed, response_str
+                failure = FORMAT
             n_retry += 1
-            if n_retry > 3:
+            if failure == PERMANENT or n_retry > self.retry_policy.max_retry:
                 return None, response_str
+            time.sleep(self.retry_policy.delay(failure, n_retry - 1, retry_after))
 
     def _parse_response(self, response_str: str) -> tuple[list | None, bool]:
         try:
@@ -182,27 +240,39 @@ class CoEvoSummarizer:
         return parsed_inspirations, True
 
     def _analyze_cluster(self):
-        import torch
-        from scipy.spatial.distance import cdist
+        """Standardised embeddings, cluster labels and scaler of the current pool, by slot.
+
+        Cached per pool version: the pool only changes in ``load_summary``
+        and ``_prompt_parse_add``, while every init, offspring and continue
+        prompt selects inspirations.  Callers hold ``_lock`` and must not
+        modify the returned arrays.
+        """
+        cached = self._cluster_cache
+        if cached is not None and cached[0] == self._pool_version:
+            return cached[1]
+        state = self._fit_clusters()
+        self._cluster_cache = (self._pool_version, state)
+        return state
+
+    def _fit_clusters(self):
         from sklearn.cluster import DBSCAN
         from sklearn.preprocessing import StandardScaler
 
-        paragraph_embeddings = torch.stack(self.embedding_list)
-        embeddings_array = paragraph_embeddings.detach().cpu().numpy()
+        n_ideas = len(self.embeddings)
         scaler = StandardScaler()
-        embeddings_array = scaler.fit_transform(embeddings_array)
+        embeddings_array = scaler.fit_transform(self.embeddings.view())
 
-        if self.cluster_summary and len(self.embedding_list) > self.num_idea_to_return * 2:
-            min_sample = max(1, len(self.embedding_list) // self.num_idea_to_return // 2)
+        if self.cluster_summary and n_ideas > self.num_idea_to_return * 2:
+            min_sample = max(1, n_ideas // self.num_idea_to_return // 2)
             dbscan = DBSCAN(eps=0.6, min_samples=min_sample, metric="cosine")
             clusters = dbscan.fit_predict(embeddings_array)
             n_clusters = len(set(clusters)) - (1 if -1 in clusters else 0)
             if n_clusters == 0:
-                cluster_col = np.arange(len(self.embedding_list)).reshape(-1, 1)
+                cluster_col = np.arange(n_ideas).reshape(-1, 1)
             else:
                 cluster_col = clusters.reshape(-1, 1)
         else:
-            cluster_col = np.arange(len(self.embedding_list)).reshape(-1, 1)
+            cluster_col = np.arange(n_ideas).reshape(-1, 1)
 
         return embeddings_array, cluster_col, scaler
 
@@ -213,15 +283,15 @@ class CoEvoSummarizer:
         scaler,
         current_embedding=None,
     ) -> list[int]:
+        """Slots of the ideas closest to ``current_embedding`` (oldest first without one), one per cluster."""
         from scipy.spatial.distance import cdist
 
         if current_embedding is not None:
-            emb_np = current_embedding.detach().cpu().numpy()
-            standardized = scaler.transform(emb_np.reshape(1, -1))
+            standardized = scaler.transform(current_embedding.reshape(1, -1))
             distances = cdist(standardized, embeddings_array, "euclidean")
             sorted_indices = np.argsort(distances[0])
         else:
-            sorted_indices = np.arange(len(embeddings_array))
+            sorted_indices = self.embeddings.slot_order()
 
         top_indices: list[int] = []
         visited_clusters: list = []
@@ -235,12 +305,28 @@ class CoEvoSummarizer:
 
         return top_indices
 
-    def _get_sentence_embedding(self, sentence: str):
-        import torch
-
-        with torch.no_grad():
-            t_input = self.tokenizer_inst(sentence, return_tensors="pt")
-            t_input_dict = {k: v.to(self.device) for k, v in t_input.items()}
-            outputs = self.embedding_inst(**t_input_dict, output_hidden_states=True)
-            embedding = outputs.hidden_states[-1][0].mean(dim=0)
-        return embedding
+    def _get_sentence_embeddings(self, sentences: list[str]) -> list[np.ndarray]:
+        """Float32 embeddings of ``sentences``, in order.
+
+        Texts found in ``embedding_cache`` are not recomputed; the remaining
+        distinct texts are embedded in padded batches of
+        ``embedding_batch_size``.
+        """
+        embeddings: list = [None] * len(sentences)
+        missing: dict[str, list[int]] = {}
+        for i, sentence in enumerate(sentences):
+            cached = self.embedding_cache.get(self.model_id, sentence) if self.embedding_cache is not None else None
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                missing.setdefault(sentence, []).append(i)
+
+        texts = list(missing)
+        for start in range(0, len(texts), self.embedding_batch_size):
+            batch = texts[start : start + self.embedding_batch_size]
+            for sentence, embedding in zip(batch, self.embedding_backend.embed(batch)):
+                if self.embedding_cache is not None:
+                    embedding = self.embedding_cache.put(self.model_id, sentence, embedding)
+                for i in missing[sentence]:
+                    embeddings[i] = embedding
+        return embeddings
@@ -1,10 +1,12 @@
 from .bactgrow import BactGrowTask
+from .base import FittingTask
 from .oscillation_1 import Oscillation1Task
 from .oscillation_2 import Oscillation2Task
 from .stress_strain import StressStrainTask
 
 __all__ = [
     "BactGrowTask",
+    "FittingTask",
     "Oscillation1Task",
     "Oscillation2Task",
     "StressStrainTask",
@@ -0,0 +1,409 @@
+"""Shared evaluation for the equation-discovery tasks."""
+
+import hashlib
+import time
+import traceback
+import warnings
+
+import numpy as np
+
+from evotoolkit.core import EvaluationResult, Solution
+from evotoolkit.task.python_task import PythonTask
+
+from .dataset import ColumnarDataset
+from .fitting import DEFAULT_BOUNDS, N_PARAMS, fit_params, make_loss
+from .prescreen import ScreenResult, prescreen_equation
+
+
+class FittingTask(PythonTask):
+    """PythonTask that fits the 10 ``params`` of a candidate ``equation``.
+
+    Subclasses set the dataset columns and implement ``build_python_spec``;
+    the candidate is called as ``equation(*input_columns, params)`` and scored
+    by the fitted MSE against ``target_column``.
+
+    Parameters
+    ----------
+    dataset_dir:
+        Path to the task's CSV file.
+    timeout_seconds:
+        Evaluation time limit (default: ``default_timeout_seconds``).
+    optimizer:
+        Fitting backend from ``fitting.OPTIMIZERS`` (default:
+        ``default_optimizer`` of the task).
+    gradient:
+        BatchedGradient mode for the BFGS backends (``None`` = SciPy's own
+        finite differences).
+    racing:
+        Successive halving: when the solution carries a survival bar (see
+        ``evaluate``), fit first on stratified row subsamples of growing size
+        and stop as soon as the subsample MSE exceeds ``race_margin`` times the
+        bar.  Candidates that pass every rung get the usual full fit, so their
+        fitness is unchanged.
+    prescreen:
+        Check candidates with ``prescreen_equation`` before exec'ing them.
+        Rejected candidates get the screen's error; non-vectorised ones get
+        ``slow_code_time_factor`` of the time limit.
+    """
+
+    input_columns: tuple[str, ...] = ()
+    target_column: str = ""
+    default_timeout_seconds: float = 30.0
+    default_optimizer: str = "bfgs"
+    fit_bounds: tuple[float, float] = DEFAULT_BOUNDS
+    # Reject fits that finished but took longer than the time limit.
+    enforce_fit_timeout: bool = False
+    # How fit_params finds the params the candidate uses ("auto", "static", "off").
+    param_detection: str = "auto"
+    # Racing rungs are N / race_eta**k rows (k = ..., 2, 1), at least race_min_rows each.
+    race_eta: int = 4
+    race_min_rows: int = 500
+    race_margin: float = 2.0
+    # Fraction of the time limit left to candidates the pre-screen flags as non-vectorised.
+    slow_code_time_factor: float = 0.25
+    # Behavioural fingerprint: outputs on this many rows for the all-ones and
+    # all-minus-ones params plus fingerprint_random_params random vectors,
+    # rounded to fingerprint_digits significant digits.
+    fingerprint_rows: int = 64
+    fingerprint_random_params: int = 2
+    fingerprint_digits: int = 8
+
+    def __init__(
+        self,
+        dataset_dir: str,
+        timeout_seconds: float | None = None,
+        optimizer: str | None = None,
+        gradient: str | None = None,
+        racing: bool = False,
+        early_cutoff: bool = False,
+        warm_start: bool = False,
+        n_starts: int = 1,
+        prescreen: bool = True,
+    ):
+        self.dataset_dir = dataset_dir
+        self.optimizer = optimizer or self.default_optimizer
+        self.gradient = gradient
+        self.racing = racing
+        self.early_cutoff = early_cutoff
+        self.warm_start = warm_start
+        self.n_starts = n_starts
+        self.prescreen = prescreen
+        self._race_rows: list[np.ndarray] | None = None
+        self._fingerprint_probe: tuple[tuple, np.ndarray] | None = None
+        self.evaluate_data = ColumnarDataset(dataset_dir, [*self.input_columns, self.target_column])
+        if timeout_seconds is None:
+            timeout_seconds = self.default_timeout_seconds
+        super().__init__(data=None, timeout_seconds=timeout_seconds)
+
+    @property
+    def fit_key(self) -> str:
+        """Identifies the fitting setup in cache keys.
+
+        ``""`` for plain BFGS with SciPy's gradient from the default start.
+        """
+        key = "" if self.optimizer == "bfgs" else self.optimizer
+        if self.gradient is not None:
+            key += f"+{self.gradient}-gradient"
+        if self.warm_start:
+            key += "+warm"
+        if self.n_starts > 1:
+            key += f"+{self.n_starts}starts"
+        return key.lstrip("+")
+
+    def screen(self, candidate_code: str) -> ScreenResult:
+        """Static pre-screen of ``candidate_code`` (always passes with ``prescreen=False``)."""
+        if not self.prescreen:
+            return ScreenResult()
+        return prescreen_equation(candidate_code, len(self.input_columns))
+
+    def time_limit(self, screen: ScreenResult) -> float:
+        """Time limit for a candidate that got ``screen`` from the pre-screen."""
+        if screen.vectorised:
+            return self.timeout_seconds
+        return self.timeout_seconds * self.slow_code_time_factor
+
+    def fingerprint(self, candidate_code: str) -> str | None:
+        """Hash of what ``equation`` computes; ``None`` if it fails or is not finite on the probe.
+
+        The candidate is run on ``fingerprint_rows`` fixed rows with the
+        default start (all ones), its negation and fixed random param
+        vectors, so every parameter is probed with both signs; the outputs,
+        rounded to ``fingerprint_digits`` significant digits, are hashed.
+        Code that computes the same function (reordered terms, renamed
+        temporaries, ``x*x`` for ``np.power(x, 2)``) gets the same
+        fingerprint.  A finite probe cannot prove equivalence, so a match
+        should only replace the fit once its params are checked on the
+        candidate (``evaluate_with_params``), and otherwise seed it
+        (``eval_hints["fingerprint_start"]``).
+        """
+        if self._fingerprint_probe is None:
+            rows = np.linspace(0, self.evaluate_data.n_rows - 1, self.fingerprint_rows).astype(int)
+            inputs = tuple(np.array(self.evaluate_data[name][rows]) for name in self.input_columns)
+            rng = np.random.default_rng(0)
+            params = np.vstack(
+                [
+                    np.ones(N_PARAMS),
+                    -np.ones(N_PARAMS),
+                    rng.uniform(-2.0, 2.0, (self.fingerprint_random_params, N_PARAMS)),
+                ]
+            )
+            self._fingerprint_probe = (inputs, params)
+        inputs, params = self._fingerprint_probe
+
+        try:
+            with warnings.catch_warnings(), np.errstate(all="ignore"):
+                warnings.simplefilter("ignore")
+                namespace: dict = {}
+                exec(candidate_code, namespace)  # noqa: S102
+                equation_fn = namespace["equation"]
+                outputs = np.stack(
+                    [
+                        np.broadcast_to(np.asarray(equation_fn(*inputs, p.copy()), dtype=float), inputs[0].shape)
+                        for p in params
+                    ]
+                )
+        except Exception:
+            return None
+
+        # Non-finite outputs say little about the fitted function; evaluate those in full.
+        if not np.all(np.isfinite(outputs)):
+            return None
+        magnitude = np.floor(np.log10(np.abs(outputs), out=np.zeros_like(outputs), where=outputs != 0))
+        scale = 10.0 ** (magnitude - (self.fingerprint_digits - 1))
+        # + 0.0 maps -0.0 to 0.0.
+        rounded = np.round(outputs / scale) * scale + 0.0
+        return hashlib.sha256(rounded.tobytes()).hexdigest()
+
+    def evaluate_with_params(self, candidate_code: str, params: list[float]) -> EvaluationResult:
+        """Score ``candidate_code`` with fixed ``params`` (e.g. fitted on the train split) without fitting."""
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                namespace: dict = {}
+                exec(candidate_code, namespace)  # noqa: S102
+                inputs = tuple(self.evaluate_data[name] for name in self.input_columns)
+                target = self.evaluate_data[self.target_column]
+                mse = float(make_loss(namespace["equation"], inputs, target)(np.asarray(params, dtype=float)))
+        except Exception as e:
+            return EvaluationResult(valid=False, score=float("-inf"), additional_info={"error": str(e)})
+
+        if np.isnan(mse) or np.isinf(mse):
+            return EvaluationResult(
+                valid=False,
+                score=float("-inf"),
+                additional_info={"error": "residual error is NaN or inf"},
+            )
+        return EvaluationResult(valid=True, score=-mse, additional_info={"mse": mse, "params": list(params)})
+
+    def evaluate(self, solution: Solution) -> EvaluationResult:
+        """Evaluate ``solution`` using its ``metadata.extras["eval_hints"]``.
+
+        Hints:
+
+        - ``survival_bar``: the worst ``fitness_list[0]`` still retained by the
+          population, i.e. the MSE a candidate must beat to survive selection.
+        - ``warm_starts``: fitted params of the solutions the candidate was
+          derived from (used with ``warm_start``).
+        - ``fingerprint_start``: fitted params of an earlier candidate with
+          the same ``fingerprint``; always fitted from first.
+        - ``screen``: ``vectorised`` and ``reasons`` of a pre-screen the
+          caller already passed the candidate through.
+
+        Without a ``screen`` hint, the candidate is pre-screened first (see
+        ``screen``).
+        """
+        hints = solution.metadata.extras.get("eval_hints") or {}
+        if hints.get("screen") is not None:
+            screen = ScreenResult(**hints["screen"])
+        else:
+            screen = self.screen(solution.sol_string)
+        if screen.error is not None:
+            return EvaluationResult(valid=False, score=float("-inf"), additional_info={"error": screen.error})
+        starts = list(hints.get("warm_starts") or []) if self.warm_start else []
+        if hints.get("fingerprint_start") is not None:
+            starts.insert(0, hints["fingerprint_start"])
+        try:
+            res = self._evaluate_code_impl(
+                solution.sol_string,
+                survival_bar=hints.get("survival_bar"),
+                warm_starts=starts or None,
+                time_limit=self.time_limit(screen),
+            )
+            if not screen.vectorised and res.additional_info is not None:
+                res.additional_info["not_vectorised"] = screen.reasons
+            return res
+        except Exception as e:
+            return EvaluationResult(
+                valid=False,
+                score=float("-inf"),
+                additional_info={
+                    "error": f"Evaluation error: {str(e)}",
+                    "traceback": traceback.format_exc(),
+                },
+            )
+
+    def _fit(self, equation_fn, candidate_code: str, inputs: tuple, target: np.ndarray, **kwargs):
+        return fit_params(
+            equation_fn,
+            inputs,
+            target,
+            optimizer=self.optimizer,
+            gradient=self.gradient,
+            bounds=self.fit_bounds,
+            candidate_code=candidate_code,
+            param_detection=self.param_detection,
+            n_starts=self.n_starts,
+            **kwargs,
+        )
+
+    def race_rows(self) -> list[np.ndarray]:
+        """Row indices of each racing rung, smallest first.
+
+        Rows are spread evenly over the target's sorted order, so every rung
+        covers the whole range of the target.
+        """
+        if self._race_rows is None:
+            target = np.asarray(self.evaluate_data[self.target_column])
+            order = np.argsort(target, kind="stable")
+            n_rows = len(target)
+            rungs = []
+            size = n_rows // self.race_eta
+            while size >= self.race_min_rows:
+                positions = ((np.arange(size) + 0.5) * n_rows / size).astype(int)
+                rungs.append(np.sort(order[positions]))
+                size //= self.race_eta
+            self._race_rows = rungs[::-1]
+        return self._race_rows
+
+    def _race(
+        self,
+        equation_fn,
+        candidate_code: str,
+        inputs: tuple,
+        target: np.ndarray,
+        survival_bar: float,
+        warm_starts: list | None = None,
+    ) -> EvaluationResult | None:
+        """Fit on the racing rungs; a result if the candidate was culled, else ``None``."""
+        start_time = time.time()
+        nfev = 0
+        for rows in self.race_rows():
+            result = self._fit(
+                equation_fn, candidate_code, tuple(x[rows] for x in inputs), target[rows], starts=warm_starts
+            )
+            mse = float(result.fun)
+            nfev += int(result.nfev)
+            # A non-finite subsample fit says nothing about the full fit; promote it.
+            if not np.isfinite(mse) or mse <= self.race_margin * survival_bar:
+                continue
+
+            elapsed = time.time() - start_time
+            fitness_string = (
+                f"The residual error between the output and the ground truth is {mse} "
+                f"(estimated on {len(rows)} of {len(target)} rows)"
+            )
+            return EvaluationResult(
+                valid=True,
+                score=-mse,
+                additional_info={
+                    "mse": mse,
+                    "time": elapsed,
+                    "fitness_list": [mse, elapsed],
+                    "fitness_string": fitness_string,
+                    "params": result.x.tolist(),
+                    "optimizer": self.optimizer,
+                    "nfev": nfev,
+                    "active_params": result.active_params,
+                    "dominated": True,
+                    "truncated": f"raced on {len(rows)} of {len(target)} rows against survival bar {survival_bar}",
+                },
+            )
+        return None
+
+    def _evaluate_code_impl(
+        self,
+        candidate_code: str,
+        survival_bar: float | None = None,
+        warm_starts: list | None = None,
+        time_limit: float | None = None,
+    ) -> EvaluationResult:
+        if time_limit is None:
+            time_limit = self.timeout_seconds
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                namespace: dict = {}
+                exec(candidate_code, namespace)  # noqa: S102
+                equation_fn = namespace["equation"]
+
+                inputs = tuple(self.evaluate_data[name] for name in self.input_columns)
+                target = self.evaluate_data[self.target_column]
+
+                race_time = 0.0
+                if self.racing and survival_bar is not None:
+                    race_start = time.time()
+                    culled = self._race(equation_fn, candidate_code, inputs, target, survival_bar, warm_starts)
+                    if culled is not None:
+                        return culled
+                    race_time = time.time() - race_start
+
+                cutoff = {}
+                if self.early_cutoff and survival_bar is not None:
+                    cutoff = {"survival_bar": survival_bar, "time_budget": time_limit - race_time}
+
+                start_time = time.time()
+                result = self._fit(equation_fn, candidate_code, inputs, target, starts=warm_starts, **cutoff)
+                mse = float(result.fun)
+                elapsed = time.time() - start_time
+
+                if np.isnan(mse) or np.isinf(mse):
+                    return EvaluationResult(
+                        valid=False,
+                        score=float("-inf"),
+                        additional_info={"error": "residual error is NaN or inf"},
+                    )
+
+                if self.enforce_fit_timeout and elapsed >= self.timeout_seconds:
+                    return EvaluationResult(
+                        valid=False,
+                        score=float("-inf"),
+                        additional_info={"error": "Fitting time out. Invalid solution.", "timed_out": True},
+                    )
+                if time_limit < self.timeout_seconds and elapsed >= time_limit:
+                    return EvaluationResult(
+                        valid=False,
+                        score=float("-inf"),
+                        additional_info={
+                            "error": (
+                                f"Fitting took {elapsed:.1f}s, over the {time_limit:.1f}s limit for "
+                                "non-vectorised code. Replace Python loops with numpy array operations."
+                            ),
+                            "timed_out": True,
+                        },
+                    )
+
+                fitness_string = f"The residual error between the output and the ground truth is {mse}"
+                additional_info = {
+                    "mse": mse,
+                    "time": elapsed,
+                    "fitness_list": [mse, elapsed],
+                    "fitness_string": fitness_string,
+                    "params": result.x.tolist(),
+                    "optimizer": self.optimizer,
+                    "nfev": int(result.nfev),
+                    "active_params": result.active_params,
+                    "race_time": race_time,
+                    "start_index": result.start_index,
+                    "n_starts": result.n_starts,
+                }
+                if result.truncated:
+                    additional_info["fitness_string"] += " (fit stopped early, not converged)"
+                    additional_info["dominated"] = True
+                    additional_info["truncated"] = result.truncated
+                return EvaluationResult(valid=True, score=-mse, additional_info=additional_info)
+        except Exception as e:
+            return EvaluationResult(
+                valid=False,
+                score=float("-inf"),
+                additional_info={"error": str(e)},
+            )
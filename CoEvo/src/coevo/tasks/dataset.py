@@ -0,0 +1,118 @@
+"""Memory-mapped columnar datasets for the task evaluators.
+
+``ColumnarDataset`` converts ``data/<task>/<split>.csv`` once into one
+``.npy`` file per column (float64, C-contiguous) under
+``data/<task>/.columnar/<split>/`` and memory-maps them read-only.  Later
+loads, and every evaluation worker process, map the same files instead of
+parsing the CSV, so all processes share one physical copy through the page
+cache.  Pickling a dataset only transfers the paths.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Mapping
+
+import numpy as np
+
+_META_FILE = "meta.json"
+
+
+def _source_stamp(csv_path: str) -> dict:
+    stat = os.stat(csv_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+class ColumnarDataset(Mapping):
+    """Read-only mapping of column name to a memory-mapped float64 array.
+
+    Parameters
+    ----------
+    csv_path:
+        Source CSV file.
+    columns:
+        Names given to the CSV columns, in file order (the CSV header is
+        ignored, as the tasks rename columns anyway).
+    cache_dir:
+        Directory holding the converted columns.  Defaults to
+        ``<csv dir>/.columnar/<csv stem>``.  Rebuilt whenever the CSV's size
+        or modification time changes.
+    """
+
+    def __init__(self, csv_path: str, columns: list[str], cache_dir: str | None = None) -> None:
+        self.csv_path = os.path.abspath(csv_path)
+        self.columns = list(columns)
+        if cache_dir is None:
+            stem = os.path.splitext(os.path.basename(self.csv_path))[0]
+            cache_dir = os.path.join(os.path.dirname(self.csv_path), ".columnar", stem)
+        self.cache_dir = cache_dir
+
+        if not self._cache_is_fresh():
+            self._convert()
+        self._arrays = self._map()
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self._arrays[column]
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self._arrays[self.columns[0]])
+
+    def __getstate__(self) -> dict:
+        return {"csv_path": self.csv_path, "columns": self.columns, "cache_dir": self.cache_dir}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if not self._cache_is_fresh():
+            self._convert()
+        self._arrays = self._map()
+
+    def _cache_is_fresh(self) -> bool:
+        try:
+            with open(os.path.join(self.cache_dir, _META_FILE)) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return meta.get("source") == _source_stamp(self.csv_path) and meta.get("columns") == self.columns
+
+    def _convert(self) -> None:
+        import pandas as pd
+
+        data = pd.read_csv(self.csv_path)
+        if len(data.columns) != len(self.columns):
+            raise ValueError(f"{self.csv_path} has {len(data.columns)} columns, expected {self.columns}")
+
+        parent = os.path.dirname(self.cache_dir)
+        os.makedirs(parent, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+        try:
+            for name, source in zip(self.columns, data.columns):
+                values = np.ascontiguousarray(data[source].to_numpy(dtype=np.float64))
+                np.save(os.path.join(tmp_dir, f"{name}.npy"), values)
+            with open(os.path.join(tmp_dir, _META_FILE), "w") as f:
+                json.dump({"source": _source_stamp(self.csv_path), "columns": self.columns, "n_rows": len(data)}, f)
+
+            # Swap in atomically; a concurrent writer may have won the race.
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            try:
+                os.replace(tmp_dir, self.cache_dir)
+            except OSError:
+                if not self._cache_is_fresh():
+                    raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _map(self) -> dict[str, np.ndarray]:
+        return {
+            name: np.load(os.path.join(self.cache_dir, f"{name}.npy"), mmap_mode="r")
+            for name in self.columns
+        }
@@ -0,0 +1,657 @@
+"""Shared parameter fitting for the equation-discovery tasks.
+
+Every task fits the 10 ``params`` of a candidate ``equation(*inputs, params)``
+by minimising the mean squared error against the target column.
+"""
+
+from __future__ import annotations
+
+import ast
+import concurrent.futures
+import threading
+import time
+from typing import Callable, Sequence
+
+import numpy as np
+from scipy.optimize import Bounds, OptimizeResult, least_squares, minimize
+
+N_PARAMS = 10
+_EPSILON = np.sqrt(np.finfo(float).eps)  # SciPy's default BFGS finite-difference step
+
+GRADIENT_MODES = ("auto", "stack", "threads", "complex")
+
+
+def make_loss(equation_fn: Callable, inputs: Sequence[np.ndarray], target: np.ndarray) -> Callable:
+    def loss(params):
+        y_pred = equation_fn(*inputs, params)
+        return np.mean((y_pred - target) ** 2)
+
+    return loss
+
+
+class BatchedGradient:
+    """Forward-difference gradient of the MSE loss, evaluated in one batch.
+
+    Uses the same steps and formula as SciPy's default BFGS gradient, but
+    computes the base point and all ``n`` perturbed parameter vectors
+    together:
+
+    - ``stack``: one ``equation`` call with ``params`` of shape ``(n, n + 1, 1)``,
+      so ``params[i]`` broadcasts against the ``(N,)`` inputs to give an
+      ``(n + 1, N)`` prediction.  Only valid for equations that broadcast over
+      a leading batch axis; checked once against per-vector calls.
+    - ``threads``: the ``n + 1`` vectors are evaluated on a thread pool.
+    - ``complex``: complex-step derivative (exact to rounding, ``n`` calls);
+      checked once against finite differences since ``abs``/comparisons break it.
+    - ``auto``: ``stack`` if the check passes, otherwise ``threads``.
+    """
+
+    def __init__(
+        self,
+        equation_fn: Callable,
+        inputs: Sequence[np.ndarray],
+        target: np.ndarray,
+        mode: str = "auto",
+        *,
+        max_workers: int | None = None,
+    ) -> None:
+        if mode not in GRADIENT_MODES:
+            raise ValueError(f"Unknown gradient mode: {mode}")
+        self.equation_fn = equation_fn
+        self.inputs = inputs
+        self.target = target
+        self.mode = mode
+        self.max_workers = max_workers
+        self._resolved = False
+        self._loss = make_loss(equation_fn, inputs, target)
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+
+    def __call__(self, params: np.ndarray) -> np.ndarray:
+        params = np.asarray(params, dtype=float)
+        if not self._resolved and self.mode != "threads":
+            self._resolve_mode(params)
+
+        if self.mode == "complex":
+            return self._complex_step(params)
+        points, dx = self._points(params)
+        losses = self._stacked_losses(points) if self.mode == "stack" else self._threaded_losses(points)
+        return (losses[1:] - losses[0]) / dx
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @staticmethod
+    def _points(params: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Base point followed by one forward step per parameter."""
+        h = np.full_like(params, _EPSILON)
+        points = np.tile(params, (len(params) + 1, 1))
+        points[np.arange(1, len(params) + 1), np.arange(len(params))] += h
+        dx = (params + h) - params
+        return points, dx
+
+    def _stacked_losses(self, points: np.ndarray) -> np.ndarray:
+        y_pred = self.equation_fn(*self.inputs, points.T[:, :, None])
+        return np.mean((y_pred - self.target) ** 2, axis=-1).reshape(len(points))
+
+    def _threaded_losses(self, points: np.ndarray) -> np.ndarray:
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        return np.array(list(self._executor.map(self._loss, points)), dtype=float)
+
+    def _complex_step(self, params: np.ndarray) -> np.ndarray:
+        h = 1e-20
+        grad = np.empty(len(params))
+        for i in range(len(params)):
+            p = params.astype(complex)
+            p[i] += 1j * h
+            y_pred = self.equation_fn(*self.inputs, p)
+            grad[i] = np.mean((y_pred - self.target) ** 2).imag / h
+        return grad
+
+    def _resolve_mode(self, params: np.ndarray) -> None:
+        """Check ``stack``/``complex`` against per-vector calls at the first point."""
+        points, dx = self._points(params)
+        reference = np.array([self._loss(p) for p in points], dtype=float)
+
+        try:
+            if self.mode == "complex":
+                fd_grad = (reference[1:] - reference[0]) / dx
+                ok = np.allclose(self._complex_step(params), fd_grad, rtol=1e-3, atol=1e-6)
+            else:
+                stacked = self._stacked_losses(points)
+                ok = np.allclose(stacked, reference, rtol=1e-10, atol=0.0, equal_nan=True)
+        except Exception:
+            ok = False
+
+        if not ok:
+            self.mode = "threads"
+        elif self.mode == "auto":
+            self.mode = "stack"
+        self._resolved = True
+
+
+class VariableProjection:
+    """Fit by solving the linearly-entering ``params`` exactly.
+
+    For a skeleton ``y = A(p_nl) @ p_lin + b(p_nl)`` the linear parameters
+    are found by ``lstsq`` for every trial of the nonlinear ones, and BFGS only
+    searches over ``p_nl``.  Linearity is detected by probing the equation on
+    a row subsample: second differences along each parameter must vanish, and
+    mixed differences between accepted linear parameters must too (so
+    ``params[0] * params[1] * x`` keeps only one of them linear).  Parameters
+    that do not change the output stay in the nonlinear set.
+
+    ``fit`` returns ``None`` when no linear parameter was found or probing
+    failed, so the caller can fall back to plain BFGS.
+    """
+
+    def __init__(
+        self,
+        equation_fn: Callable,
+        inputs: Sequence[np.ndarray],
+        target: np.ndarray,
+        *,
+        n_params: int = N_PARAMS,
+        probe_rows: int = 256,
+        seed: int = 0,
+    ) -> None:
+        self.equation_fn = equation_fn
+        self.inputs = inputs
+        self.target = np.asarray(target, dtype=float)
+        self.probe_rows = probe_rows
+        self.seed = seed
+        self.n_params = n_params
+        self.linear: list[int] = []
+        self.nonlinear: list[int] = list(range(self.n_params))
+        self._stack = False
+
+    def detect(self) -> bool:
+        n_rows = len(self.target)
+        rows = np.unique(np.linspace(0, n_rows - 1, min(n_rows, self.probe_rows)).astype(int))
+        probe = tuple(np.asarray(x)[rows] for x in self.inputs)
+        eye = np.eye(self.n_params)
+
+        def f(p):
+            return np.broadcast_to(np.asarray(self.equation_fn(*probe, p), dtype=float), (len(rows),))
+
+        def same(a, b):
+            scale = 1.0 + max(np.max(np.abs(a)), np.max(np.abs(b)))
+            finite = np.all(np.isfinite(a)) and np.all(np.isfinite(b))
+            return bool(finite and np.allclose(a, b, rtol=1e-7, atol=1e-9 * scale))
+
+        try:
+            rng = np.random.default_rng(self.seed)
+            bases = 1.0 + rng.uniform(-0.5, 0.5, size=(2, self.n_params))
+            linear = np.ones(self.n_params, dtype=bool)
+            active = np.zeros(self.n_params, dtype=bool)
+            first_diff = []
+            for base in bases:
+                f0 = f(base)
+                diffs = []
+                for j in range(self.n_params):
+                    f1 = f(base + eye[j])
+                    d1 = f1 - f0
+                    linear[j] &= same(d1, f(base + 2 * eye[j]) - f1)
+                    active[j] |= bool(np.any(d1 != 0))
+                    diffs.append(d1)
+                first_diff.append((f0, diffs))
+
+            accepted: list[int] = []
+            for j in np.flatnonzero(linear & active):
+                if all(
+                    same(f(base + eye[i] + eye[j]) - f(base + eye[i]), diffs[j])
+                    for base, (_, diffs) in zip(bases, first_diff)
+                    for i in accepted
+                ):
+                    accepted.append(int(j))
+        except Exception:
+            return False
+        if not accepted:
+            return False
+
+        self.linear = accepted
+        self.nonlinear = [j for j in range(self.n_params) if j not in accepted]
+
+        # Stack the design-matrix evaluations into one call if the candidate broadcasts.
+        points = self._points(bases[0][self.nonlinear])
+        try:
+            stacked = np.broadcast_to(self.equation_fn(*probe, points.T[:, :, None]), (len(points), len(rows)))
+            self._stack = bool(np.allclose(stacked, [f(p) for p in points], rtol=1e-10, atol=0.0, equal_nan=True))
+        except Exception:
+            self._stack = False
+        return True
+
+    def _points(self, p_nl: np.ndarray) -> np.ndarray:
+        """Parameter vectors for ``b`` (linear part zero) and each column of ``A``."""
+        points = np.zeros((len(self.linear) + 1, self.n_params))
+        points[:, self.nonlinear] = p_nl
+        points[np.arange(1, len(self.linear) + 1), self.linear] = 1.0
+        return points
+
+    def _predictions(self, points: np.ndarray) -> np.ndarray:
+        shape = (len(points), len(self.target))
+        if self._stack:
+            return np.broadcast_to(self.equation_fn(*self.inputs, points.T[:, :, None]), shape)
+        return np.array([np.broadcast_to(self.equation_fn(*self.inputs, p), shape[1:]) for p in points], dtype=float)
+
+    def solve_linear(self, p_nl: np.ndarray) -> tuple[np.ndarray, float]:
+        """Best full parameter vector for fixed ``p_nl``, and its projected MSE."""
+        points = self._points(p_nl)
+        y = self._predictions(points)
+        b = y[0]
+        design = (y[1:] - b).T
+        if not (np.all(np.isfinite(design)) and np.all(np.isfinite(b))):
+            return points[0], float("inf")
+        coef = np.linalg.lstsq(design, self.target - b, rcond=None)[0]
+        params = points[0].copy()
+        params[self.linear] = coef
+        return params, float(np.mean((design @ coef + b - self.target) ** 2))
+
+    def fit(self, x0: np.ndarray | None = None, callback: Callable | None = None) -> OptimizeResult | None:
+        if not self.detect():
+            return None
+
+        p_nl0 = np.array([1.0] * len(self.nonlinear)) if x0 is None else np.asarray(x0, dtype=float)[self.nonlinear]
+        if self.nonlinear:
+            outer = minimize(lambda p_nl: self.solve_linear(p_nl)[1], p_nl0, method="BFGS", callback=callback)
+            p_nl, nit, message = outer.x, outer.nit, outer.message
+        else:
+            p_nl, nit, message = p_nl0, 0, "All parameters are linear."
+        params, _ = self.solve_linear(p_nl)
+
+        # Report the equation's own MSE at the solution, not the projected one.
+        fun = make_loss(self.equation_fn, self.inputs, self.target)(params)
+        return OptimizeResult(
+            x=params,
+            fun=fun,
+            success=bool(np.isfinite(fun)),
+            message=message,
+            nit=nit,
+            linear_params=list(self.linear),
+        )
+
+
+class CountingEquation:
+    """Wraps ``equation`` and counts the parameter vectors it was evaluated at.
+
+    A stacked call with ``params`` of shape ``(n, K, 1)`` counts as ``K``.
+    """
+
+    def __init__(self, equation_fn: Callable) -> None:
+        self.equation_fn = equation_fn
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args):
+        params = args[-1]
+        with self._lock:
+            self.count += np.shape(params)[1] if np.ndim(params) > 1 else 1
+        return self.equation_fn(*args)
+
+
+def static_active_params(candidate_code: str, n_params: int = N_PARAMS) -> list[int] | None:
+    """``params`` indices read by ``equation``, from its source.
+
+    Handles constant indices (``params[3]``, ``params[-1]``) and constant
+    slices (``params[:4]``).  Returns ``None`` when ``params`` is used any
+    other way (variable index, passed to a helper, unpacked, rebound), or
+    when an index is out of range.
+    """
+    try:
+        tree = ast.parse(candidate_code)
+    except SyntaxError:
+        return None
+    func = next((n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == "equation"), None)
+    if func is None or not func.args.args:
+        return None
+    name = func.args.args[-1].arg
+
+    def constant(node):
+        if isinstance(node, ast.Constant) and type(node.value) is int:
+            return node.value
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+            return -node.operand.value if type(node.operand.value) is int else None
+        return None
+
+    indexed: set[int] = set()
+    subscripted: set[int] = set()
+    for node in ast.walk(func):
+        if not isinstance(node, ast.Subscript) or not isinstance(node.value, ast.Name) or node.value.id != name:
+            continue
+        if isinstance(node.slice, ast.Slice):
+            if node.slice.step is not None:
+                return None
+            lower = 0 if node.slice.lower is None else constant(node.slice.lower)
+            upper = n_params if node.slice.upper is None else constant(node.slice.upper)
+            if lower is None or upper is None:
+                return None
+            indexed.update(range(n_params)[lower:upper])
+        else:
+            index = constant(node.slice)
+            if index is None or not -n_params <= index < n_params:
+                return None
+            indexed.add(index % n_params)
+        subscripted.add(id(node.value))
+
+    for node in ast.walk(func):
+        if isinstance(node, ast.Name) and node.id == name and id(node) not in subscripted:
+            return None
+    return sorted(indexed)
+
+
+def dynamic_active_params(
+    equation_fn: Callable,
+    inputs: Sequence[np.ndarray],
+    n_params: int = N_PARAMS,
+    *,
+    probe_rows: int = 256,
+    seed: int = 0,
+) -> list[int]:
+    """``params`` indices whose perturbation changes the output on a row subsample.
+
+    Each index is perturbed up and down at three base points, so a parameter
+    is only dropped if the output never moved.  Returns all indices if the
+    equation fails on the probe.
+    """
+    n_rows = len(inputs[0])
+    rows = np.unique(np.linspace(0, n_rows - 1, min(n_rows, probe_rows)).astype(int))
+    probe = tuple(np.asarray(x)[rows] for x in inputs)
+    rng = np.random.default_rng(seed)
+    bases = np.vstack([np.ones(n_params), 1.0 + rng.uniform(-0.5, 0.5, size=(2, n_params))])
+    active = np.zeros(n_params, dtype=bool)
+    try:
+        for base in bases:
+            y0 = np.asarray(equation_fn(*probe, base), dtype=float)
+            for j in np.flatnonzero(~active):
+                for delta in (0.5, -1.5):
+                    p = base.copy()
+                    p[j] += delta
+                    if not np.array_equal(np.asarray(equation_fn(*probe, p), dtype=float), y0, equal_nan=True):
+                        active[j] = True
+                        break
+    except Exception:
+        return list(range(n_params))
+    return [int(j) for j in np.flatnonzero(active)]
+
+
+class ReducedEquation:
+    """``equation`` over the active ``params`` only, the rest held at ``fill``.
+
+    Stacked ``(n_active, K, 1)`` params (see BatchedGradient) are expanded to
+    ``(n, K, 1)``.
+    """
+
+    def __init__(self, equation_fn: Callable, active: list[int], fill: np.ndarray) -> None:
+        self.equation_fn = equation_fn
+        self.active = active
+        self.fill = np.asarray(fill, dtype=float)
+
+    def expand(self, reduced: np.ndarray) -> np.ndarray:
+        reduced = np.asarray(reduced)
+        full = np.empty((len(self.fill),) + reduced.shape[1:], dtype=np.result_type(reduced, float))
+        full[...] = self.fill.reshape((-1,) + (1,) * (reduced.ndim - 1))
+        full[self.active] = reduced
+        return full
+
+    def __call__(self, *args):
+        return self.equation_fn(*args[:-1], self.expand(args[-1]))
+
+
+def _fit_bfgs(equation_fn, inputs, target, x0, *, gradient=None, bounds=None, callback=None) -> OptimizeResult:
+    loss = make_loss(equation_fn, inputs, target)
+    method = "BFGS"
+    if bounds is not None:
+        method, bounds = "L-BFGS-B", Bounds(*bounds)
+    if gradient is None:
+        return minimize(loss, x0, method=method, bounds=bounds, callback=callback)
+
+    jac = BatchedGradient(equation_fn, inputs, target, gradient)
+    try:
+        return minimize(loss, x0, method=method, jac=jac, bounds=bounds, callback=callback)
+    finally:
+        jac.close()
+
+
+def _fit_least_squares(equation_fn, inputs, target, x0, *, method, bounds=None, callback=None) -> OptimizeResult:
+    # least_squares ignores callbacks with method="lm" (and before SciPy 1.16
+    # altogether), so the callback is run from the residual function instead:
+    # once per len(x0) + 1 evaluations (a step and its finite-difference
+    # Jacobian), with the best point seen so far.
+    # SciPy can swallow an exception raised during a Jacobian evaluation, so
+    # once stopped every later call raises again.
+    best = OptimizeResult(x=np.asarray(x0, dtype=float), fun=np.inf)
+    n_calls = 0
+    stopped = False
+
+    def residuals(params):
+        nonlocal n_calls, stopped
+        if stopped:
+            raise StopIteration
+        residual = np.broadcast_to(equation_fn(*inputs, params) - target, target.shape)
+        if callback is not None:
+            mse = float(np.mean(residual**2))
+            if mse < best.fun:
+                best.x, best.fun = np.array(params, dtype=float), mse
+            n_calls += 1
+            if n_calls % (len(x0) + 1) == 0:
+                try:
+                    callback(OptimizeResult(x=best.x, fun=best.fun))
+                except StopIteration:
+                    stopped = True
+                    raise
+        return residual
+
+    if bounds is None:
+        bounds = (-np.inf, np.inf)
+    try:
+        result = least_squares(residuals, x0, method=method, bounds=bounds)
+    except StopIteration:
+        return OptimizeResult(
+            x=best.x, fun=best.fun, success=False, message="Stopped by the callback.", nfev=n_calls
+        )
+    result.fun = np.mean(result.fun**2)
+    return result
+
+
+def _fit_varpro(equation_fn, inputs, target, x0, *, gradient=None, callback=None) -> OptimizeResult:
+    result = VariableProjection(equation_fn, inputs, target, n_params=len(x0)).fit(x0, callback)
+    if result is None:
+        return _fit_bfgs(equation_fn, inputs, target, x0, gradient=gradient, callback=callback)
+    return result
+
+
+class DominanceCutoff:
+    """Optimizer callback that stops a fit which cannot get below ``bar``.
+
+    Once the fit has run ``patience`` iterations, its best MSE is
+    extrapolated log-linearly from the improvement over the last
+    ``patience`` iterations, ``safety`` times faster than observed, over the
+    iterations still available (the smaller of ``max_iter`` and what fits in
+    ``time_budget``).  If that projection still ends above the bar,
+    ``StopIteration`` ends the fit and ``reason`` says why.  Fits that sit on
+    a plateau only briefly are not cut, since the window spans their descent.
+
+    Accepts an ``intermediate_result`` whose ``fun`` is the MSE (as from
+    ``minimize``) or the residual vector.
+    """
+
+    def __init__(
+        self,
+        bar: float,
+        *,
+        time_budget: float = float("inf"),
+        max_iter: int | None = None,
+        patience: int = 20,
+        safety: float = 2.0,
+    ) -> None:
+        self.bar = bar
+        self.deadline = time.monotonic() + time_budget
+        self.max_iter = max_iter
+        self.patience = patience
+        self.safety = safety
+        self.reason: str | None = None
+        self._start = time.monotonic()
+        self._best: list[float] = []
+
+    def __call__(self, intermediate_result: OptimizeResult) -> None:
+        value = np.asarray(intermediate_result.fun, dtype=float)
+        mse = float(np.mean(value**2)) if value.ndim else float(value)
+        self._best.append(min(mse, self._best[-1]) if self._best else mse)
+
+        current = self._best[-1]
+        n_iter = len(self._best)
+        if n_iter <= self.patience or not np.isfinite(current) or current <= self.bar:
+            return
+
+        now = time.monotonic()
+        remaining = max(self.deadline - now, 0.0) / max((now - self._start) / n_iter, 1e-9)
+        if self.max_iter is not None:
+            remaining = min(remaining, self.max_iter - n_iter)
+        previous = self._best[-1 - self.patience]
+        rate = np.log(previous / current) / self.patience if current > 0 else float("inf")
+        projected = current * np.exp(-self.safety * rate * max(remaining, 0.0))
+        if projected > self.bar:
+            self.reason = (
+                f"optimizer stopped after {n_iter} iterations: projected MSE {projected} "
+                f"cannot beat survival bar {self.bar}"
+            )
+            raise StopIteration
+
+
+# name -> (fit function, fixed options, takes bounds, takes a gradient mode)
+OPTIMIZERS: dict[str, tuple[Callable, dict, bool, bool]] = {
+    "bfgs": (_fit_bfgs, {}, False, True),
+    "lbfgsb": (_fit_bfgs, {}, True, True),
+    "varpro": (_fit_varpro, {}, False, True),
+    "lm": (_fit_least_squares, {"method": "lm"}, False, False),
+    "trf": (_fit_least_squares, {"method": "trf"}, True, False),
+}
+DEFAULT_BOUNDS = (-1e3, 1e3)
+
+
+def fit_params(
+    equation_fn: Callable,
+    inputs: Sequence[np.ndarray],
+    target: np.ndarray,
+    *,
+    optimizer: str = "bfgs",
+    gradient: str | None = None,
+    bounds: tuple[float, float] = DEFAULT_BOUNDS,
+    candidate_code: str | None = None,
+    param_detection: str = "auto",
+    survival_bar: float | None = None,
+    time_budget: float | None = None,
+    starts: Sequence[Sequence[float]] | None = None,
+    n_starts: int = 1,
+    seed: int = 0,
+) -> OptimizeResult:
+    """Fit ``params``, by default starting from ``[1.0] * N_PARAMS``.
+
+    Backends (``OPTIMIZERS``):
+
+    - ``bfgs``: BFGS on the MSE over all parameters.
+    - ``lbfgsb``: L-BFGS-B on the MSE within ``bounds``.
+    - ``varpro``: VariableProjection, or ``bfgs`` when nothing is linear.
+    - ``lm``: Levenberg-Marquardt on the residual vector.
+    - ``trf``: trust-region reflective least squares within ``bounds``.
+
+    ``gradient`` selects a BatchedGradient mode for ``bfgs``/``lbfgsb`` (and
+    ``varpro``'s fallback); ``None`` keeps SciPy's own finite differences.
+    The result's ``fun`` is the MSE and ``nfev`` counts every parameter
+    vector the equation was evaluated at, gradients and probes included.
+
+    Only the ``params`` the equation uses are optimised; the others keep
+    their start value and ``x`` is always the full vector (``active_params``
+    lists the fitted indices).  ``param_detection`` is ``"auto"`` (static
+    analysis of ``candidate_code``, falling back to dynamic_active_params),
+    ``"static"`` (static only, else all parameters) or ``"off"``.
+
+    ``starts`` are full parameter vectors to warm-start from, e.g. a
+    parent's fitted params.  With ``n_starts == 1`` the first of them replaces
+    the default start.  With ``n_starts > 1`` the default start, ``starts``
+    and random starts around 1.0 (drawn with ``seed``), ``n_starts`` in all,
+    are fitted on parallel threads and the lowest MSE is kept (ties go to the
+    earlier start).  The default start is also tried if no start gave a
+    finite MSE.  ``start_index`` on the result says which start won.
+
+    With a ``survival_bar``, a DominanceCutoff stops fits that cannot reach
+    it within ``time_budget`` seconds; ``truncated`` on the result then holds
+    the reason (``None`` otherwise).  Fits that are not cut are unaffected.
+    """
+    if optimizer not in OPTIMIZERS:
+        raise ValueError(f"Unknown optimizer: {optimizer}")
+    fit, options, bounded, takes_gradient = OPTIMIZERS[optimizer]
+    options = dict(options)
+    if bounded:
+        options["bounds"] = bounds
+    if takes_gradient:
+        options["gradient"] = gradient
+
+    default = np.array([1.0] * N_PARAMS)
+    counted = CountingEquation(equation_fn)
+    active = None
+    if param_detection != "off" and candidate_code is not None:
+        active = static_active_params(candidate_code)
+    if active is None and param_detection == "auto":
+        active = dynamic_active_params(counted, inputs)
+    if active is None:
+        active = list(range(N_PARAMS))
+    target = np.asarray(target, dtype=float)
+
+    warm = [np.asarray(x, dtype=float) for x in starts or [] if len(x) == N_PARAMS and np.all(np.isfinite(x))]
+    if n_starts <= 1:
+        x0s = warm[:1] or [default]
+    else:
+        x0s = [default, *warm][:n_starts]
+        rng = np.random.default_rng(seed)
+        while len(x0s) < n_starts:
+            x0s.append(1.0 + rng.normal(0.0, 1.0, N_PARAMS))
+
+    def fit_from(x0: np.ndarray) -> OptimizeResult:
+        cutoff = None
+        start_options = dict(options)
+        if survival_bar is not None:
+            cutoff = DominanceCutoff(
+                survival_bar,
+                time_budget=float("inf") if time_budget is None else time_budget,
+                max_iter=200 * len(active),  # SciPy's BFGS default
+            )
+            start_options["callback"] = cutoff
+
+        if not active:
+            loss = make_loss(counted, inputs, target)
+            result = OptimizeResult(x=x0, fun=loss(x0), success=True, message="No parameters are used.", nit=0)
+        elif len(active) == N_PARAMS:
+            result = fit(counted, inputs, target, x0, **start_options)
+        else:
+            reduced = ReducedEquation(counted, active, x0)
+            result = fit(reduced, inputs, target, x0[active], **start_options)
+            result.x = reduced.expand(result.x)
+            if isinstance(result.get("linear_params"), list):
+                result.linear_params = [active[j] for j in result.linear_params]
+        result.truncated = cutoff.reason if cutoff is not None else None
+        return result
+
+    def mse(result: OptimizeResult) -> float:
+        value = float(result.fun)
+        return value if np.isfinite(value) else float("inf")
+
+    if len(x0s) == 1:
+        results = [fit_from(x0s[0])]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(x0s)) as executor:
+            results = list(executor.map(fit_from, x0s))
+    start_index = min(range(len(results)), key=lambda i: mse(results[i]))
+    if mse(results[start_index]) == float("inf") and x0s[0] is not default:
+        x0s.append(default)
+        results.append(fit_from(default))
+        start_index = len(results) - 1
+
+    result = results[start_index]
+    result.active_params = active
+    result.nfev = counted.count
+    result.start_index = start_index
+    result.n_starts = len(x0s)
+    return result
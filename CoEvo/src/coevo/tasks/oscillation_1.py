@@ -1,19 +1,11 @@
-import time
-import warnings
+from evotoolkit.core import TaskSpec
 
-import numpy as np
-import pandas as pd
-from scipy.optimize import minimize
+from .base import FittingTask
 
-from evotoolkit.core import EvaluationResult, TaskSpec
-from evotoolkit.task.python_task import PythonTask
 
-
-class Oscillation1Task(PythonTask):
-    def __init__(self, dataset_dir: str, timeout_seconds: float = 30.0):
-        self.evaluate_data = pd.read_csv(dataset_dir)
-        self.evaluate_data.columns = ["x", "v", "a"]
-        super().__init__(data=None, timeout_seconds=timeout_seconds)
+class Oscillation1Task(FittingTask):
+    input_columns = ("x", "v")
+    target_column = "a"
 
     def build_python_spec(self, data) -> TaskSpec:
         task_description = (
@@ -47,50 +39,3 @@ class Oscillation1Task(PythonTask):
                 "program_template": program_template,
             },
         )
-
-    def _evaluate_code_impl(self, candidate_code: str) -> EvaluationResult:
-        try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                namespace: dict = {}
-                exec(candidate_code, namespace)  # noqa: S102
-                equation_fn = namespace["equation"]
-
-                x = self.evaluate_data["x"].values
-                v = self.evaluate_data["v"].values
-                a = self.evaluate_data["a"].values
-
-                start_time = time.time()
-
-                def loss(params):
-                    y_pred = equation_fn(x, v, params)
-                    return np.mean((y_pred - a) ** 2)
-
-                result = minimize(loss, np.array([1.0] * 10), method="BFGS")
-                mse = float(result.fun)
-                elapsed = time.time() - start_time
-
-                if np.isnan(mse) or np.isinf(mse):
-                    return EvaluationResult(
-                        valid=False,
-                        score=float("-inf"),
-                        additional_info={"error": "residual error is NaN or inf"},
-                    )
-
-                fitness_string = f"The residual error between the output and the ground truth is {mse}"
-                return EvaluationResult(
-                    valid=True,
-                    score=-mse,
-                    additional_info={
-                        "mse": mse,
-                        "time": elapsed,
-                        "fitness_list": [mse, elapsed],
-                        "fitness_string": fitness_string,
-                    },
-                )
-        except Exception as e:
-            return EvaluationResult(
-                valid=False,
-                score=float("-inf"),
-                additional_info={"error": str(e)},
-            )
@@ -0,0 +1,203 @@
+"""Static pre-screening of candidate code before it is exec'd and fitted.
+
+``prescreen_equation`` inspects the AST of a candidate and rejects the
+failures that are otherwise only found after ``exec`` or deep inside the
+optimizer: syntax errors, a missing or mis-declared ``equation``,
+``params`` indices that are never fitted, forbidden imports and Python
+loops over the data rows.  Its error strings are written for the LLM, as
+they end up in the feedback of later prompts.
+"""
+
+from __future__ import annotations
+
+import ast
+from dataclasses import dataclass, field
+
+from .fitting import N_PARAMS
+
+# Modules a closed-form equation has no business importing.
+FORBIDDEN_MODULES = frozenset(
+    {
+        "asyncio",
+        "builtins",
+        "ctypes",
+        "http",
+        "importlib",
+        "io",
+        "multiprocessing",
+        "os",
+        "pathlib",
+        "pickle",
+        "requests",
+        "shutil",
+        "signal",
+        "socket",
+        "subprocess",
+        "sys",
+        "threading",
+        "urllib",
+    }
+)
+FORBIDDEN_CALLS = frozenset({"__import__", "compile", "eval", "exec", "open"})
+# Calls that apply a Python function element by element.
+_ELEMENTWISE_CALLS = frozenset({"vectorize", "frompyfunc", "nditer", "ndenumerate", "apply_along_axis"})
+
+
+@dataclass
+class ScreenResult:
+    """Outcome of ``prescreen_equation``.
+
+    ``error`` is ``None`` if the candidate may be evaluated.  ``vectorised``
+    is ``False`` when it still contains Python-level loops or element-wise
+    wrappers (``np.vectorize``, ...), which are slow but not necessarily
+    wrong; ``reasons`` lists what was found.
+    """
+
+    error: str | None = None
+    vectorised: bool = True
+    reasons: list[str] = field(default_factory=list)
+
+
+def _constant_int(node: ast.AST) -> int | None:
+    if isinstance(node, ast.Constant) and type(node.value) is int:
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _constant_int(node.operand)
+        return None if value is None else -value
+    return None
+
+
+def _call_name(node: ast.Call) -> str | None:
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def _row_iterable(node: ast.AST, inputs: set[str]) -> str | None:
+    """The input column ``node`` iterates over row by row, if any.
+
+    Recognises ``x``, ``x.flat``, ``range(len(x))``, ``range(x.shape[0])``,
+    ``range(x.size)``, ``enumerate(x)`` and ``zip(x, ...)``.
+    """
+
+    def column(expr: ast.AST) -> str | None:
+        while isinstance(expr, (ast.Attribute, ast.Subscript)):
+            expr = expr.value
+        if isinstance(expr, ast.Name) and expr.id in inputs:
+            return expr.id
+        return None
+
+    if isinstance(node, ast.Name):
+        return column(node)
+    if isinstance(node, ast.Attribute) and node.attr == "flat":
+        return column(node.value)
+    if isinstance(node, ast.Call):
+        name = _call_name(node)
+        if name in ("enumerate", "zip", "reversed"):
+            return next((c for c in (_row_iterable(a, inputs) for a in node.args) if c), None)
+        if name == "range" and node.args:
+            bound = node.args[1] if len(node.args) > 1 else node.args[0]
+            if isinstance(bound, ast.Call) and _call_name(bound) == "len" and bound.args:
+                return column(bound.args[0])
+            if isinstance(bound, ast.Attribute) and bound.attr == "size":
+                return column(bound.value)
+            if isinstance(bound, ast.Subscript) and isinstance(bound.value, ast.Attribute):
+                if bound.value.attr == "shape":
+                    return column(bound.value.value)
+    return None
+
+
+def prescreen_equation(candidate_code: str, n_inputs: int, n_params: int = N_PARAMS) -> ScreenResult:
+    """Check ``candidate_code`` for an ``equation(*inputs, params)`` that can be fitted.
+
+    Parameters
+    ----------
+    candidate_code:
+        Source of the candidate.
+    n_inputs:
+        Number of data columns passed before ``params``.
+    n_params:
+        Length of the fitted ``params`` vector.
+    """
+    try:
+        tree = ast.parse(candidate_code)
+    except SyntaxError as e:
+        return ScreenResult(error=f"SyntaxError: {e.msg} (line {e.lineno})")
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            modules = [node.module or ""]
+        else:
+            modules = []
+        for module in modules:
+            if module.split(".")[0] in FORBIDDEN_MODULES:
+                return ScreenResult(
+                    error=f"Import of '{module}' is not allowed (line {node.lineno}); use only numpy, scipy and math."
+                )
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in FORBIDDEN_CALLS:
+            return ScreenResult(error=f"Call to '{node.func.id}' is not allowed (line {node.lineno}).")
+
+    func = next((n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == "equation"), None)
+    if func is None:
+        return ScreenResult(error="No top-level function named 'equation' is defined.")
+
+    # Arguments with defaults (``scale=1.0``) may follow params; required ones may not.
+    positional = [*func.args.posonlyargs, *func.args.args]
+    n_required = len(positional) - len(func.args.defaults)
+    too_few = func.args.vararg is None and len(positional) < n_inputs + 1
+    if too_few or n_required > n_inputs + 1:
+        names = ", ".join(a.arg for a in positional)
+        count = len(positional) if n_required == len(positional) else f"{n_required} required"
+        return ScreenResult(
+            error=(
+                f"'equation' takes {count} positional arguments ({names}) but is called with "
+                f"{n_inputs + 1}: the {n_inputs} input arrays followed by params."
+            )
+        )
+    if len(positional) < n_inputs + 1:
+        return ScreenResult()
+    params_name = positional[n_inputs].arg
+    inputs = {a.arg for a in positional[:n_inputs]}
+
+    for node in ast.walk(func):
+        if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) and node.value.id == params_name:
+            index = _constant_int(node.slice)
+            if index is not None and not -n_params <= index < n_params:
+                return ScreenResult(
+                    error=(
+                        f"{params_name}[{index}] is out of range (line {node.lineno}): only "
+                        f"{params_name}[0] to {params_name}[{n_params - 1}] are fitted."
+                    )
+                )
+
+    result = ScreenResult()
+    for node in ast.walk(func):
+        if isinstance(node, (ast.For, ast.AsyncFor)):
+            iterables = [node.iter]
+        elif isinstance(node, (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp)):
+            iterables = [gen.iter for gen in node.generators]
+        else:
+            iterables = []
+        for iterable in iterables:
+            column = _row_iterable(iterable, inputs)
+            if column is not None:
+                return ScreenResult(
+                    error=(
+                        f"'equation' loops over the rows of '{column}' in Python (line {node.lineno}); "
+                        "use vectorised numpy operations on whole arrays instead."
+                    )
+                )
+        if iterables:
+            result.vectorised = False
+            result.reasons.append(f"Python loop on line {node.lineno}")
+        elif isinstance(node, ast.While):
+            result.vectorised = False
+            result.reasons.append(f"while loop on line {node.lineno}")
+        elif isinstance(node, ast.Call) and _call_name(node) in _ELEMENTWISE_CALLS:
+            result.vectorised = False
+            result.reasons.append(f"{_call_name(node)} on line {node.lineno}")
+    return result
@@ -0,0 +1,135 @@
+"""Record/replay of LLM calls for deterministic offline runs.
+
+A ``Cassette`` is a gzip-compressed JSON-lines file: a ``{"header": {...}}``
+line holding the run's random ``seed``, then
+``{"key", "role", "prompt", "response", "usage"}`` entries, where ``key`` is
+the SHA-256 of ``(role, prompt)``.  ``CassetteLLM`` wraps an ``HttpsApi``-like
+client for one role:
+
+- ``record`` mode forwards each call to the wrapped client and appends the
+  triple to a new cassette.
+- ``replay`` mode serves recorded responses without any client.  Repeated
+  prompts are answered in recording order.  A prompt that was never recorded
+  (e.g. the summarizer picked different inspirations) raises ``CassetteMiss``,
+  which retry loops treat as permanent.  With ``strict=False`` the next unused
+  response of that role is served instead.
+
+Prompts depend on parent and inspiration sampling, so a replay only builds
+the recorded prompts when it runs with the recorded seed, ``num_workers=1``
+and without steady-state scheduling; otherwise the order in which chains
+draw from the shared generators depends on thread timing.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import defaultdict, deque
+from typing import Any
+
+
+class CassetteMiss(RuntimeError):
+    """Replay found no recorded response for a prompt."""
+
+
+def prompt_key(role: str, prompt: str | Any) -> str:
+    payload = json.dumps([role, prompt], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """Cassette file shared by the ``CassetteLLM`` wrappers of all roles.
+
+    Parameters
+    ----------
+    path:
+        Cassette file, conventionally ``*.jsonl.gz``.
+    mode:
+        ``"record"`` (write a new cassette at ``path``; an existing file is
+        never recorded over) or ``"replay"`` (read ``path``).
+    strict:
+        In replay mode, raise ``CassetteMiss`` for unrecorded prompts.  If
+        ``False``, fall back to the next unused response of the same role.
+    seed:
+        Seed of the run's ``random``/``np.random`` generators.  Written to the
+        header when recording; on replay it must match the recorded one.
+    """
+
+    def __init__(self, path: str, mode: str = "replay", *, strict: bool = True, seed: int | None = None) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.strict = strict
+        self.seed = seed
+        self.fallbacks = 0
+        self._lock = threading.Lock()
+        self._by_key: dict[str, deque] = defaultdict(deque)
+        self._by_role: dict[str, deque] = defaultdict(deque)
+
+        if mode == "replay":
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    entry = json.loads(line)
+                    if "header" in entry:
+                        recorded_seed = entry["header"].get("seed")
+                        if recorded_seed != seed:
+                            raise ValueError(
+                                f"Cassette {path} was recorded with seed {recorded_seed}, not {seed}; "
+                                "replay with the recorded seed"
+                            )
+                        continue
+                    self._by_key[entry["key"]].append(entry)
+                    self._by_role[entry["role"]].append(entry)
+        else:
+            if os.path.exists(path):
+                raise FileExistsError(f"Cassette {path} already exists; remove it or record to another path")
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with gzip.open(path, "wt", encoding="utf-8") as f:
+                f.write(json.dumps({"header": {"seed": seed}}) + "\n")
+
+    def client(self, role: str, llm=None) -> CassetteLLM:
+        if self.mode == "record" and llm is None:
+            raise ValueError("record mode needs the LLM client to wrap")
+        return CassetteLLM(self, role, llm)
+
+    def record(self, role: str, prompt: str | Any, response: str, usage: dict) -> None:
+        entry = {"key": prompt_key(role, prompt), "role": role, "prompt": prompt, "response": response, "usage": usage}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            # Each append is a separate gzip member; readers see one stream.
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line)
+
+    def replay(self, role: str, prompt: str | Any) -> tuple[str, dict]:
+        with self._lock:
+            entries = self._by_key.get(prompt_key(role, prompt))
+            if entries:
+                entry = entries.popleft()
+                self._by_role[role].remove(entry)
+            elif self.strict or not self._by_role[role]:
+                raise CassetteMiss(f"No recorded {role} response for prompt")
+            else:
+                entry = self._by_role[role].popleft()
+                self._by_key[entry["key"]].remove(entry)
+                self.fallbacks += 1
+        return entry["response"], dict(entry["usage"])
+
+
+class CassetteLLM:
+    """``HttpsApi``-compatible client that records to or replays from a cassette."""
+
+    def __init__(self, cassette: Cassette, role: str, llm=None) -> None:
+        self.cassette = cassette
+        self.role = role
+        self.llm = llm
+
+    def get_response(self, prompt: str | Any, *args, **kwargs) -> tuple[str, dict]:
+        if self.cassette.mode == "replay":
+            return self.cassette.replay(self.role, prompt)
+        response, usage = self.llm.get_response(prompt, *args, **kwargs)
+        self.cassette.record(self.role, prompt, response, usage)
+        return response, usage
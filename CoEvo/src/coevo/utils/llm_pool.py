@@ -0,0 +1,235 @@
+"""Pooled, rate-limited LLM clients sharing one concurrency budget.
+
+``LLMPool`` owns the HTTP connections, the request/token rate limits and the
+concurrency budget.  ``LLMPool.client(role)`` returns a ``PooledLLM`` that is a
+drop-in replacement for evotoolkit's ``HttpsApi`` (``get_response`` returns
+``(response_str, usage)``), so the main and summarizer roles can share limits.
+Each ``usage`` dict additionally carries ``role``, ``queue_time`` (waiting for
+a concurrency slot and rate-limit tokens) and ``service_time`` (the HTTP call).
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import queue
+import threading
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+
+class LLMHTTPError(RuntimeError):
+    """Non-200 response from the chat-completions endpoint."""
+
+    def __init__(self, status: int, body: str, retry_after: float | None = None) -> None:
+        super().__init__(f"HTTP {status}: {body[:200]}")
+        self.status = status
+        self.body = body
+        self.retry_after = retry_after
+
+
+# Errors of a request on a keep-alive connection the server has already closed
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate_per_minute``."""
+
+    def __init__(self, rate_per_minute: float, capacity: float | None = None) -> None:
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """Block until ``amount`` tokens are available, then take them."""
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def consume(self, amount: float) -> None:
+        """Take (or, if negative, return) tokens without waiting; may go into debt."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens - amount)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+
+class LLMPool:
+    """Shared connection pool and rate limiter for OpenAI-compatible endpoints.
+
+    Parameters
+    ----------
+    api_url:
+        Full chat-completions URL, e.g. ``https://api.openai.com/v1/chat/completions``.
+        ``http://`` URLs are accepted (local stand-ins).
+    key:
+        API key sent as a bearer token.
+    model:
+        Model name.
+    timeout:
+        Per-request socket timeout in seconds.
+    max_concurrency:
+        Requests in flight across all roles.
+    rpm:
+        Requests per minute across all roles (``None`` = unlimited).
+    tpm:
+        Tokens per minute across all roles (``None`` = unlimited).  Requests are
+        admitted on an estimate and reconciled with the reported usage.
+    completion_token_estimate:
+        Completion tokens assumed when admitting a request against ``tpm``.
+
+    A request sent on a reused keep-alive connection that the server has
+    already closed is resent once on a new connection.  Every other failure
+    is raised to the caller's RetryPolicy: transport errors as they are,
+    HTTP error statuses as ``LLMHTTPError``.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        key: str,
+        model: str,
+        *,
+        timeout: float = 60,
+        max_concurrency: int = 8,
+        rpm: float | None = None,
+        tpm: float | None = None,
+        completion_token_estimate: int = 1024,
+        **kwargs,
+    ) -> None:
+        parsed = urlparse(api_url if "://" in api_url else f"https://{api_url}")
+        if not parsed.netloc:
+            raise ValueError(f"Invalid API URL: missing hostname in '{api_url}'")
+        self._scheme = parsed.scheme
+        self._host = parsed.netloc
+        self._url = parsed.path or "/v1/chat/completions"
+        self._key = key
+        self._model = model
+        self._timeout = timeout
+        self._kwargs = kwargs
+        self.completion_token_estimate = completion_token_estimate
+
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._rpm_bucket = TokenBucket(rpm) if rpm else None
+        self._tpm_bucket = TokenBucket(tpm) if tpm else None
+        self._idle_conns: queue.LifoQueue = queue.LifoQueue()
+
+        self._stats_lock = threading.Lock()
+        self.stats: dict[str, dict[str, float]] = {}
+
+    def client(self, role: str) -> PooledLLM:
+        return PooledLLM(self, role)
+
+    def request(self, prompt: str | Any, role: str) -> tuple[str, dict]:
+        if isinstance(prompt, str):
+            prompt = [{"role": "user", "content": prompt.strip()}]
+        payload = json.dumps(
+            {
+                "temperature": self._kwargs.get("temperature", 1.0),
+                "model": self._model,
+                "messages": prompt,
+            }
+        )
+        estimate = len(payload) // 4 + self.completion_token_estimate
+
+        queued_at = time.time()
+        with self._slots:
+            if self._rpm_bucket is not None:
+                self._rpm_bucket.acquire(1)
+            if self._tpm_bucket is not None:
+                self._tpm_bucket.acquire(estimate)
+            started_at = time.time()
+            try:
+                data = self._post(payload)
+            finally:
+                finished_at = time.time()
+
+        response = data["choices"][0]["message"]["content"]
+        usage = dict(data.get("usage") or {})
+        if self._tpm_bucket is not None and "total_tokens" in usage:
+            self._tpm_bucket.consume(usage["total_tokens"] - estimate)
+
+        usage["role"] = role
+        usage["queue_time"] = started_at - queued_at
+        usage["service_time"] = finished_at - started_at
+        self._record(role, usage)
+        return response, usage
+
+    def _post(self, payload: str) -> dict:
+        headers = {
+            "Authorization": f"Bearer {self._key}",
+            "Content-Type": "application/json",
+        }
+        while True:
+            conn, reused = self._acquire_conn()
+            try:
+                conn.request("POST", self._url, payload, headers)
+                res = conn.getresponse()
+                body = res.read().decode("utf-8")
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                # The server dropped an idle keep-alive connection before our
+                # request reached it; anything else may have been billed.
+                if reused:
+                    continue
+                raise
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                raise
+
+            if res.status != 200:
+                conn.close()
+                raise LLMHTTPError(res.status, body, _parse_retry_after(res.getheader("Retry-After")))
+            self._idle_conns.put(conn)
+            return json.loads(body)
+
+    def _acquire_conn(self) -> tuple[http.client.HTTPConnection, bool]:
+        """An idle connection, or a new one if none is idle, and whether it was reused."""
+        try:
+            return self._idle_conns.get_nowait(), True
+        except queue.Empty:
+            conn_cls = http.client.HTTPConnection if self._scheme == "http" else http.client.HTTPSConnection
+            return conn_cls(self._host, timeout=self._timeout), False
+
+    def _record(self, role: str, usage: dict) -> None:
+        with self._stats_lock:
+            stats = self.stats.setdefault(
+                role,
+                {"calls": 0, "queue_time": 0.0, "service_time": 0.0, "total_tokens": 0},
+            )
+            stats["calls"] += 1
+            stats["queue_time"] += usage["queue_time"]
+            stats["service_time"] += usage["service_time"]
+            stats["total_tokens"] += usage.get("total_tokens", 0)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    # Only the delay-seconds form; HTTP-date values fall back to the caller's backoff
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class PooledLLM:
+    """``HttpsApi``-compatible view of an ``LLMPool`` for one role."""
+
+    def __init__(self, pool: LLMPool, role: str) -> None:
+        self.pool = pool
+        self.role = role
+
+    def get_response(self, prompt: str | Any, *args, **kwargs) -> tuple[str, dict]:
+        return self.pool.request(prompt, self.role)
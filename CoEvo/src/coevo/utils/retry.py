@@ -0,0 +1,70 @@
+"""Failure classification and backoff for LLM prompt retries.
+
+Failures fall into four classes:
+
+- ``transport``: the call did not complete (timeouts, connection errors,
+  5xx responses, evotoolkit ``HttpsApi`` giving up).
+- ``throttling``: the provider asked us to slow down (HTTP 429).
+- ``format``: a response arrived but could not be parsed, either into a
+  solution or, for a 200 response with a malformed body, at all.
+- ``permanent``: retrying cannot help (a prompt missing from a replayed
+  cassette); callers give up at once.
+
+Only transport and throttling failures back off; a format failure is simply a
+bad sample, so the next attempt is issued immediately.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import random
+from dataclasses import dataclass
+
+from .cassette import CassetteMiss
+from .llm_pool import LLMHTTPError
+
+TRANSPORT = "transport"
+THROTTLING = "throttling"
+FORMAT = "format"
+PERMANENT = "permanent"
+
+
+def classify_failure(exc: BaseException) -> str:
+    """Classify an exception raised by an LLM client's ``get_response``."""
+    if isinstance(exc, CassetteMiss):
+        return PERMANENT
+    if isinstance(exc, LLMHTTPError):
+        return THROTTLING if exc.status == 429 else TRANSPORT
+    if isinstance(exc, (OSError, http.client.HTTPException)):
+        return TRANSPORT
+    if isinstance(exc, (json.JSONDecodeError, KeyError, IndexError)):
+        return FORMAT
+    message = str(exc).lower()
+    if "429" in message or "rate limit" in message or "too many requests" in message:
+        return THROTTLING
+    return TRANSPORT
+
+
+@dataclass
+class RetryPolicy:
+    """Retry budget and jittered exponential backoff.
+
+    ``max_retry`` counts retries after the first attempt (3 = four attempts,
+    as before).  The delay before retry ``attempt`` (0-based) is drawn
+    uniformly from ``[0, min(max_delay, base_delay * 2**attempt)]``; a
+    server-provided ``Retry-After`` replaces it for throttling failures, capped
+    at ``max_delay`` as well.
+    """
+
+    max_retry: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    backoff_classes: tuple[str, ...] = (TRANSPORT, THROTTLING)
+
+    def delay(self, failure_class: str, attempt: int, retry_after: float | None = None) -> float:
+        if failure_class not in self.backoff_classes:
+            return 0.0
+        if failure_class == THROTTLING and retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * 2**attempt))
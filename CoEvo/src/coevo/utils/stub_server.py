@@ -0,0 +1,307 @@
+"""Local stand-in for an OpenAI-compatible chat-completions endpoint.
+
+The server answers CoEvo prompts with template-conformant responses: solution
+prompts get ``## Ideas / ## Thoughts / ## Solutions`` sections (with the
+layer-specific idea fields and one ``###`` block per representation found in
+the prompt), and summarizer prompts get ``## New Ideas / ## Analysis``.  The
+Python code is a random linear combination of terms over the ``equation``
+arguments read from the prompt's program template.
+
+Latency, error rate, format-error rate and 429 behaviour are configurable so
+concurrency and retry handling can be load-tested without paying for tokens::
+
+    python -m coevo.utils.stub_server --port 8000 --latency lognormal:4:0.8 \\
+        --error_rate 0.02 --throttle_rate 0.05 --rpm 120
+
+then point ``API_URL`` at ``http://127.0.0.1:8000/v1/chat/completions``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Parse ``fixed:S``, ``uniform:A:B``, ``exponential:MEAN`` or ``lognormal:MEDIAN:SIGMA``."""
+    kind, *args = spec.split(":")
+    values = [float(a) for a in args]
+    if kind == "fixed":
+        return lambda rng: values[0]
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "exponential":
+        return lambda rng: rng.expovariate(1.0 / values[0])
+    if kind == "lognormal":
+        import math
+
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+class StubResponder:
+    """Builds template-conformant responses for CoEvo prompts."""
+
+    _term_templates = [
+        "params[{i}] * {a}",
+        "params[{i}] * {a} ** 2",
+        "params[{i}] * {a} ** 3",
+        "params[{i}] * {a} * {b}",
+        "params[{i}] * np.sin({a})",
+        "params[{i}] * np.cos(params[{j}] * {a})",
+        "params[{i}] * np.exp(-np.abs(params[{j}]) * {a})",
+        "params[{i}] * np.tanh({a})",
+    ]
+
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+
+    def respond(self, prompt: str) -> str:
+        if "## New Ideas" in prompt:
+            return self._summary_response()
+        rep_names = re.findall(r"^### (.+?):\n\.\.\.$", prompt, re.MULTILINE) or ["Python Code"]
+        continue_layer = "Quotes:" in prompt
+        return self._solution_response(prompt, rep_names, continue_layer)
+
+    def _solution_response(self, prompt: str, rep_names: list[str], continue_layer: bool) -> str:
+        code = self._equation(prompt)
+        lines = ["## Ideas"]
+        for k in range(self.rng.randint(1, 3)):
+            lines.append(f"- Idea {k + 1}:")
+            if continue_layer:
+                lines.append("  - Quotes: the previous solution")
+                lines.append("  - Implications: refine its terms")
+            lines.append(f"  - Name: Stub idea {self.rng.randint(0, 999)}")
+            lines.append("  - Reasoning: generated by the local stub server")
+            lines.append("  - Definition: combine a few nonlinear terms of the inputs")
+        lines += ["", "## Thoughts", "A random combination of candidate terms.", "", "## Solutions"]
+        for name in rep_names:
+            lines.append(f"### {name}:")
+            if name == "Python Code":
+                lines.append(f"```python\n{code}\n```")
+            else:
+                lines.append("A weighted sum of nonlinear terms of the inputs.")
+        return "\n".join(lines) + "\n"
+
+    def _summary_response(self) -> str:
+        lines = ["## New Ideas"]
+        for k in range(self.rng.randint(1, 2)):
+            lines += [
+                f"- Idea {k + 1}:",
+                "  - Reasoning: the best solution used this term",
+                f"  - Name: Stub summary {self.rng.randint(0, 999)}",
+                "  - Definition: add a nonlinear damping term",
+                "  - Example: params[0] * v ** 3",
+            ]
+        lines += ["", "## Analysis", "", "Generated by the local stub server.", ""]
+        return "\n".join(lines)
+
+    def _equation(self, prompt: str) -> str:
+        match = re.search(r"def equation\((.*?)\)\s*->", prompt)
+        signature = match.group(1) if match else "x: np.ndarray, params: np.ndarray"
+        arg_names = [arg.split(":")[0].strip() for arg in signature.split(",")]
+        inputs = [name for name in arg_names if name != "params"] or ["x"]
+
+        indices = self.rng.sample(range(10), 10)
+        terms = []
+        for _ in range(self.rng.randint(2, 4)):
+            template = self.rng.choice(self._term_templates)
+            terms.append(template.format(
+                i=indices.pop(),
+                j=indices.pop(),
+                a=self.rng.choice(inputs),
+                b=self.rng.choice(inputs),
+            ))
+        return (
+            "import numpy as np\n"
+            f"def equation({signature}) -> np.ndarray:\n"
+            f"    return {' + '.join(terms)}"
+        )
+
+
+class StubLLMServer:
+    """Threaded HTTP server speaking the chat-completions protocol.
+
+    Parameters
+    ----------
+    host, port:
+        Bind address; port 0 picks a free port (see ``url``).
+    latency:
+        Latency distribution spec, see ``parse_latency``.
+    error_rate:
+        Probability of an HTTP 500.
+    throttle_rate:
+        Probability of an HTTP 429 regardless of load.
+    rpm:
+        Requests per minute above which requests get an HTTP 429 (``None`` =
+        unlimited).
+    retry_after:
+        ``Retry-After`` seconds sent with 429 responses (``None`` = omit).
+    format_error_rate:
+        Probability of a 200 response that CoEvo cannot parse.
+    seed:
+        Random seed for reproducible load tests.
+    idle_timeout:
+        Seconds after which an idle keep-alive connection is closed, as
+        providers do (``None`` = never).
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        latency: str = "fixed:0",
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        rpm: float | None = None,
+        retry_after: float | None = 1.0,
+        format_error_rate: float = 0.0,
+        seed: int | None = None,
+        idle_timeout: float | None = None,
+    ) -> None:
+        self.rng = random.Random(seed)
+        self.latency = parse_latency(latency)
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rpm = rpm
+        self.retry_after = retry_after
+        self.format_error_rate = format_error_rate
+        self.idle_timeout = idle_timeout
+        self.responder = StubResponder(self.rng)
+        self.counts = {"ok": 0, "error": 0, "throttled": 0, "format_error": 0}
+
+        self._lock = threading.Lock()
+        self._recent: deque[float] = deque()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1/chat/completions"
+
+    def start(self) -> StubLLMServer:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def _decide(self, prompt: str) -> tuple[int, str, float]:
+        """Pick status, response text and latency for one request."""
+        with self._lock:
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] > 60.0:
+                self._recent.popleft()
+            over_rpm = self.rpm is not None and len(self._recent) >= self.rpm
+            if not over_rpm:
+                self._recent.append(now)
+
+            draw = self.rng.random()
+            delay = self.latency(self.rng)
+            if over_rpm or draw < self.throttle_rate:
+                self.counts["throttled"] += 1
+                return 429, "Too Many Requests", 0.0
+            if draw < self.throttle_rate + self.error_rate:
+                self.counts["error"] += 1
+                return 500, "Internal Server Error", delay
+            if draw < self.throttle_rate + self.error_rate + self.format_error_rate:
+                self.counts["format_error"] += 1
+                return 200, "I am not sure how to answer that.", delay
+            self.counts["ok"] += 1
+            return 200, self.responder.respond(prompt), delay
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            timeout = server.idle_timeout
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                prompt = "\n".join(str(m.get("content", "")) for m in request.get("messages", []))
+
+                status, text, delay = server._decide(prompt)
+                time.sleep(delay)
+                if status == 200:
+                    prompt_tokens = len(prompt) // 4
+                    completion_tokens = len(text) // 4
+                    body = json.dumps({
+                        "object": "chat.completion",
+                        "model": request.get("model", "stub"),
+                        "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                        "usage": {
+                            "prompt_tokens": prompt_tokens,
+                            "completion_tokens": completion_tokens,
+                            "total_tokens": prompt_tokens + completion_tokens,
+                        },
+                    })
+                else:
+                    body = json.dumps({"error": {"message": text, "code": status}})
+
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                if status == 429 and server.retry_after is not None:
+                    self.send_header("Retry-After", f"{server.retry_after:g}")
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stub chat-completions server for CoEvo load tests.")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=str, default="lognormal:2:0.5")
+    parser.add_argument("--error_rate", type=float, default=0.0)
+    parser.add_argument("--throttle_rate", type=float, default=0.0)
+    parser.add_argument("--rpm", type=float, default=None)
+    parser.add_argument("--retry_after", type=float, default=1.0)
+    parser.add_argument("--format_error_rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--idle_timeout", type=float, default=None)
+    args = parser.parse_args()
+
+    server = StubLLMServer(
+        args.host,
+        args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        rpm=args.rpm,
+        retry_after=args.retry_after,
+        format_error_rate=args.format_error_rate,
+        seed=args.seed,
+        idle_timeout=args.idle_timeout,
+    )
+    print(f"Stub LLM server listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nStopped. {server.counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from coevo.tasks import Oscillation1Task
+
+
+@pytest.fixture
+def osc1_csv(tmp_path):
+    """Small oscillation_1-style dataset: a = -0.5 x - 0.1 v + 0.05 x^3 + noise."""
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-2.0, 2.0, 600)
+    v = rng.uniform(-1.0, 1.0, 600)
+    a = -0.5 * x - 0.1 * v + 0.05 * x**3 + rng.normal(0.0, 1e-3, 600)
+    path = tmp_path / "train.csv"
+    pd.DataFrame({"x": x, "v": v, "a": a}).to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def osc1_task(osc1_csv):
+    return Oscillation1Task(osc1_csv)
@@ -0,0 +1,122 @@
+import random
+
+import numpy as np
+import pytest
+
+# The summarizer imports sklearn on first use, and that import can draw from the
+# global ``random`` generator (through rich, when installed). Import it up front so
+# the recording run and its replay start from the same generator state.
+import sklearn.cluster  # noqa: F401
+
+from coevo.core import CoEvoInterface, CoEvoMethod, CoEvoSummarizer
+from coevo.core.embedding_backends import HashedNgramBackend
+from coevo.tasks import base
+from coevo.utils.cassette import Cassette, CassetteMiss
+from coevo.utils.retry import PERMANENT, classify_failure
+from coevo.utils.stub_server import StubResponder
+
+
+class EchoLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_response(self, prompt, *args, **kwargs):
+        self.calls += 1
+        return f"{prompt} #{self.calls}", {"total_tokens": 1}
+
+
+class StubLLM:
+    def __init__(self) -> None:
+        self.responder = StubResponder(random.Random(1))
+
+    def get_response(self, prompt, *args, **kwargs):
+        return self.responder.respond(prompt), {"total_tokens": 1}
+
+
+class TickingClock:
+    """Stands in for the ``time`` module in ``coevo.tasks.base``; every reading advances it by 1 ms.
+
+    Fit times are an NDS objective, so wall-clock fit times can flip parent
+    selection between a recording and its replay.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def time(self) -> float:
+        self.now += 1e-3
+        return self.now
+
+
+def run_coevo(task, cassette, output_path, seed, llm=None):
+    """A short CoEvo run with the summarizer, all LLM calls through ``cassette``."""
+    random.seed(seed)
+    np.random.seed(seed)
+    interface = CoEvoInterface(task, num_idea=[3, 3])
+    summarizer = CoEvoSummarizer(
+        interface.prompt_builder,
+        cassette.client("summarizer", llm),
+        embedding_backend=HashedNgramBackend(dim=256),
+    )
+    method = CoEvoMethod(
+        interface,
+        running_llm=cassette.client("main", llm),
+        output_path=str(output_path),
+        verbose=False,
+        max_generations=3,
+        use_summarizer=True,
+        summarizer=summarizer,
+    )
+    method.run()
+    return [(sol.sol_string, sol.evaluation_res.valid, sol.evaluation_res.score) for sol in method.state.sol_history]
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    path = str(tmp_path / "run.jsonl.gz")
+    llm = Cassette(path, "record").client("main", EchoLLM())
+    for prompt in ["a", "b", "a"]:
+        llm.get_response(prompt)
+    return path
+
+
+def test_replay_answers_repeated_prompts_in_recording_order(recorded):
+    llm = Cassette(recorded).client("main")
+    assert [llm.get_response(p)[0] for p in ["a", "a", "b"]] == ["a #1", "a #3", "b #2"]
+
+
+def test_replay_misses_are_strict_and_not_retried(recorded):
+    llm = Cassette(recorded).client("main")
+    with pytest.raises(CassetteMiss) as miss:
+        llm.get_response("c")
+    assert classify_failure(miss.value) == PERMANENT
+
+
+def test_fallback_serves_the_next_response_of_the_role(recorded):
+    cassette = Cassette(recorded, strict=False)
+    assert cassette.client("main").get_response("c")[0] == "a #1"
+    assert cassette.fallbacks == 1
+
+
+def test_record_refuses_an_existing_cassette(recorded):
+    with pytest.raises(FileExistsError):
+        Cassette(recorded, "record")
+
+
+def test_seeded_run_replays_every_prompt(osc1_task, tmp_path, monkeypatch):
+    monkeypatch.setattr(base, "time", TickingClock())
+    path = str(tmp_path / "run.jsonl.gz")
+    recorded = run_coevo(osc1_task, Cassette(path, "record", seed=0), tmp_path / "record", seed=0, llm=StubLLM())
+    replayed = run_coevo(osc1_task, Cassette(path, seed=0), tmp_path / "replay", seed=0)
+
+    assert len(recorded) > 10
+    assert replayed == recorded
+
+
+def test_replay_checks_the_recorded_seed(recorded, tmp_path):
+    path = str(tmp_path / "seeded.jsonl.gz")
+    Cassette(path, "record", seed=0)
+    with pytest.raises(ValueError, match="recorded with seed 0"):
+        Cassette(path, seed=1)
+    with pytest.raises(ValueError, match="recorded with seed None"):
+        Cassette(recorded, seed=1)
@@ -0,0 +1,96 @@
+import pytest
+from evotoolkit.core import EvaluationResult, Solution
+
+from coevo.core import CoEvoInterface, CoEvoMethod
+
+
+def solution(mse, **info):
+    sol = Solution("")
+    sol.evaluation_res = EvaluationResult(valid=True, score=-mse, additional_info={"fitness_list": [mse, 0.1], **info})
+    return sol
+
+
+def test_truncated_results_never_count_as_improvements():
+    raced = solution(0.01, dominated=True, truncated="raced on 50 of 600 rows")
+    assert CoEvoMethod._accept_continue(solution(1.0), solution(0.5))
+    assert not CoEvoMethod._accept_continue(solution(1.0), raced)
+    assert not CoEvoMethod._accept_continue(solution(1.0), solution(0.01, dominated=True))
+
+
+def test_truncated_predecessors_are_not_compared_against():
+    assert CoEvoMethod._accept_continue(solution(0.01, truncated="optimizer stopped"), solution(0.5))
+
+
+def invalid():
+    sol = Solution("")
+    sol.evaluation_res = EvaluationResult(valid=False, score=float("-inf"), additional_info={})
+    return sol
+
+
+def test_eval_hints_carry_the_fitted_params_of_valid_parents(osc1_task, tmp_path):
+    method = CoEvoMethod(CoEvoInterface(osc1_task, num_idea=[3, 3]), running_llm=None, output_path=str(tmp_path))
+    parents = [solution(0.5, params=[2.0] * 10), solution(0.4), invalid(), solution(0.3, params=[3.0] * 10)]
+
+    assert method._eval_hints(parents)["warm_starts"] == [[2.0] * 10, [3.0] * 10]
+    assert "warm_starts" not in method._eval_hints([solution(0.4)])
+
+
+LAYER_SCENARIOS = [
+    [0.5, 0.4, 0.3],
+    [0.5, 2.0, 0.1],
+    [0.5, "invalid", 0.1],
+    ["invalid", 0.4, 0.3],
+    [0.5, "truncated", 0.1],
+    [1.0, 0.4, 0.3],
+]
+
+
+def continue_method(task, tmp_path, scenario, speculative):
+    """A method whose continue layers return ``scenario`` (MSEs against an init MSE of 1.0)."""
+    method = CoEvoMethod(
+        CoEvoInterface(task, num_idea=[3, 3, 3, 3]),
+        running_llm=None,
+        output_path=str(tmp_path),
+        verbose=False,
+        use_summarizer=False,
+        speculative_continue=speculative,
+    )
+    issued = []
+
+    def prompt_parse_evaluate(prompt, layer, parents=None):
+        issued.append(layer)
+        if layer == 0:
+            return solution(1.0)
+        mse = scenario[layer - 1]
+        if mse == "invalid":
+            return invalid()
+        if mse == "truncated":
+            return solution(0.01, truncated="optimizer stopped")
+        return solution(mse)
+
+    method._prompt_parse_evaluate = prompt_parse_evaluate
+    return method, issued
+
+
+@pytest.mark.parametrize("scenario", LAYER_SCENARIOS)
+def test_speculative_continue_matches_sequential_decisions(osc1_task, tmp_path, scenario):
+    fitness = lambda chain: [sol.evaluation_res.additional_info.get("fitness_list") for sol in chain]
+    sequential, _ = continue_method(osc1_task, tmp_path, scenario, speculative=False)
+    speculative, issued = continue_method(osc1_task, tmp_path, scenario, speculative=True)
+
+    assert fitness(speculative._continue_reason(solution(1.0))) == fitness(sequential._continue_reason(solution(1.0)))
+    assert sorted(issued) == [1, 2, 3]
+
+
+def test_discarded_speculative_layers_are_not_registered(osc1_task, tmp_path):
+    sequential, _ = continue_method(osc1_task, tmp_path, [0.5, 2.0, 0.1], speculative=False)
+    sequential._register_chain(sequential._init_a_sol())
+    method, issued = continue_method(osc1_task, tmp_path, [0.5, 2.0, 0.1], speculative=True)
+    chain = method._init_a_sol()
+    method._register_chain(chain)
+
+    assert sorted(issued) == [0, 1, 2, 3]
+    assert len(chain) == 2
+    assert {id(sol) for sol in method.state.sol_history} == {id(sol) for sol in chain}
+    assert method.state.sample_count == sequential.state.sample_count
+    assert len(method.state.sol_history) == len(sequential.state.sol_history)
@@ -0,0 +1,180 @@
+import random
+import sys
+import threading
+import time
+import zlib
+
+import numpy as np
+import pytest
+from evotoolkit.core import Solution
+
+from coevo.core import CoEvoInterface, CoEvoMethod
+from coevo.utils.stub_server import StubResponder
+
+
+class PromptSeededLLM:
+    """Stub responses that depend only on the prompt, after a prompt-dependent delay."""
+
+    def __init__(self, max_delay: float = 0.0) -> None:
+        self.max_delay = max_delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_response(self, prompt, *args, **kwargs):
+        seed = zlib.crc32(prompt.encode("utf-8"))
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.max_delay * (seed % 1000) / 1000)
+        return StubResponder(random.Random(seed)).respond(prompt), {"total_tokens": 1}
+
+
+class BaselineCoEvoMethod(CoEvoMethod):
+    """The original sequential generation: parents chosen as each chain starts."""
+
+    def step_iteration(self) -> None:
+        new_chains = [self._init_a_sol() for _ in range(self.num_init_per_gen)]
+        for mode in self._generate_sol_modes:
+            new_chains.append(self._generate_offspring(mode))
+        for chain in new_chains:
+            self._register_chain(chain)
+        self._manage_population()
+        self.state.generation += 1
+
+
+def run(task, tmp_path, method_cls=CoEvoMethod, llm=None, **kwargs):
+    random.seed(0)
+    np.random.seed(0)
+    method = method_cls(
+        CoEvoInterface(task, num_idea=[3, 3]),
+        running_llm=llm or PromptSeededLLM(),
+        output_path=str(tmp_path / method_cls.__name__ / str(kwargs.get("num_workers", 1))),
+        verbose=False,
+        max_generations=3,
+        num_init_per_gen=2,
+        **kwargs,
+    )
+    method.run()
+    return method
+
+
+def history(method):
+    return [(sol.sol_string, sol.metadata.extras["chain_id"], sol.evaluation_res.score) for sol in method.state.sol_history]
+
+
+def test_one_worker_matches_the_sequential_baseline(osc1_task, tmp_path):
+    baseline = run(osc1_task, tmp_path, BaselineCoEvoMethod)
+    assert history(run(osc1_task, tmp_path, num_workers=1)) == history(baseline)
+
+
+def test_concurrent_chains_register_in_job_order(osc1_task, tmp_path):
+    sequential = run(osc1_task, tmp_path, num_workers=1)
+    concurrent = run(osc1_task, tmp_path, llm=PromptSeededLLM(max_delay=0.02), num_workers=6)
+    assert history(concurrent) == history(sequential)
+
+
+def test_run_chain_jobs_returns_job_order_whatever_finishes_first(osc1_task, tmp_path):
+    method = CoEvoMethod(
+        CoEvoInterface(osc1_task, num_idea=[3, 3]), running_llm=None, output_path=str(tmp_path), num_workers=4
+    )
+    finished = []
+
+    def run_chain_job(mode, parent_chains):
+        time.sleep(0.05 * (3 - int(mode)))
+        finished.append(mode)
+        return [Solution(mode)]
+
+    method._run_chain_job = run_chain_job
+    chains = method._run_chain_jobs([(str(i), None) for i in range(4)])
+
+    assert finished == ["3", "2", "1", "0"]
+    assert [chain[0].sol_string for chain in chains] == ["0", "1", "2", "3"]
+
+
+def test_shared_counters_do_not_lose_updates(osc1_task, tmp_path):
+    llm = PromptSeededLLM(max_delay=0.005)
+    method = run(osc1_task, tmp_path, llm=llm, num_workers=8)
+    assert len(method.state.usage_history["sample"]) == llm.calls
+    assert method.state.sample_count == len(method.state.sol_history)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        rejected = "import os\ndef equation(x, v, params):\n    return x\n"
+        threads = [
+            threading.Thread(target=lambda: [method._evaluate(Solution(rejected)) for _ in range(200)])
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert method.prescreen_rejections == 1600
+
+
+def steady_state_method(task, tmp_path, **kwargs):
+    random.seed(0)
+    np.random.seed(0)
+    return CoEvoMethod(
+        CoEvoInterface(task, num_idea=[3, 3]),
+        running_llm=PromptSeededLLM(max_delay=0.005),
+        output_path=str(tmp_path),
+        verbose=False,
+        num_workers=3,
+        steady_state=True,
+        **kwargs,
+    )
+
+
+def test_steady_state_stops_at_max_chains(osc1_task, tmp_path):
+    method = steady_state_method(osc1_task, tmp_path, max_chains=10)
+    method.run()
+    assert method.state.next_chain_id == 10
+    assert len({sol.metadata.extras["chain_id"] for sol in method.state.sol_history}) == 10
+    assert method._executor is None and method._in_flight == []
+
+
+def test_steady_state_stops_submitting_at_max_samples(osc1_task, tmp_path):
+    method = steady_state_method(osc1_task, tmp_path, max_samples=15)
+    submitted_at = []
+    fill_workers = method._fill_workers
+
+    def record_fill():
+        before = len(method._in_flight)
+        fill_workers()
+        submitted_at.extend([method.state.sample_count] * (len(method._in_flight) - before))
+
+    method._fill_workers = record_fill
+    method.run()
+
+    assert method.state.sample_count >= 15
+    assert submitted_at and max(submitted_at) < 15
+    assert method._executor is None and method._in_flight == []
+
+
+def test_failed_chain_job_shuts_the_pool_down(osc1_task, tmp_path):
+    method = steady_state_method(osc1_task, tmp_path, max_chains=50)
+    method._ensure_initialized()
+    started, finished = [], []
+    lock = threading.Lock()
+
+    def run_chain_job(mode, parent_chains):
+        with lock:
+            started.append(mode)
+            failing = len(started) == 4
+        if failing:
+            raise RuntimeError("chain failed")
+        time.sleep(0.05)
+        with lock:
+            finished.append(mode)
+        return [Solution(mode)]
+
+    method._run_chain_job = run_chain_job
+    method._insert_chain = lambda chain: None
+    with pytest.raises(RuntimeError, match="chain failed"):
+        while True:
+            method._steady_state_step()
+
+    assert method._executor is None and method._in_flight == []
+    assert len(finished) == len(started) - 1
@@ -0,0 +1,62 @@
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from coevo.tasks.dataset import ColumnarDataset
+
+COLUMNS = ["x", "v", "a"]
+
+
+def test_columns_are_memory_mapped_copies_of_the_csv(osc1_csv):
+    data = ColumnarDataset(osc1_csv, COLUMNS)
+    frame = pd.read_csv(osc1_csv)
+
+    assert list(data) == COLUMNS and data.n_rows == len(frame)
+    for name in COLUMNS:
+        assert isinstance(data[name], np.memmap) and not data[name].flags.writeable
+        np.testing.assert_array_equal(data[name], frame[name].to_numpy())
+
+
+def test_fresh_cache_is_mapped_without_converting(osc1_csv, monkeypatch):
+    ColumnarDataset(osc1_csv, COLUMNS)
+    monkeypatch.setattr(ColumnarDataset, "_convert", lambda self: pytest.fail("converted a fresh cache"))
+    assert ColumnarDataset(osc1_csv, COLUMNS).n_rows == 600
+
+
+def test_cache_is_rebuilt_when_the_csv_size_changes(osc1_csv):
+    ColumnarDataset(osc1_csv, COLUMNS)
+    pd.read_csv(osc1_csv).head(100).to_csv(osc1_csv, index=False)
+    assert ColumnarDataset(osc1_csv, COLUMNS).n_rows == 100
+
+
+def test_cache_is_rebuilt_when_only_the_mtime_changes(osc1_csv):
+    ColumnarDataset(osc1_csv, COLUMNS)
+    with open(osc1_csv) as f:
+        header, first, *rest = f.read().split("\n")
+    # Same size, different first value
+    changed = ("9" if first[0] != "9" else "8") + first[1:]
+    with open(osc1_csv, "w") as f:
+        f.write("\n".join([header, changed, *rest]))
+    stat = os.stat(osc1_csv)
+    os.utime(osc1_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert ColumnarDataset(osc1_csv, COLUMNS)["x"][0] == pd.read_csv(osc1_csv)["x"][0] != float(first.split(",")[0])
+
+
+def test_pickle_carries_only_the_paths(osc1_csv):
+    data = ColumnarDataset(osc1_csv, COLUMNS)
+    payload = pickle.dumps(data)
+    loaded = pickle.loads(payload)
+
+    assert len(payload) < 1000
+    assert loaded.cache_dir == data.cache_dir
+    assert isinstance(loaded["a"], np.memmap)
+    np.testing.assert_array_equal(loaded["a"], data["a"])
+
+
+def test_column_count_must_match(osc1_csv):
+    with pytest.raises(ValueError, match="expected"):
+        ColumnarDataset(osc1_csv, ["x", "a"])
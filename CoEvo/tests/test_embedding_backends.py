@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from coevo.core.embedding_backends import HashedNgramBackend, make_embedding_backend
+
+TEXTS = ["linear damping term -c*v", "cubic stiffness -k*x**3", ""]
+
+
+def test_hashed_embeddings_have_the_requested_dimension():
+    embeddings = HashedNgramBackend(dim=128).embed(TEXTS)
+    assert embeddings.shape == (3, 128) and embeddings.dtype == np.float32
+    assert np.linalg.norm(embeddings, axis=1) == pytest.approx([1.0, 1.0, 0.0])
+
+
+def test_hashed_embeddings_are_deterministic_across_processes():
+    embeddings = HashedNgramBackend(dim=128).embed(TEXTS)
+    np.testing.assert_array_equal(embeddings, HashedNgramBackend(dim=128).embed(TEXTS))
+
+    code = (
+        "import sys; from coevo.core.embedding_backends import HashedNgramBackend; "
+        f"sys.stdout.buffer.write(HashedNgramBackend(dim=128).embed({TEXTS!r}).tobytes())"
+    )
+    env = {**os.environ, "PYTHONHASHSEED": "123"}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, env=env).stdout
+    np.testing.assert_array_equal(np.frombuffer(out, dtype=np.float32).reshape(3, 128), embeddings)
+
+
+def test_hashed_embeddings_place_related_texts_closer():
+    a, b, c = HashedNgramBackend().embed(["linear damping term", "nonlinear damping term", "cubic stiffness"])
+    assert a @ b > a @ c
+
+
+def test_make_embedding_backend():
+    backend = make_embedding_backend("hashed")
+    assert isinstance(backend, HashedNgramBackend) and backend.model_id == "hashed-ngram-2048-3-5"
+    with pytest.raises(ValueError, match="unknown embedding backend"):
+        make_embedding_backend("word2vec")
+
+
+@pytest.mark.parametrize(
+    "name, missing, install",
+    [("hf", "torch", "uv sync --extra summarizer"), ("onnx", "onnxruntime", "uv pip install onnxruntime")],
+)
+def test_missing_model_dependencies_are_reported(monkeypatch, tmp_path, name, missing, install):
+    monkeypatch.setitem(sys.modules, missing, None)
+    with pytest.raises(ImportError, match=f"needs .*{missing} is missing.*{install}"):
+        make_embedding_backend(name, str(tmp_path))
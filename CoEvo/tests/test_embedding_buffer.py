@@ -0,0 +1,29 @@
+import numpy as np
+
+from coevo.core.embedding_buffer import EmbeddingRingBuffer
+
+
+def test_wraparound_evicts_the_oldest_rows():
+    buffer = EmbeddingRingBuffer(3)
+    for i in range(5):
+        buffer.append([i, -i], f"idea {i}")
+
+    assert len(buffer) == 3
+    assert buffer.head == 2
+    assert buffer.items() == ["idea 2", "idea 3", "idea 4"]
+    assert buffer.view()[buffer.slot_order()].tolist() == [[2, -2], [3, -3], [4, -4]]
+    assert [buffer.item(slot) for slot in range(3)] == ["idea 3", "idea 4", "idea 2"]
+
+
+def test_partial_buffer_and_clear():
+    buffer = EmbeddingRingBuffer(4, dim=2)
+    assert buffer.view().shape == (0, 2)
+    buffer.append(np.ones(2), "a")
+    buffer.append(np.zeros(2), "b")
+    assert buffer.items() == ["a", "b"]
+    assert buffer.view().dtype == np.float32 and buffer.view().shape == (2, 2)
+
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.items() == []
+    buffer.append(np.full(2, 7.0), "c")
+    assert buffer.items() == ["c"] and buffer.view().tolist() == [[7.0, 7.0]]
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from coevo.core.embedding_cache import EmbeddingCache, embedding_key
+
+
+def test_key_separates_model_and_text():
+    assert embedding_key("gpt2", "idea") == embedding_key("gpt2", "idea")
+    assert embedding_key("gpt2", "idea") != embedding_key("gpt", "2idea")
+    assert embedding_key("gpt2", "idea") != embedding_key("hashed-256", "idea")
+
+
+def test_memory_tier_evicts_the_least_recently_used():
+    cache = EmbeddingCache(max_size=2)
+    cache.put("m", "a", [1.0])
+    cache.put("m", "b", [2.0])
+    assert cache.get("m", "a") is not None
+    cache.put("m", "c", [3.0])
+
+    assert len(cache) == 2
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "c")[0] == 3.0
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cached_embeddings_are_read_only_float32():
+    cache = EmbeddingCache()
+    source = np.arange(4, dtype=np.float64).reshape(2, 2)
+    stored = cache.put("m", "a", source)
+    source[0, 0] = 9.0
+
+    assert stored.dtype == np.float32 and stored.shape == (4,)
+    assert stored[0] == 0.0
+    with pytest.raises(ValueError):
+        cache.get("m", "a")[0] = 1.0
+
+
+def test_file_is_shared_by_later_and_concurrent_caches(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite")
+    EmbeddingCache(path).put("m", "a", [1.0, 2.0])
+
+    resumed = EmbeddingCache(path)
+    assert resumed.get("m", "a").tolist() == [1.0, 2.0]
+    assert resumed.get("other-model", "a") is None
+    assert (resumed.disk_hits, resumed.misses) == (1, 1)
+
+    writer, reader = EmbeddingCache(path), EmbeddingCache(path)
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(lambda i: writer.put("m", str(i), [float(i)]), range(40)))
+    assert [reader.get("m", str(i))[0] for i in range(40)] == list(range(40))
+    assert reader.disk_hits == 40
@@ -0,0 +1,29 @@
+from evotoolkit.core import Solution
+
+from coevo.core import EvaluationCache
+from coevo.core.eval_cache import normalized_code_hash
+
+CODE = "import numpy as np\ndef equation(x, v, params):\n    return params[0]*x + params[1]*v\n"
+
+
+def test_normalised_hash_ignores_comments_and_docstrings():
+    documented = 'import numpy as np\ndef equation(x, v, params):\n    """Linear."""\n    # fitted\n    return params[0]*x + params[1]*v\n'
+    assert normalized_code_hash(documented) == normalized_code_hash(CODE)
+    assert normalized_code_hash(CODE.replace("params[1]", "params[2]")) != normalized_code_hash(CODE)
+
+
+def test_cache_round_trip_returns_independent_copies(osc1_task):
+    cache = EvaluationCache(max_size=2)
+    res = osc1_task.evaluate(Solution(CODE))
+    key = normalized_code_hash(CODE)
+    cache.put(key, res)
+
+    hit = cache.get(normalized_code_hash("# comment\n" + CODE))
+    assert (hit.valid, hit.score, hit.additional_info) == (res.valid, res.score, res.additional_info)
+    hit.additional_info["params"][0] = 99.0
+    assert cache.get(key).additional_info["params"] == res.additional_info["params"]
+
+    cache.put("b", res)
+    cache.put("c", res)
+    assert cache.get(key) is None
+    assert (cache.hits, cache.misses, len(cache)) == (2, 1, 2)
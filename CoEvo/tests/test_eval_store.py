@@ -0,0 +1,136 @@
+import tempfile
+
+from evotoolkit.core import EvaluationResult, Solution
+
+from coevo.core import CoEvoInterface, CoEvoMethod, EvaluationCache, SQLiteEvaluationStore
+from coevo.core.eval_cache import normalized_code_hash
+
+CODE = "import numpy as np\ndef equation(x, v, params):\n    return params[0]*x + params[1]*v\n"
+
+
+class FlakyEvaluator:
+    """Loses its worker on the first call, then evaluates normally."""
+
+    def __init__(self, task) -> None:
+        self.task = task
+        self.calls = 0
+
+    def evaluate(self, sol):
+        self.calls += 1
+        if self.calls == 1:
+            return EvaluationResult(
+                valid=False,
+                score=float("-inf"),
+                additional_info={"error": "Evaluation worker died (exit code -9).", "transient": True},
+            )
+        return self.task.evaluate(sol)
+
+
+def test_store_round_trip_across_instances(osc1_task, tmp_path):
+    path = str(tmp_path / "evals.sqlite")
+    res = osc1_task.evaluate(Solution(CODE))
+    SQLiteEvaluationStore(path).put(osc1_task, "key", res)
+
+    store = SQLiteEvaluationStore(path)
+    loaded = store.get(osc1_task, "key")
+    assert (loaded.valid, loaded.score) == (res.valid, res.score)
+    assert loaded.additional_info["params"] == res.additional_info["params"]
+    assert loaded.additional_info["fitness_list"] == res.additional_info["fitness_list"]
+    assert store.get(osc1_task, "other") is None
+    assert (store.hits, store.misses) == (1, 1)
+
+    invalid = EvaluationResult(valid=False, score=float("-inf"), additional_info={"error": "SyntaxError"})
+    store.put(osc1_task, "bad", invalid)
+    loaded = store.get(osc1_task, "bad")
+    assert not loaded.valid and loaded.score == float("-inf") and loaded.additional_info == {"error": "SyntaxError"}
+
+
+def test_store_refuses_transient_results_and_timeouts(osc1_task, tmp_path):
+    store = SQLiteEvaluationStore(str(tmp_path / "evals.sqlite"))
+    for flag in ["transient", "timed_out"]:
+        store.put(osc1_task, flag, EvaluationResult(valid=False, score=float("-inf"), additional_info={flag: True}))
+        assert store.get(osc1_task, flag) is None
+    assert (store.hits, store.misses) == (0, 2)
+
+
+def test_timeouts_are_cached_for_the_run_only(osc1_task, tmp_path):
+    class TimingOutEvaluator:
+        calls = 0
+
+        def evaluate(self, sol):
+            self.calls += 1
+            return EvaluationResult(
+                valid=False, score=float("-inf"), additional_info={"error": "timed out", "timed_out": True}
+            )
+
+    evaluator = TimingOutEvaluator()
+    store = SQLiteEvaluationStore(str(tmp_path / "evals.sqlite"))
+    method = CoEvoMethod(
+        CoEvoInterface(osc1_task, num_idea=[3, 3]),
+        running_llm=None,
+        output_path=str(tmp_path),
+        verbose=False,
+        eval_cache=EvaluationCache(),
+        eval_store=store,
+        evaluator=evaluator,
+    )
+
+    assert not method._evaluate(Solution(CODE)).valid
+    assert not method._evaluate(Solution(CODE)).valid
+    assert evaluator.calls == 1
+    assert store.get(osc1_task, normalized_code_hash(CODE)) is None
+
+
+def test_transient_results_are_evaluated_again(osc1_task, tmp_path):
+    evaluator = FlakyEvaluator(osc1_task)
+    eval_cache = EvaluationCache()
+    store = SQLiteEvaluationStore(str(tmp_path / "evals.sqlite"))
+    method = CoEvoMethod(
+        CoEvoInterface(osc1_task, num_idea=[3, 3]),
+        running_llm=None,
+        output_path=tempfile.mkdtemp(),
+        verbose=False,
+        eval_cache=eval_cache,
+        eval_store=store,
+        evaluator=evaluator,
+    )
+
+    assert not method._evaluate(Solution(CODE)).valid
+    assert len(eval_cache) == 0
+    assert method._evaluate(Solution(CODE)).valid
+    assert evaluator.calls == 2
+    assert store.get(osc1_task, normalized_code_hash(CODE)).valid
+
+
+def test_gradient_mode_is_part_of_the_store_key(osc1_csv, tmp_path):
+    from coevo.tasks import Oscillation1Task
+
+    path = str(tmp_path / "evals.sqlite")
+    plain, stacked = Oscillation1Task(osc1_csv), Oscillation1Task(osc1_csv, gradient="stack")
+    assert plain.fit_key == "" and stacked.fit_key == "stack-gradient"
+
+    SQLiteEvaluationStore(path).put(plain, "key", plain.evaluate(Solution(CODE)))
+    assert SQLiteEvaluationStore(path).get(stacked, "key") is None
+    assert SQLiteEvaluationStore(path).get(plain, "key") is not None
+
+
+def test_fits_started_from_a_fingerprint_match_are_not_persisted(osc1_task, tmp_path):
+    rewritten = "import numpy as np\ndef equation(x, v, params):\n    return params[1]*v + params[0]*x\n"
+    store = SQLiteEvaluationStore(str(tmp_path / "evals.sqlite"))
+    method = CoEvoMethod(
+        CoEvoInterface(osc1_task, num_idea=[3, 3]),
+        running_llm=None,
+        output_path=str(tmp_path),
+        verbose=False,
+        eval_cache=EvaluationCache(),
+        eval_store=store,
+        fingerprint_cache=EvaluationCache(),
+    )
+
+    method._evaluate(Solution(CODE))
+    sol = Solution(rewritten)
+    assert method._evaluate(sol).valid
+    assert "fingerprint_start" in sol.metadata.extras["eval_hints"]
+    assert store.get(osc1_task, normalized_code_hash(CODE)) is not None
+    assert store.get(osc1_task, normalized_code_hash(rewritten)) is None
+    assert len(method.eval_cache) == 2
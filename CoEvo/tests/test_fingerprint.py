@@ -0,0 +1,69 @@
+import tempfile
+
+from evotoolkit.core import Solution
+
+from coevo.core import CoEvoInterface, CoEvoMethod, EvaluationCache
+
+SQUARE = "import numpy as np\ndef equation(x, v, params):\n    return params[0]*np.power(x,2) + params[1]*v\n"
+SQUARE_REWRITTEN = "import numpy as np\ndef equation(x, v, params):\n    t = params[1]*v\n    return t + params[0]*x*x\n"
+SQUARE_CLIPPED = (
+    "import numpy as np\ndef equation(x, v, params):\n    return np.maximum(params[0], 0)*np.power(x,2) + params[1]*v\n"
+)
+
+
+def make_method(task, **kwargs):
+    return CoEvoMethod(
+        CoEvoInterface(task, num_idea=[3, 3]),
+        running_llm=None,
+        output_path=tempfile.mkdtemp(),
+        verbose=False,
+        fingerprint_cache=EvaluationCache(),
+        **kwargs,
+    )
+
+
+def test_equivalent_code_shares_fingerprint(osc1_task):
+    assert osc1_task.fingerprint(SQUARE) == osc1_task.fingerprint(SQUARE_REWRITTEN)
+
+
+def test_sign_dependent_code_gets_its_own_fingerprint(osc1_task):
+    assert osc1_task.fingerprint(SQUARE) != osc1_task.fingerprint(SQUARE_CLIPPED)
+
+
+def test_fingerprint_match_skips_the_fit(osc1_task):
+    method = make_method(osc1_task)
+    first = method._evaluate(Solution(SQUARE))
+    sol = Solution(SQUARE_REWRITTEN)
+    second = method._evaluate(sol)
+
+    assert second.additional_info["fingerprint_match"]
+    assert second.additional_info["params"] == first.additional_info["params"]
+    assert abs(second.score - first.score) <= 1e-9 * abs(first.score)
+    assert method.fingerprint_cache.hits == method.fingerprint_reuses == 1
+
+
+def test_fingerprint_match_with_the_wrong_mse_only_warm_starts_the_fit(osc1_task):
+    method = make_method(osc1_task)
+    first = method._evaluate(Solution(SQUARE))
+    # A probe collision: the stored params do not give the new candidate the stored MSE
+    (match,) = method.fingerprint_cache._entries.values()
+    match.additional_info["params"][0] *= 1.01
+    sol = Solution(SQUARE_REWRITTEN)
+    second = method._evaluate(sol)
+
+    assert "fingerprint_match" not in second.additional_info
+    assert sol.metadata.extras["eval_hints"]["fingerprint_start"] == match.additional_info["params"]
+    assert 0 < second.additional_info["nfev"] < first.additional_info["nfev"]
+    assert abs(second.score - first.score) <= 1e-9 * abs(first.score)
+    assert method.fingerprint_reuses == 0
+
+
+def test_fingerprinting_is_off_with_a_sandboxed_evaluator(osc1_task):
+    class Evaluator:
+        def evaluate(self, solution):
+            return osc1_task.evaluate(solution)
+
+    method = make_method(osc1_task, evaluator=Evaluator())
+    method._evaluate(Solution(SQUARE))
+    method._evaluate(Solution(SQUARE_REWRITTEN))
+    assert method.fingerprint_cache.hits == method.fingerprint_cache.misses == 0
@@ -0,0 +1,181 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from coevo.tasks.fitting import GRADIENT_MODES, N_PARAMS, dynamic_active_params, fit_params, static_active_params
+
+CUBIC = "def equation(x, v, params):\n    return params[0]*x + params[1]*v + params[2]*x**3 + params[3]\n"
+
+
+def damped_wave(x, params):
+    return params[0] * np.sin(params[1] * x + params[2]) * np.exp(params[3] * x) + params[4] * np.tanh(params[5] * x)
+
+
+@pytest.fixture(scope="module")
+def cubic_data():
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-2, 2, 600)
+    v = rng.uniform(-1, 1, 600)
+    return x, v, -0.5 * x - 0.1 * v + 0.05 * x**3 + rng.normal(0, 0.01, 600)
+
+
+def fit_cubic(cubic_data, **kwargs):
+    """Fit CUBIC; returns the result and the exact least-squares MSE."""
+    x, v, a = cubic_data
+    namespace = {}
+    exec(CUBIC, namespace)
+    design = np.stack([x, v, x**3, np.ones_like(x)], axis=1)
+    coef = np.linalg.lstsq(design, a, rcond=None)[0]
+    baseline = np.mean((design @ coef - a) ** 2)
+    return fit_params(namespace["equation"], (x, v), a, candidate_code=CUBIC, **kwargs), baseline
+
+
+@pytest.fixture(scope="module")
+def wave_data():
+    x = np.random.default_rng(0).uniform(-2, 2, 500)
+    return x, np.sin(3 * x) * np.exp(0.3 * x) + 0.05 * x**3
+
+
+@pytest.mark.parametrize("optimizer", ["bfgs", "lbfgsb", "lm", "trf"])
+def test_early_cutoff_stops_every_backend(wave_data, optimizer):
+    x, y = wave_data
+    full = fit_params(damped_wave, (x,), y, optimizer=optimizer)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        cut = fit_params(damped_wave, (x,), y, optimizer=optimizer, survival_bar=1e-9, time_budget=0)
+
+    assert full.truncated is None
+    assert cut.truncated is not None
+    assert cut.nfev < full.nfev
+    assert np.isfinite(cut.fun) and len(cut.x) == len(full.x)
+
+
+@pytest.mark.parametrize("optimizer", ["bfgs", "lbfgsb"])
+@pytest.mark.parametrize("gradient", [None, *GRADIENT_MODES])
+def test_batched_gradients_reach_the_least_squares_mse(cubic_data, optimizer, gradient):
+    result, baseline = fit_cubic(cubic_data, optimizer=optimizer, gradient=gradient)
+    assert result.fun == pytest.approx(baseline, rel=1e-5)
+
+
+def test_varpro_solves_linear_params_exactly(cubic_data):
+    result, baseline = fit_cubic(cubic_data, optimizer="varpro")
+    assert result.fun == pytest.approx(baseline, rel=1e-9)
+    assert result.linear_params == [0, 1, 2, 3]
+
+
+def test_varpro_separates_linear_from_nonlinear_params():
+    x = np.random.default_rng(0).uniform(-2, 2, 300)
+    result = fit_params(lambda x, p: p[0] * np.exp(p[1] * x), (x,), 2.0 * np.exp(0.5 * x), optimizer="varpro")
+    assert result.linear_params == [0]
+    assert result.x[:2] == pytest.approx([2.0, 0.5], rel=1e-4)
+
+
+def test_varpro_without_linear_params_falls_back_to_bfgs():
+    x = np.random.default_rng(0).uniform(-2, 2, 300)
+    result = fit_params(lambda x, p: np.exp(p[1] * x), (x,), np.exp(0.5 * x), optimizer="varpro")
+    assert result.get("linear_params") is None
+    assert result.x[1] == pytest.approx(0.5, rel=1e-4)
+
+
+@pytest.mark.parametrize("optimizer", ["lm", "trf"])
+def test_least_squares_backends_reach_the_least_squares_mse(cubic_data, optimizer):
+    result, baseline = fit_cubic(cubic_data, optimizer=optimizer)
+    assert result.fun == pytest.approx(baseline, rel=1e-9)
+
+
+def test_trf_keeps_params_within_bounds(cubic_data):
+    result, baseline = fit_cubic(cubic_data, optimizer="trf", bounds=(0.0, 10.0))
+    assert np.all(result.x >= 0.0) and np.all(result.x <= 10.0)
+    assert result.fun > baseline
+
+
+def test_unknown_optimizer_is_rejected(cubic_data):
+    with pytest.raises(ValueError, match="Unknown optimizer"):
+        fit_cubic(cubic_data, optimizer="newton")
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ("params[0]*x + params[3]*v", [0, 3]),
+        ("params[-1]*x", [9]),
+        ("params[:2].sum()*x + params[5]", [0, 1, 5]),
+        ("params[-3:].sum()*x", [7, 8, 9]),
+        ("x + v", []),
+        ("params[i]*x", None),
+        ("np.dot(params, x)", None),
+        ("params[::2].sum()*x", None),
+        ("params[10]*x", None),
+    ],
+)
+def test_static_active_params(body, expected):
+    code = f"import numpy as np\ni = 2\ndef equation(x, v, params):\n    return {body}\n"
+    assert static_active_params(code) == expected
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "def equation(x, v, params)\n    return x\n",
+        "def f(x, v, params):\n    return params[0]*x\n",
+        "def equation(x, v, params):\n    params = params * 2\n    return params[0]*x\n",
+    ],
+)
+def test_static_active_params_gives_up_on_unclear_code(code):
+    assert static_active_params(code) is None
+
+
+def test_dynamic_active_params_probes_the_equation(cubic_data):
+    x, v, _ = cubic_data
+    assert dynamic_active_params(lambda x, v, p: p[2] * x + np.dot(p[4:6], [1.0, 1.0]) * v, (x, v)) == [2, 4, 5]
+
+    def broken(x, v, p):
+        raise ValueError("bad probe")
+
+    assert dynamic_active_params(broken, (x, v)) == list(range(N_PARAMS))
+
+
+def test_inactive_params_keep_their_start_value(cubic_data):
+    result, baseline = fit_cubic(cubic_data, starts=[[5.0] * N_PARAMS])
+    assert result.active_params == [0, 1, 2, 3]
+    assert result.x[4:].tolist() == [5.0] * 6
+    assert result.fun == pytest.approx(baseline, rel=1e-5)
+
+
+def test_warm_start_from_fitted_params_converges_sooner(cubic_data):
+    cold, _ = fit_cubic(cubic_data)
+    warm, _ = fit_cubic(cubic_data, starts=[cold.x])
+
+    assert warm.fun == pytest.approx(cold.fun, rel=1e-6)
+    assert warm.nfev < cold.nfev
+    assert warm.start_index == 0 and warm.n_starts == 1
+
+
+def test_unusable_warm_starts_are_ignored(cubic_data):
+    cold, _ = fit_cubic(cubic_data)
+    warm, _ = fit_cubic(cubic_data, starts=[[np.nan] * N_PARAMS, [0.5, 0.5]])
+
+    assert warm.fun == cold.fun
+    assert warm.nfev == cold.nfev
+
+
+def test_multi_start_keeps_the_best_start(wave_data):
+    x, y = wave_data
+    single = fit_params(damped_wave, (x,), y)
+    multi = fit_params(damped_wave, (x,), y, n_starts=4, seed=0)
+    again = fit_params(damped_wave, (x,), y, n_starts=4, seed=0)
+
+    assert multi.n_starts == 4
+    assert multi.fun <= single.fun
+    assert (multi.start_index, multi.fun) == (again.start_index, again.fun)
+    if multi.start_index == 0:
+        assert multi.fun == single.fun
+
+
+def test_multi_start_includes_the_warm_start(cubic_data):
+    cold, _ = fit_cubic(cubic_data)
+    multi, baseline = fit_cubic(cubic_data, starts=[cold.x], n_starts=3)
+
+    assert multi.n_starts == 3
+    assert multi.fun == pytest.approx(baseline, rel=1e-5)
@@ -0,0 +1,45 @@
+import json
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from coevo.core.embedding_backends import HFEmbeddingBackend  # noqa: E402
+
+
+def byte_level_alphabet() -> list[str]:
+    """The 256 characters GPT-2's byte-level BPE maps the bytes to."""
+    printable = [*range(ord("!"), ord("~") + 1), *range(ord("¡"), ord("¬") + 1), *range(ord("®"), ord("ÿ") + 1)]
+    extra = iter(range(256, 512))
+    return [chr(b) if b in printable else chr(next(extra)) for b in range(256)]
+
+
+@pytest.fixture(scope="module")
+def tiny_gpt2(tmp_path_factory):
+    """A randomly initialised two-layer GPT-2 with a byte-level tokenizer and no merges."""
+    from transformers import GPT2Config, GPT2Model, GPT2Tokenizer
+
+    path = tmp_path_factory.mktemp("tiny-gpt2")
+    vocab = {char: i for i, char in enumerate(byte_level_alphabet())}
+    vocab["<|endoftext|>"] = len(vocab)
+    (path / "vocab.json").write_text(json.dumps(vocab))
+    (path / "merges.txt").write_text("#version: 0.2\n")
+    GPT2Tokenizer(str(path / "vocab.json"), str(path / "merges.txt")).save_pretrained(path)
+
+    torch.manual_seed(0)
+    config = GPT2Config(vocab_size=len(vocab), n_positions=128, n_embd=32, n_layer=2, n_head=2)
+    GPT2Model(config).save_pretrained(path)
+    return str(path)
+
+
+def test_padded_batch_matches_unpadded_passes(tiny_gpt2):
+    backend = HFEmbeddingBackend(tiny_gpt2, device="cpu")
+    texts = ["v", "linear damping term -c*v", "cubic stiffness -k*x**3 with a longer description"]
+    assert len({len(backend.tokenizer(text)["input_ids"]) for text in texts}) == 3
+
+    batched = backend.embed(texts)
+    unpadded = np.vstack([backend.embed([text]) for text in texts])
+    assert batched.shape == (3, 32)
+    np.testing.assert_allclose(batched, unpadded, rtol=1e-5, atol=1e-6)
@@ -0,0 +1,183 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from coevo.utils import llm_pool
+from coevo.utils.llm_pool import LLMPool, TokenBucket
+from coevo.utils.stub_server import StubLLMServer
+
+REPLY = json.dumps({"choices": [{"message": {"content": "ok"}}], "usage": {"total_tokens": 3}}).encode()
+
+
+class Server:
+    """Chat-completions endpoint that closes every connection after one request.
+
+    With ``drop``, it closes without answering; otherwise it answers as if the
+    connection were kept alive, leaving the client with a stale connection.
+    """
+
+    def __init__(self, drop: bool = False) -> None:
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers["Content-Length"]))
+                server.requests += 1
+                self.close_connection = True
+                if drop:
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(REPLY)))
+                self.end_headers()
+                self.wfile.write(REPLY)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1/chat/completions"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server(request):
+    server = Server(drop=getattr(request, "param", False))
+    yield server
+    server.close()
+
+
+def test_stale_keep_alive_connection_is_resent_once(server):
+    llm = LLMPool(server.url, "key", "model", timeout=5).client("main")
+    for _ in range(3):
+        assert llm.get_response("hi")[0] == "ok"
+    assert server.requests == 3
+
+
+@pytest.mark.parametrize("server", [True], indirect=True)
+def test_failure_on_a_new_connection_is_not_resent(server):
+    llm = LLMPool(server.url, "key", "model", timeout=5).client("main")
+    with pytest.raises(ConnectionError):
+        llm.get_response("hi")
+    assert server.requests == 1
+
+
+class FakeClock:
+    """Stands in for the ``time`` module in ``llm_pool``; only ``sleep`` advances it."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(llm_pool, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def stub_server():
+    server = StubLLMServer(seed=0, idle_timeout=0.2).start()
+    yield server
+    server.stop()
+
+
+def test_token_bucket_allows_a_burst_then_waits_for_refills(clock):
+    bucket = TokenBucket(60)
+    for _ in range(60):
+        bucket.acquire()
+    assert clock.slept == []
+
+    bucket.acquire()
+    bucket.acquire(2)
+    assert clock.slept == pytest.approx([1.0, 2.0])
+
+    clock.now += 600
+    bucket.acquire(500)
+    assert clock.slept == pytest.approx([1.0, 2.0])
+
+
+def test_token_bucket_debt_delays_the_next_acquire(clock):
+    bucket = TokenBucket(60)
+    bucket.consume(90)
+    bucket.acquire(1)
+    assert clock.slept == pytest.approx([31.0])
+
+    bucket.consume(-1000)
+    assert bucket._tokens == 60
+
+
+def test_pool_rpm_limit(clock, stub_server):
+    llm = LLMPool(stub_server.url, "key", "model", rpm=60).client("main")
+    usages = [llm.get_response("def equation(x, v, params) -> np.ndarray:")[1] for _ in range(62)]
+
+    assert clock.slept == pytest.approx([1.0, 1.0])
+    assert [u["queue_time"] for u in usages[-3:]] == pytest.approx([0.0, 1.0, 1.0])
+
+
+def test_pool_tpm_is_reconciled_with_reported_usage(clock, stub_server):
+    pool = LLMPool(stub_server.url, "key", "model", tpm=60000, completion_token_estimate=5000)
+    _, usage = pool.client("main").get_response("def equation(x, v, params) -> np.ndarray:")
+
+    assert usage["total_tokens"] < 5000
+    assert pool._tpm_bucket._tokens == 60000 - usage["total_tokens"]
+
+
+def test_concurrency_budget_is_queue_time_not_service_time():
+    server = StubLLMServer(latency="fixed:0.3").start()
+    try:
+        pool = LLMPool(server.url, "key", "model", max_concurrency=2)
+        clients = [pool.client("main"), pool.client("summarizer")]
+        with ThreadPoolExecutor(4) as executor:
+            usages = list(executor.map(lambda i: clients[i % 2].get_response("hi")[1], range(4)))
+    finally:
+        server.stop()
+
+    queue_times = sorted(u["queue_time"] for u in usages)
+    assert queue_times[1] < 0.15 and queue_times[2] > 0.25
+    assert all(0.3 <= u["service_time"] < 0.45 for u in usages)
+    assert pool.stats["main"]["calls"] == pool.stats["summarizer"]["calls"] == 2
+
+
+def test_pooled_llm_resends_on_a_connection_the_stub_server_dropped(stub_server):
+    pool = LLMPool(stub_server.url, "key", "model", timeout=5)
+    reused = []
+    acquire_conn = pool._acquire_conn
+
+    def record_acquire():
+        conn, was_reused = acquire_conn()
+        reused.append(was_reused)
+        return conn, was_reused
+
+    pool._acquire_conn = record_acquire
+    llm = pool.client("main")
+    llm.get_response("hi")
+    llm.get_response("hi")
+    time.sleep(0.5)
+    llm.get_response("hi")
+
+    assert reused == [False, True, True, False]
+    assert stub_server.counts["ok"] == 3
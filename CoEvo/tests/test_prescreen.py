@@ -0,0 +1,74 @@
+import pytest
+from evotoolkit.core import Solution
+
+from coevo.core import CoEvoInterface, CoEvoMethod
+from coevo.tasks import base
+from coevo.tasks.prescreen import prescreen_equation
+
+
+def equation(body, signature="x, v, params"):
+    return f"import numpy as np\ndef equation({signature}):\n{body}\n"
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        equation("    return params[0]*x + params[1]*np.sin(v)"),
+        equation("    return params[-1]*x"),
+        equation("    terms = [params[i]*x**i for i in range(3)]\n    return sum(terms)"),
+        equation("    return params[0]*args[0]", signature="*args, params"),
+    ],
+)
+def test_accepts_fittable_code(code):
+    assert prescreen_equation(code, n_inputs=2).error is None
+
+
+def test_python_loops_are_accepted_but_flagged():
+    result = prescreen_equation(equation("    out = 0\n    for k in range(3):\n        out = out + params[k]*x\n    return out"), 2)
+    assert result.error is None
+    assert not result.vectorised
+    assert result.reasons == ["Python loop on line 4"]
+
+
+@pytest.mark.parametrize(
+    "code, message",
+    [
+        ("def equation(x, v, params)\n    return x\n", "SyntaxError"),
+        ("import os\ndef equation(x, v, params):\n    return x\n", "Import of 'os'"),
+        ("from subprocess import run\ndef equation(x, v, params):\n    return x\n", "Import of 'subprocess'"),
+        (equation("    return eval('x')"), "Call to 'eval'"),
+        ("def f(x, v, params):\n    return x\n", "No top-level function"),
+        (equation("    return params[0]*x", signature="x, params"), "takes 2 positional arguments"),
+        (equation("    return params[10]*x"), "params[10] is out of range"),
+        (equation("    return np.array([params[0]*xi for xi in x])"), "loops over the rows of 'x'"),
+        (equation("    out = x.copy()\n    for i in range(len(v)):\n        out[i] = v[i]\n    return out"), "rows of 'v'"),
+    ],
+)
+def test_rejects_unfittable_code(code, message):
+    result = prescreen_equation(code, n_inputs=2)
+    assert result.error is not None and message in result.error
+
+
+@pytest.mark.parametrize(
+    "signature", ["x, v, params, scale=1.0", "x, v, params=None", "x, v, params, *, scale=1.0", "x, v, params, *rest"]
+)
+def test_optional_arguments_after_params_are_accepted(signature):
+    assert prescreen_equation(equation("    return params[0]*x", signature=signature), n_inputs=2).error is None
+
+
+def test_required_arguments_after_params_are_rejected():
+    result = prescreen_equation(equation("    return params[0]*x", signature="x, v, params, scale, shift=0"), 2)
+    assert "takes 4 required positional arguments" in result.error
+
+
+def test_coevo_method_screens_each_candidate_once(osc1_task, tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(base, "prescreen_equation", lambda *args: calls.append(args) or prescreen_equation(*args))
+    method = CoEvoMethod(
+        CoEvoInterface(osc1_task, num_idea=[3, 3]), running_llm=None, output_path=str(tmp_path), verbose=False
+    )
+    loop = equation("    out = 0\n    for k in range(2):\n        out = out + params[k]*x\n    return out")
+    res = method._evaluate(Solution(loop))
+
+    assert len(calls) == 1
+    assert res.valid and res.additional_info["not_vectorised"] == ["Python loop on line 4"]
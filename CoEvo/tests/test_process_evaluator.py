@@ -0,0 +1,71 @@
+import os
+import signal
+
+import pytest
+from evotoolkit.core import Solution
+
+from coevo.core import ProcessPoolEvaluator
+
+GOOD = "import numpy as np\ndef equation(x, v, params):\n    return params[0]*x + params[1]*v\n"
+SLOW = "import time\ndef equation(x, v, params):\n    time.sleep(60)\n    return params[0]*x\n"
+
+
+@pytest.fixture
+def evaluator(osc1_task):
+    evaluator = ProcessPoolEvaluator(osc1_task, num_workers=1, timeout_seconds=2)
+    yield evaluator
+    evaluator.close()
+
+
+def worker_pid(evaluator):
+    (worker,) = evaluator._workers
+    return worker.process.pid
+
+
+def test_timeout_replaces_the_worker(evaluator):
+    pid = worker_pid(evaluator)
+    res = evaluator.evaluate(Solution(SLOW))
+
+    assert not res.valid
+    assert res.additional_info["error"].startswith("Evaluation timed out")
+    assert res.additional_info["timed_out"] and "transient" not in res.additional_info
+    assert evaluator.timeouts == 1
+    assert worker_pid(evaluator) != pid
+    assert evaluator.evaluate(Solution(GOOD)).valid
+
+
+def test_dead_worker_is_replaced(evaluator):
+    pid = worker_pid(evaluator)
+    os.kill(pid, signal.SIGKILL)
+    res = evaluator.evaluate(Solution(GOOD))
+
+    assert not res.valid
+    assert res.additional_info["error"].startswith("Evaluation worker died")
+    assert res.additional_info["transient"]
+    assert evaluator.crashes == 1
+    assert worker_pid(evaluator) != pid
+    assert evaluator.evaluate(Solution(GOOD)).valid
+
+
+def test_worker_is_recycled_after_max_tasks(osc1_task):
+    with ProcessPoolEvaluator(osc1_task, num_workers=1, max_tasks_per_worker=2) as evaluator:
+        pid = worker_pid(evaluator)
+        assert evaluator.evaluate(Solution(GOOD)).valid
+        assert worker_pid(evaluator) == pid
+        assert evaluator.evaluate(Solution(GOOD)).valid
+        assert worker_pid(evaluator) != pid
+
+
+def test_worker_whose_replacement_fails_is_dropped(evaluator):
+    os.kill(worker_pid(evaluator), signal.SIGKILL)
+
+    def spawn():
+        raise OSError("fork failed")
+
+    evaluator._spawn = spawn
+    with pytest.raises(OSError, match="fork failed"):
+        evaluator.evaluate(Solution(GOOD))
+
+    assert evaluator._workers == set() and evaluator._idle.empty()
+    with pytest.raises(RuntimeError, match="no workers"):
+        evaluator.evaluate(Solution(GOOD))
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from evotoolkit.core import Solution
+
+from coevo.tasks import Oscillation1Task
+
+CUBIC = "import numpy as np\ndef equation(x, v, params):\n    return params[0]*x + params[1]*v + params[2]*x**3\n"
+CONSTANT = "import numpy as np\ndef equation(x, v, params):\n    return params[0] + 0*x\n"
+
+
+@pytest.fixture
+def racing_task(osc1_csv):
+    task = Oscillation1Task(osc1_csv, racing=True)
+    task.race_eta = 2
+    task.race_min_rows = 100
+    return task
+
+
+def evaluate(task, code, survival_bar=None):
+    sol = Solution(code)
+    sol.metadata.extras["eval_hints"] = {"survival_bar": survival_bar}
+    return task.evaluate(sol)
+
+
+def test_race_rungs_grow_and_cover_the_target_range(racing_task):
+    rungs = racing_task.race_rows()
+    target = np.asarray(racing_task.evaluate_data["a"])
+
+    assert [len(rows) for rows in rungs] == [150, 300]
+    for rows in rungs:
+        assert len(np.unique(rows)) == len(rows)
+        # Stratified on the target: each rung reaches into both tails
+        assert target[rows].min() <= np.quantile(target, 0.01)
+        assert target[rows].max() >= np.quantile(target, 0.99)
+
+
+def test_candidate_worse_than_the_bar_is_culled_on_the_first_rung(racing_task):
+    raced = evaluate(racing_task, CONSTANT, survival_bar=1e-3)
+    rows = racing_task.race_rows()[0]
+    target = np.asarray(racing_task.evaluate_data["a"])[rows]
+
+    assert raced.additional_info["dominated"]
+    assert "raced on 150 of 600 rows" in raced.additional_info["truncated"]
+    # The subsample MSE of the best constant, well above race_margin times the bar
+    assert raced.additional_info["mse"] == pytest.approx(np.var(target), rel=1e-6)
+    assert raced.additional_info["mse"] > racing_task.race_margin * 1e-3
+
+
+def test_candidate_that_survives_gets_the_full_fit(racing_task, osc1_csv):
+    plain = evaluate(Oscillation1Task(osc1_csv), CUBIC)
+    raced = evaluate(racing_task, CUBIC, survival_bar=1e-3)
+
+    assert "truncated" not in raced.additional_info
+    assert raced.score == pytest.approx(plain.score, rel=1e-9)
+    assert raced.additional_info["race_time"] > 0
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from coevo.utils.llm_pool import LLMHTTPError
+from coevo.utils.retry import FORMAT, THROTTLING, TRANSPORT, RetryPolicy, classify_failure
+
+
+def raised(call):
+    try:
+        call()
+    except Exception as e:
+        return e
+    raise AssertionError("no exception")
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda: json.loads("<html>Bad gateway</html>"),
+        lambda: {"error": "overloaded"}["choices"],
+        lambda: {"choices": []}["choices"][0],
+    ],
+)
+def test_malformed_200_bodies_are_format_failures(call):
+    assert classify_failure(raised(call)) == FORMAT
+
+
+def test_http_failures_are_classified_by_status():
+    assert classify_failure(LLMHTTPError(429, "slow down")) == THROTTLING
+    assert classify_failure(LLMHTTPError(503, "unavailable")) == TRANSPORT
+    assert classify_failure(ConnectionResetError()) == TRANSPORT
+
+
+def test_retry_after_is_capped_at_max_delay():
+    policy = RetryPolicy(max_delay=30.0)
+    assert policy.delay(THROTTLING, 0, retry_after=5.0) == 5.0
+    assert policy.delay(THROTTLING, 0, retry_after=3600.0) == 30.0
+    assert policy.delay(FORMAT, 0, retry_after=5.0) == 0.0
+    assert 0.0 <= policy.delay(TRANSPORT, 10) <= 30.0
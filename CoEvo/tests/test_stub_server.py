@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from coevo.core import CoEvoInterface, CoEvoSummarizer
+from coevo.core.embedding_backends import HashedNgramBackend
+from coevo.utils.llm_pool import LLMHTTPError, LLMPool
+from coevo.utils.stub_server import StubLLMServer, StubResponder
+
+REPRESENTATIONS = [
+    {"name": "Natural Language English", "definition": "Verbal descriptions of the solution."},
+    {"name": "Python Code", "definition": "Runnable python code implementation."},
+    {"name": "Mathematical Formula", "definition": "Mathematical formula or equation."},
+]
+
+
+@pytest.fixture(params=["default", "main_run"])
+def interface(request, osc1_task):
+    if request.param == "default":
+        return CoEvoInterface(osc1_task, num_idea=[3, 3])
+    return CoEvoInterface(osc1_task, num_idea=[3, 3], rep_list=REPRESENTATIONS, rep_use_name="Python Code")
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_solution_responses_parse_into_valid_code(osc1_task, interface, seed):
+    responder = StubResponder(random.Random(seed))
+    init = interface.parse_response(responder.respond(interface.get_init_prompt()), layer=0)
+    init.evaluation_res = osc1_task.evaluate(init)
+
+    assert init.evaluation_res.valid
+    assert set(init.metadata.extras["Solutions"]) == {rep["name"] for rep in interface.rep_list}
+    assert all(set(idea) == {"Name", "Reasoning", "Definition"} for idea in init.metadata.extras["Ideas"])
+
+    layer = interface.parse_response(responder.respond(interface.get_continue_prompt(1, [init])), layer=1)
+    assert osc1_task.evaluate(layer).valid
+    assert layer.metadata.extras["Ideas"]
+    for idea in layer.metadata.extras["Ideas"]:
+        assert idea["Quote"] == "the previous solution"
+        assert idea["Implication"] == "refine its terms"
+
+
+def test_summary_responses_parse_into_ideas(osc1_task, interface):
+    responder = StubResponder(random.Random(0))
+    init = interface.parse_response(responder.respond(interface.get_init_prompt()), layer=0)
+    init.evaluation_res = osc1_task.evaluate(init)
+    summarizer = CoEvoSummarizer(interface.prompt_builder, None, embedding_backend=HashedNgramBackend(dim=64))
+
+    prompt = interface.prompt_builder.get_summarizer_prompt_single([init], [])
+    ideas, success = summarizer._parse_response(responder.respond(prompt))
+    assert success and ideas
+    assert all(set(idea) == {"Reasoning", "Name", "Definition", "Example"} for idea in ideas)
+
+
+def test_server_failure_modes(interface):
+    prompt = interface.get_init_prompt()
+    server = StubLLMServer(seed=0, throttle_rate=0.5, format_error_rate=0.5, retry_after=2.5).start()
+    try:
+        llm = LLMPool(server.url, "key", "model").client("main")
+        throttled = unparsable = 0
+        for _ in range(20):
+            try:
+                response, usage = llm.get_response(prompt)
+            except LLMHTTPError as e:
+                assert (e.status, e.retry_after) == (429, 2.5)
+                throttled += 1
+                continue
+            assert usage["total_tokens"] == usage["prompt_tokens"] + usage["completion_tokens"] > 0
+            assert interface.parse_response(response).sol_string == ""
+            unparsable += 1
+    finally:
+        server.stop()
+
+    assert (throttled, unparsable) == (server.counts["throttled"], server.counts["format_error"])
+    assert throttled and unparsable and server.counts["ok"] == 0
@@ -0,0 +1,176 @@
+import threading
+import time
+
+import numpy as np
+
+from coevo.core.embedding_backends import EmbeddingBackend, HashedNgramBackend
+from coevo.core.summarizer import CoEvoSummarizer
+from coevo.utils.retry import RetryPolicy
+
+RESPONSE = (
+    "## New ideas:\n"
+    "Idea 1:\nReasoning: r\nName: Damping {i}\nDefinition: linear damping term {i}\nExample: -c*v\n\n"
+    "Idea 2:\nReasoning: r\nName: Cubic {i}\nDefinition: cubic stiffness {i}\nExample: -k*x**3\n"
+    "##"
+)
+
+
+class NonReentrantBackend(EmbeddingBackend):
+    """Hashed embeddings that fail like a fast tokenizer when entered twice."""
+
+    model_id = "non-reentrant"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.inner = HashedNgramBackend(dim=64)
+        self.active = 0
+        self.calls = 0
+
+    def _embed(self, texts):
+        self.active += 1
+        try:
+            if self.active > 1:
+                raise RuntimeError("Already borrowed")
+            self.calls += 1
+            time.sleep(0.002)
+            return self.inner._embed(texts)
+        finally:
+            self.active -= 1
+
+
+class FakePromptBuilder:
+    def get_summarizer_prompt_single(self, chain, idea_pool):
+        return "single"
+
+    def get_summarizer_prompt_offspring(self, parents, offspring, idea_pool):
+        return "offspring"
+
+
+class FakeLLM:
+    def __init__(self) -> None:
+        self.n = 0
+        self.lock = threading.Lock()
+
+    def get_response(self, prompt):
+        with self.lock:
+            self.n += 1
+            i = self.n
+        return RESPONSE.format(i=i), {}
+
+
+def make_summarizer(backend, pool_size=50):
+    return CoEvoSummarizer(
+        FakePromptBuilder(),
+        FakeLLM(),
+        pool_size=pool_size,
+        num_idea_to_return=3,
+        embedding_backend=backend,
+        retry_policy=RetryPolicy(max_retry=0),
+    )
+
+
+def test_concurrent_summaries_serialise_embedding():
+    backend = NonReentrantBackend()
+    summarizer = make_summarizer(backend)
+    errors = []
+
+    def work(k):
+        try:
+            for _ in range(5):
+                if k % 2:
+                    summarizer.summarize_indiv([])
+                else:
+                    summarizer.summarize_offspring([], [])
+                summarizer.select_inspirations([{"Name": "Damping 1", "Definition": "linear damping term 1"}])
+        except Exception as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(k,)) for k in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(summarizer.idea_pool) == 50
+    assert len(summarizer.embeddings) == 50
+    assert backend.calls > 0
+
+
+def test_pool_keeps_newest_ideas_in_order():
+    summarizer = make_summarizer(HashedNgramBackend(dim=64), pool_size=5)
+    for _ in range(4):
+        summarizer.summarize_indiv([])
+    names = [idea["Name"] for idea in summarizer.idea_pool]
+    assert names == ["Cubic 2", "Damping 3", "Cubic 3", "Damping 4", "Cubic 4"]
+    assert len(summarizer.select_inspirations()) == 3
+
+
+def test_embeddings_are_reused_from_cache():
+    from coevo.core.embedding_cache import EmbeddingCache
+
+    backend = NonReentrantBackend()
+    summarizer = make_summarizer(backend)
+    summarizer.embedding_cache = EmbeddingCache()
+    summarizer.load_summary([{"Name": "a", "Definition": "b", "Example": "c"}] * 3)
+    assert backend.calls == 1
+    summarizer.load_summary([{"Name": "a", "Definition": "b", "Example": "c"}])
+    assert backend.calls == 1
+    expected = backend.inner._embed(['{"Name": "a", "Definition": "b", "Example": "c"}'])[0]
+    assert np.allclose(summarizer.embeddings.view()[0], expected)
+
+
+def test_inference_runs_outside_the_pool_lock():
+    held = []
+
+    class ProbeBackend(HashedNgramBackend):
+        def _embed(self, texts):
+            result = []
+
+            def probe_lock():
+                acquired = summarizer._lock.acquire(blocking=False)
+                if acquired:
+                    summarizer._lock.release()
+                result.append(acquired)
+
+            probe = threading.Thread(target=probe_lock)
+            probe.start()
+            probe.join()
+            held.append(not result[0])
+            return super()._embed(texts)
+
+    summarizer = make_summarizer(ProbeBackend(dim=64))
+    summarizer.summarize_indiv([])
+    summarizer.select_inspirations([{"Name": "Cubic 1", "Definition": "cubic stiffness 1"}])
+    summarizer.load_summary(summarizer.idea_pool)
+    assert held and not any(held)
+
+
+def test_clusters_are_refit_only_when_the_pool_changes():
+    summarizer = make_summarizer(HashedNgramBackend(dim=64))
+    fits = []
+    fit_clusters = summarizer._fit_clusters
+
+    def counting_fit():
+        state = fit_clusters()
+        fits.append(len(state[0]))
+        return state
+
+    summarizer._fit_clusters = counting_fit
+    summarizer.summarize_indiv([])
+    summarizer.select_inspirations()
+    summarizer.select_inspirations([{"Name": "Cubic 1", "Definition": "cubic stiffness 1"}])
+    assert fits == [2]
+
+    summarizer.summarize_offspring([], [])
+    summarizer.select_inspirations()
+    assert fits == [2, 4]
+
+    summarizer.llm.get_response = lambda prompt: ("no ideas here", {})
+    summarizer.summarize_indiv([])
+    summarizer.select_inspirations()
+    assert fits == [2, 4]
+
+    summarizer.load_summary(summarizer.idea_pool[:3])
+    summarizer.select_inspirations()
+    assert fits == [2, 4, 3]
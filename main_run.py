@@ -8,18 +8,27 @@ Supports two modes:
 import argparse
 import json
 import os
+import random
 
+import numpy as np
 from evotoolkit.evo_method.eoh import EoH
 from evotoolkit.task.python_task import EoHPythonInterface
-from evotoolkit.tools import HttpsApi
 
 from coevo.core.coevo_interface import CoEvoInterface
 from coevo.core.coevo_method import CoEvoMethod
+from coevo.core.embedding_backends import EMBEDDING_BACKENDS, make_embedding_backend
+from coevo.core.embedding_cache import EmbeddingCache
+from coevo.core.eval_cache import EvaluationCache
+from coevo.core.eval_store import SQLiteEvaluationStore
+from coevo.core.process_evaluator import ProcessPoolEvaluator
 from coevo.core.summarizer import CoEvoSummarizer
 from coevo.tasks.bactgrow import BactGrowTask
+from coevo.tasks.fitting import OPTIMIZERS
 from coevo.tasks.oscillation_1 import Oscillation1Task
 from coevo.tasks.oscillation_2 import Oscillation2Task
 from coevo.tasks.stress_strain import StressStrainTask
+from coevo.utils.cassette import Cassette
+from coevo.utils.llm_pool import LLMPool
 
 TASK_MAP = {
     "oscillation_1": Oscillation1Task,
@@ -34,12 +43,59 @@ if __name__ == "__main__":
     parser.add_argument("--mode", type=str, default="coevo", choices=["eoh", "coevo"])
     parser.add_argument("--max_gen", type=int, default=97)
     parser.add_argument("--pop_size", type=int, default=2)
+    parser.add_argument("--num_workers", type=int, default=1)
+    parser.add_argument("--steady_state", action="store_true")
+    parser.add_argument("--max_chains", type=int, default=None)
+    parser.add_argument("--max_samples", type=int, default=None)
+    parser.add_argument("--speculative_continue", action="store_true")
+    parser.add_argument("--eval_store", type=str, default=None)
+    parser.add_argument("--eval_workers", type=int, default=0)
+    parser.add_argument("--eval_memory_mb", type=int, default=None)
+    parser.add_argument("--cassette", type=str, default=None)
+    parser.add_argument("--cassette_mode", type=str, default="replay", choices=["record", "replay"])
+    parser.add_argument("--cassette_fallback", action="store_true")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--optimizer", type=str, default=None, choices=list(OPTIMIZERS))
+    parser.add_argument("--racing", action="store_true")
+    parser.add_argument("--early_cutoff", action="store_true")
+    parser.add_argument("--warm_start", action="store_true")
+    parser.add_argument("--n_starts", type=int, default=1)
+    parser.add_argument("--no_prescreen", action="store_true")
+    parser.add_argument(
+        "--fingerprint",
+        action="store_true",
+        help=(
+            "reuse the fit of an earlier candidate whose equation gives the same outputs on a fixed probe "
+            "(if its params give the same MSE, else start the fit from them); runs candidates in this "
+            "process, so it cannot be combined with --eval_workers"
+        ),
+    )
+    parser.add_argument("--embedding_cache", type=str, default=None)
+    parser.add_argument("--embedding_backend", type=str, default="hf", choices=EMBEDDING_BACKENDS)
+    parser.add_argument("--embedding_model", type=str, default="openai-community/gpt2")
+    parser.add_argument("--gradient", type=str, default=None, choices=["auto", "stack", "threads", "complex"])
     args = parser.parse_args()
+    if args.fingerprint and args.eval_workers > 0:
+        parser.error("--fingerprint runs candidates in this process; it cannot be combined with --eval_workers")
+
+    # Parent and inspiration sampling draw from the global generators
+    if args.seed is not None:
+        random.seed(args.seed)
+        np.random.seed(args.seed)
 
     task_cls = TASK_MAP[args.task]
     # Resolve data path relative to this script's location
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    task = task_cls(dataset_dir=os.path.join(script_dir, "data", args.task, "train.csv"))
+    task = task_cls(
+        dataset_dir=os.path.join(script_dir, "data", args.task, "train.csv"),
+        optimizer=args.optimizer,
+        gradient=args.gradient,
+        racing=args.racing,
+        early_cutoff=args.early_cutoff,
+        warm_start=args.warm_start,
+        n_starts=args.n_starts,
+        prescreen=not args.no_prescreen,
+    )
 
     # Load LLM config from model_config.json, fall back to env vars
     config_path = os.path.join(script_dir, "model_config.json")
@@ -50,19 +106,41 @@ if __name__ == "__main__":
         api_key = model_config["key"]
         api_model = model_config["model"]
         api_timeout = model_config.get("timeout", 120)
+        api_max_concurrency = model_config.get("max_concurrency", 8)
+        api_rpm = model_config.get("rpm")
+        api_tpm = model_config.get("tpm")
     else:
         api_url = os.getenv("API_URL", "https://api.openai.com/v1/chat/completions")
         api_key = os.getenv("API_KEY", "")
         api_model = os.getenv("MODEL", "gpt-4o")
         api_timeout = int(os.getenv("API_TIMEOUT", "120"))
+        api_max_concurrency = int(os.getenv("API_MAX_CONCURRENCY", "8"))
+        api_rpm = float(os.getenv("API_RPM")) if os.getenv("API_RPM") else None
+        api_tpm = float(os.getenv("API_TPM")) if os.getenv("API_TPM") else None
 
-    llm = HttpsApi(
+    # One pool shared by the main and summarizer roles: connections, rate
+    # limits and the concurrency budget are common to both.
+    llm_pool = LLMPool(
         api_url=api_url,
         key=api_key,
         model=api_model,
         timeout=api_timeout,
+        max_concurrency=api_max_concurrency,
+        rpm=api_rpm,
+        tpm=api_tpm,
     )
+    llm = llm_pool.client("main")
 
+    # Record every LLM call to, or serve it offline from, a cassette file
+    cassette = (
+        Cassette(args.cassette, args.cassette_mode, strict=not args.cassette_fallback, seed=args.seed)
+        if args.cassette
+        else None
+    )
+    if cassette is not None:
+        llm = cassette.client("main", llm)
+
+    evaluator = None
     if args.mode == "eoh":
         interface = EoHPythonInterface(task)
         method = EoH(
@@ -84,13 +162,10 @@ if __name__ == "__main__":
             rep_use_name="Python Code",
         )
 
-        # Second LLM instance for summarizer (v1 used two separate LLM instances)
-        summarizer_llm = HttpsApi(
-            api_url=api_url,
-            key=api_key,
-            model=api_model,
-            timeout=api_timeout,
-        )
+        # Separate summarizer role on the shared pool (v1 used two separate LLM instances)
+        summarizer_llm = llm_pool.client("summarizer")
+        if cassette is not None:
+            summarizer_llm = cassette.client("summarizer", summarizer_llm)
 
         summarizer = CoEvoSummarizer(
             prompt_builder=interface.prompt_builder,
@@ -98,9 +173,14 @@ if __name__ == "__main__":
             pool_size=100,
             num_idea_to_return=5,
             cluster_summary=True,
-            tokenizer_path="openai-community/gpt2",
+            embedding_backend=make_embedding_backend(args.embedding_backend, args.embedding_model),
+            embedding_cache=EmbeddingCache(args.embedding_cache),
         )
 
+        # Sandboxed evaluation in worker processes (0 = evaluate in-process)
+        if args.eval_workers > 0:
+            evaluator = ProcessPoolEvaluator(task, args.eval_workers, memory_limit_mb=args.eval_memory_mb)
+
         method = CoEvoMethod(
             interface=interface,
             running_llm=llm,
@@ -110,9 +190,22 @@ if __name__ == "__main__":
             num_init_per_gen=6,
             use_summarizer=True,
             summarizer=summarizer,
+            num_workers=args.num_workers,
+            steady_state=args.steady_state,
+            max_chains=args.max_chains,
+            max_samples=args.max_samples,
+            speculative_continue=args.speculative_continue,
+            eval_cache=EvaluationCache(),
+            eval_store=SQLiteEvaluationStore(args.eval_store) if args.eval_store else None,
+            evaluator=evaluator,
+            fingerprint_cache=EvaluationCache() if args.fingerprint else None,
         )
 
-    best = method.run()
+    try:
+        best = method.run()
+    finally:
+        if evaluator is not None:
+            evaluator.close()
     if best is not None and best.evaluation_res is not None:
         print(f"Best solution score: {best.evaluation_res.score}")
     else: